@@ -0,0 +1,37 @@
+"""
+Per-call Python overhead of the module wrappers, without any network I/O.
+
+The client is given a transport that answers immediately, so the timings
+only cover what pyqlc does around a request.
+
+    $ python benchmarks/bench_client_overhead.py
+"""
+import timeit
+
+from pyqlc.client import Client
+
+URI = "http://bench.invalid"
+ADDRESS = "qlc_3xc5fbrqck6mrxrrx7hjnqf6jgyqsnkeg39k5mjw44m8aj3f1zdfh7cw8kzz"
+
+
+class NullTransport:
+    def post(self, payload):
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": None}
+
+
+def main(number=100000):
+    transport = NullTransport()
+    qlc = Client(URI, transport=transport)
+
+    timings = {
+        "Client(URI)": lambda: Client(URI, transport=transport),
+        "Ledger.accountInfo": lambda: qlc.Ledger.accountInfo(ADDRESS),
+        "Pov.getHeaderByHash": lambda: qlc.Pov.getHeaderByHash("00" * 32),
+    }
+    for name, fn in timings.items():
+        best = min(timeit.repeat(fn, number=number, repeat=5))
+        print("{:<22} {:8.2f} us/call".format(name, best / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
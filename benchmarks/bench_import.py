@@ -0,0 +1,54 @@
+"""
+Wall time of ``import pyqlc.client`` in a fresh interpreter, checked
+against a budget.
+
+Every run starts a new Python process, so nothing is shared between runs
+but the OS file cache. The median is compared to the budget and the script
+exits with status 1 when it is exceeded.
+
+    $ python benchmarks/bench_import.py
+    $ python benchmarks/bench_import.py --budget 0.2 --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+# seconds; the PoW CPU probe alone used to take longer than this
+DEFAULT_BUDGET = 0.25
+
+SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def measure(module="pyqlc.client", runs=10):
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(module=module)],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True)
+        timings.append(float(out.stdout))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="pyqlc.client")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="maximum median import time in seconds")
+    args = parser.parse_args()
+
+    timings = measure(args.module, args.runs)
+    median = statistics.median(timings)
+    print("import {:<20} median {:7.1f} ms  min {:7.1f} ms  max {:7.1f} ms  budget {:7.1f} ms".format(
+        args.module, median * 1e3, min(timings) * 1e3, max(timings) * 1e3, args.budget * 1e3))
+    if median > args.budget:
+        print("over budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Signatures per second: building a SigningKey per signature, as crypto.sign
+did before signers were cached, against crypto.sign with its signer cache
+and a Signer held by the caller.
+
+    $ python benchmarks/bench_sign.py
+    $ python benchmarks/bench_sign.py --keys 1000 --signatures 2000
+"""
+import argparse
+import os
+import time
+from binascii import hexlify, unhexlify
+
+from ed25519_blake2b import SigningKey
+
+from pyqlc.utils.crypto import Signer, sign
+
+
+def uncached_sign(message, private_key):
+    sk = SigningKey(unhexlify(private_key[:64]))
+    return hexlify(sk.sign(msg=unhexlify(message))).decode()
+
+
+def rate(fn, calls):
+    start = time.perf_counter()
+    for message, private_key in calls:
+        fn(message, private_key)
+    return len(calls) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=10,
+                        help="distinct private keys, fewer than the cache size keeps them all cached")
+    parser.add_argument("--signatures", type=int, default=2000)
+    args = parser.parse_args()
+
+    keys = [os.urandom(32).hex() for _ in range(args.keys)]
+    calls = [(os.urandom(32).hex(), keys[i % len(keys)]) for i in range(args.signatures)]
+    for message, private_key in calls[:len(keys)]:
+        if sign(message, private_key) != uncached_sign(message, private_key):
+            raise AssertionError("cached and uncached signatures differ")
+
+    signers = {k: Signer(k) for k in keys}
+    base = rate(uncached_sign, calls)
+    cached = rate(sign, calls)
+    held = rate(lambda message, private_key: signers[private_key].sign(message), calls)
+    print("SigningKey per call  {:8.0f} signatures/s".format(base))
+    print("crypto.sign cached   {:8.0f} signatures/s  x{:4.2f}".format(cached, cached / base))
+    print("Signer               {:8.0f} signatures/s  x{:4.2f}".format(held, held / base))
+
+
+if __name__ == "__main__":
+    main()
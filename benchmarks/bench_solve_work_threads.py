@@ -0,0 +1,47 @@
+"""
+Scaling of the multi-threaded PoW solver with the number of threads.
+
+Each thread count solves the same random block hashes; the hash rate is
+estimated as expected hashes per solution (2^64 / (2^64 - difficulty))
+divided by the mean solve time, so a few runs are needed for it to settle.
+
+    $ python benchmarks/bench_solve_work_threads.py
+    $ python benchmarks/bench_solve_work_threads.py --threads 1 2 4 8 16 32 --runs 20
+"""
+import argparse
+import os
+import time
+
+from pyqlc.utils.work import WORKTRESHOLD, parse_difficulty, solve_work, validate_work
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default_threads = sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=default_threads)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--difficulty", default=WORKTRESHOLD)
+    args = parser.parse_args()
+
+    expected = (1 << 64) / ((1 << 64) - parse_difficulty(args.difficulty))
+    hashes = [os.urandom(32).hex() for _ in range(args.runs)]
+    # select the backend before timing
+    solve_work(hashes[0], "0000000000000000")
+
+    base = None
+    for threads in args.threads:
+        start = time.perf_counter()
+        for block_hash in hashes:
+            validate_work(block_hash, solve_work(block_hash, args.difficulty, threads=threads), args.difficulty)
+        mean = (time.perf_counter() - start) / args.runs
+
+        rate = expected / mean
+        base = base or rate
+        print("{:>3} threads  {:8.3f} s/solve  {:12.0f} hashes/s  x{:5.2f}".format(
+            threads, mean, rate, rate / base))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Addresses validated per second on lists mixing valid and invalid addresses:
+validate_qlc_address as it was before the fast path (loaded from git, by
+default from the first commit) against crypto.validate_qlc_address and the
+bulk crypto.public_keys_from_addresses bitmap.
+
+Invalid addresses are spread evenly over a bad checksum, a character outside
+the alphabet, a wrong length and a wrong prefix.
+
+    $ python benchmarks/bench_validate_address.py
+    $ python benchmarks/bench_validate_address.py --addresses 100000 --valid 0 0.5 1 --baseline <rev>
+"""
+import argparse
+import importlib.util
+import os
+import random
+import subprocess
+import tempfile
+import time
+
+from pyqlc.utils.crypto import addresses_from_public_keys, public_keys_from_addresses, validate_qlc_address
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git(*args):
+    return subprocess.check_output(("git",) + args, cwd=ROOT)
+
+
+def load_baseline(rev):
+    """
+    Return validate_qlc_address from pyqlc/utils/crypto.py at `rev`, run
+    unchanged against the current package for its relative imports
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "crypto.py")
+        with open(path, "wb") as f:
+            f.write(git("show", rev + ":pyqlc/utils/crypto.py"))
+        spec = importlib.util.spec_from_file_location("pyqlc.utils._baseline_crypto", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module.validate_qlc_address
+
+
+def corrupt(address, kind):
+    if kind == 0:
+        return address[:-1] + ("1" if address[-1] != "1" else "3")
+    if kind == 1:
+        return address[:30] + "0" + address[31:]
+    if kind == 2:
+        return address[:-2]
+    return "xrb" + address[3:]
+
+
+def mixed(count, valid):
+    addresses = addresses_from_public_keys(os.urandom(32 * count))
+    for i in random.sample(range(count), int(count * (1 - valid))):
+        addresses[i] = corrupt(addresses[i], i % 4)
+    return addresses
+
+
+def rate(fn, addresses):
+    start = time.perf_counter()
+    fn(addresses)
+    return len(addresses) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--addresses", type=int, default=2000)
+    parser.add_argument("--valid", type=float, nargs="+", default=[0.0, 0.5, 0.9, 1.0],
+                        help="fractions of valid addresses")
+    parser.add_argument("--baseline", default=None,
+                        help="git revision of the previous validator, default is the first commit")
+    args = parser.parse_args()
+
+    rev = args.baseline or git("rev-list", "--max-parents=0", "HEAD").split()[-1].decode()
+    baseline = load_baseline(rev)
+
+    for valid in args.valid:
+        addresses = mixed(args.addresses, valid)
+        # the previous validator never checked the prefix, so it accepts
+        # the "xrb_" addresses; everything else must be judged the same
+        for a in addresses:
+            if baseline(a) != validate_qlc_address(a) and a.startswith("qlc_"):
+                raise AssertionError("validate_qlc_address disagrees with the previous validator on " + a)
+
+        base = rate(lambda items: [baseline(a) for a in items], addresses)
+        fast = rate(lambda items: [validate_qlc_address(a) for a in items], addresses)
+        bulk = rate(public_keys_from_addresses, addresses)
+        print("{:4.0%} valid  previous {:9.0f}/s  validate_qlc_address {:9.0f}/s x{:5.2f}"
+              "  public_keys_from_addresses {:9.0f}/s x{:5.2f}".format(
+                  valid, base, fast, fast / base, bulk, bulk / base))
+
+
+if __name__ == "__main__":
+    main()
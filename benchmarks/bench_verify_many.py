@@ -0,0 +1,48 @@
+"""
+Signatures verified per second: crypto.verify_signature one at a time
+against crypto.verify_many in this process and across worker processes.
+
+    $ python benchmarks/bench_verify_many.py
+    $ python benchmarks/bench_verify_many.py --signatures 20000 --processes 1 4 16
+"""
+import argparse
+import os
+import time
+
+from pyqlc.utils.crypto import private_to_public_key, sign, verify_many, verify_signature
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--signatures", type=int, default=4000)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--processes", type=int, nargs="+", default=sorted({1, cpus}))
+    args = parser.parse_args()
+
+    keys = [os.urandom(32).hex() for _ in range(args.keys)]
+    public_keys = [private_to_public_key(k) for k in keys]
+    messages = [os.urandom(32).hex() for _ in range(args.signatures)]
+    signatures = [sign(m, keys[i % len(keys)]) for i, m in enumerate(messages)]
+    owners = [public_keys[i % len(keys)] for i in range(args.signatures)]
+
+    start = time.perf_counter()
+    for m, s, pk in zip(messages, signatures, owners):
+        verify_signature(m, s, pk)
+    base = args.signatures / (time.perf_counter() - start)
+    print("verify_signature            {:8.0f} signatures/s".format(base))
+
+    buffers = [bytes.fromhex("".join(items)) for items in (messages, signatures, owners)]
+    for processes in args.processes:
+        verify_many(*buffers, processes=processes)  # start the pool before timing
+        start = time.perf_counter()
+        bitmap = verify_many(*buffers, processes=processes)
+        rate = args.signatures / (time.perf_counter() - start)
+        if any(bitmap[i >> 3] >> (i & 7) & 1 == 0 for i in range(args.signatures)):
+            raise AssertionError("verify_many rejected a valid signature")
+        print("verify_many {:>3} processes  {:8.0f} signatures/s  x{:4.2f}".format(
+            processes, rate, rate / base))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Hashes per second of each compiled PoW extension, comparing the
+single-compression kernel (do_work) with the generic BLAKE2b API
+(do_work_blake2).
+
+The threshold can't be met, so every call runs a full chunk of 250000
+nonces. Before timing, every backend is checked to return exactly the
+nonces _work_ref returns.
+
+    $ python benchmarks/bench_work_kernel.py
+"""
+import importlib
+import os
+import time
+
+BACKENDS = ("avx512f", "avx2", "avx", "sse4_1", "ssse3", "sse2", "neon", "ref")
+CHUNK = 250000
+
+
+def rate(fn, block_hash, repeat=5, number=4):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(number):
+            fn(block_hash, i * CHUNK, 0xffffffffffffffff)
+        best = min(best, time.perf_counter() - start)
+    return number * CHUNK / best
+
+
+def verify(module, reference, runs=200):
+    # low thresholds put the matching nonce at every lane position
+    for i in range(runs):
+        block_hash = os.urandom(32)
+        nonce = int.from_bytes(os.urandom(8), "little")
+        threshold = (0xfff0000000000000, 0xc000000000000000, 0xffffffffffffffff)[i % 3]
+        for fn in ("do_work", "do_work_blake2"):
+            expected = reference.do_work(block_hash, nonce, threshold)
+            got = getattr(module, fn)(block_hash, nonce, threshold)
+            if got != expected:
+                raise AssertionError("{}.{}({}, {}, {:x}) returned {}, _work_ref {}".format(
+                    module.__name__, fn, block_hash.hex(), nonce, threshold, got, expected))
+    hashes = os.urandom(32 * 16)
+    if module.do_work_batch(hashes, 0, 0xff00000000000000) != \
+            reference.do_work_batch(hashes, 0, 0xff00000000000000):
+        raise AssertionError("{}.do_work_batch differs from _work_ref".format(module.__name__))
+
+
+def main():
+    reference = importlib.import_module("pyqlc._work_ref")
+    block_hash = os.urandom(32)
+    for backend in BACKENDS:
+        try:
+            module = importlib.import_module("pyqlc._work_{}".format(backend))
+        except ImportError:
+            continue
+        verify(module, reference)
+        kernel = rate(module.do_work, block_hash)
+        generic = rate(module.do_work_blake2, block_hash)
+        print("{:<7} kernel {:10.0f} hashes/s  blake2b API {:10.0f} hashes/s  x{:4.2f}".format(
+            backend, kernel, generic, kernel / generic))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import secrets
-from . import client
 from .utils.crypto import (
     private_to_public_key,
     generate_private_key,
@@ -7,11 +6,12 @@ from .utils.crypto import (
     address_to_public_key,
     validate_qlc_address
 )
+from .utils.helper import as_client
 
 
 class Account:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def create(self, seed: str = None, index: int = 0, local: bool = True):
         """
@@ -45,7 +45,7 @@ class Account:
 
         else:
             params = [seed, index]
-            account = client.Client(self.URI).post("account_create", params)
+            account = self.client.post("account_create", params)
             account["address"] = self.forPublicKey(
                 account["pubKey"], local=False
                 )
@@ -67,7 +67,7 @@ class Account:
         if local:
             return secrets.token_hex(32)
         else:
-            return client.Client(self.URI).post("account_newSeed")
+            return self.client.post("account_newSeed")
 
     def newAccounts(self, num: int = 10, local: bool = True) -> list:
         """
@@ -93,7 +93,7 @@ class Account:
                 accounts.append(account)
             return accounts
         else:
-            return client.Client(self.URI).post("account_newAccounts", [num])
+            return self.client.post("account_newAccounts", [num])
 
     def forPublicKey(self, public_key: str, local: bool = True) -> str:
         """
@@ -111,7 +111,7 @@ class Account:
             address = public_key_to_address(public_key)
             return address
         else:
-            return client.Client(self.URI).post(
+            return self.client.post(
                 "account_forPublicKey", [public_key]
             )
 
@@ -130,7 +130,7 @@ class Account:
             pk = address_to_public_key(address)
             return pk
         else:
-            pk = client.Client(self.URI).post("account_publicKey", [address])
+            pk = self.client.post("account_publicKey", [address])
             return pk.encode()
 
     def validate(self, address: str, local: bool = True) -> bool:
@@ -147,6 +147,6 @@ class Account:
         if local:
             return validate_qlc_address(address)
         else:
-            return client.Client(self.URI).post(
+            return self.client.post(
                 "account_validate", [address]
             )
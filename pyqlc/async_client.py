@@ -0,0 +1,243 @@
+import asyncio
+
+from .account import Account
+from .cache import MISS, ResponseCache
+from .ledger import Ledger
+from .rpc import Facades, Batch, RequestIds, match_responses, request, _Module
+from .singleflight import AsyncSingleFlight
+from .work_cache import WorkCache
+from .transport import AsyncHTTPTransport, WebSocketTransport, DEFAULT_ASYNC_POOL_MAXSIZE
+
+
+class AsyncAccount(Account):
+    """
+    :class:`pyqlc.account.Account` for :class:`AsyncClient`
+
+    Calls with ``local=True`` are computed in place and return their value
+    directly, remote ones return an awaitable.
+    """
+    def create(self, seed : str = None, index : int = 0, local : bool = True):
+        if local:
+            return super().create(seed=seed, index=index, local=True)
+        return self._create(seed, index)
+
+    async def _create(self, seed, index):
+        if seed is None:
+            seed = await self.newSeed(local=False)
+        account = await self.client.post("account_create", [seed, index])
+        account["address"] = await self.forPublicKey(account["pubKey"], local=False)
+        return account
+
+    def publicKey(self, address : str, local : bool = True):
+        if local:
+            return super().publicKey(address, local=True)
+        return self._publicKey(address)
+
+    async def _publicKey(self, address):
+        pk = await self.client.post("account_publicKey", [address])
+        return pk.encode()
+
+
+class AsyncLedger(Ledger):
+    """
+    :class:`pyqlc.ledger.Ledger` for :class:`AsyncClient`
+
+    The `generate*Block` helpers sign the block and solve its work in the
+    loop's default executor, so the event loop stays responsive.
+    """
+    async def generateSendBlock(
+        self,
+        From : str,
+        to : str,
+        tokenName : str,
+        amount : str,
+        sender : str = None,
+        receiver : str = None,
+        message : str = None,
+        privKey : str = None,
+        **kwargs):
+        params, privKey = self._send_block_params(
+            From, to, tokenName, amount, sender, receiver, message, privKey, kwargs)
+        new_block = await self.client.post("ledger_generateSendBlock", [params])
+        return await self._finish(new_block, privKey)
+
+    async def generateReceiveBlock(self, privKey : str = None, **block):
+        if privKey is None:
+            raise Exception("Private Key is required for creating signatures localy")
+
+        rec_block = await self.client.post("ledger_generateReceiveBlock", [block])
+        return await self._finish(rec_block, privKey)
+
+    async def generateChangeBlock(self, account_address : str, new_representative_account : str, privKey : str = None):
+        params = [account_address, new_representative_account, privKey]
+        chng_block = await self.client.post("ledger_generateChangeBlock", [params])
+        return await self._finish(chng_block, privKey)
+
+    async def process(self, **block) -> str:
+        result = await self.client.post("ledger_process", [block])
+        self._precompute_next(result)
+        return result
+
+    async def _finish(self, block, privKey):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self._sign_and_solve, block, privKey, self._work_cache())
+
+
+class AsyncBatch(Batch):
+    """
+    :class:`pyqlc.rpc.Batch` for :class:`AsyncClient`, sent when the
+    ``async with`` block exits or by awaiting :meth:`send`
+    """
+    async def send(self) -> list:
+        calls, self._calls = self._calls, []
+        if not calls:
+            return self.results
+
+        payloads = [payload for payload, _ in calls]
+        return self._resolve(calls, match_responses(payloads, await self.client.transport.post(payloads)))
+
+    def __enter__(self):
+        raise TypeError("use 'async with' with an AsyncBatch")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.send()
+
+
+class AsyncClient(Facades):
+    """
+    asyncio QLC node RPC client
+
+    Exposes the same module facades as :class:`pyqlc.client.Client`
+    (`Ledger`, `Pov`, `Account`, ...), whose remote calls return awaitables.
+    All requests share one non-blocking connection pool, so thousands of
+    calls can be in flight on one event loop.
+
+    >>> async with AsyncClient("http://127.0.0.1:9735") as qlc:
+    ...     info = await qlc.Ledger.accountInfo(address)
+
+    With `WS` set, node events can be subscribed to through `Pub_Sub`:
+
+    >>> async for block in await qlc.Pub_Sub.newAccountBlock(address):
+    ...     print(block)
+
+    Without `URI`, RPC calls are multiplexed over the same websocket as the
+    subscriptions.
+
+    Parameters
+    ----------
+    URI : str
+        node RPC endpoint
+    WS : str
+        node websocket endpoint
+    pool_maxsize : int
+        optional , maximum number of connections to the node, default is 100
+    transport
+        optional , object with an awaitable ``post(payload)`` method to use
+        instead of an :class:`pyqlc.transport.AsyncHTTPTransport`
+    cache : ResponseCache or bool
+        optional , response cache to use, ``True`` for one with the default
+        policies, default is no caching
+    single_flight : bool
+        optional , share responses among identical concurrent calls, default is False
+    work_cache : WorkCache or bool
+        optional , pre-computed work for the `Ledger.generate*Block` helpers,
+        ``True`` for one with the default settings, see :class:`pyqlc.client.Client`
+    """
+    Account = _Module(AsyncAccount)
+    Ledger = _Module(AsyncLedger)
+
+    def __init__(
+        self,
+        URI : str = None,
+        WS : str = None,
+        pool_maxsize : int = DEFAULT_ASYNC_POOL_MAXSIZE,
+        transport = None,
+        cache = None,
+        single_flight : bool = False,
+        work_cache = None):
+        self.URI = URI
+        self.WS = WS
+        self.ids = RequestIds()
+        if cache is True:
+            cache = ResponseCache()
+        self.cache = cache if cache is not False else None
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        if work_cache is True:
+            work_cache = WorkCache()
+        self.work_cache = work_cache if work_cache is not False else None
+        self._websocket = None
+        if transport is None:
+            if URI is None and WS is not None:
+                transport = self.websocket
+            else:
+                transport = AsyncHTTPTransport(URI, pool_maxsize=pool_maxsize)
+        self.transport = transport
+
+    @property
+    def websocket(self) -> WebSocketTransport:
+        """
+        The :class:`pyqlc.transport.WebSocketTransport` to `WS`, created on
+        first access
+        """
+        if self._websocket is None:
+            if self.WS is None:
+                raise ValueError("AsyncClient has no websocket endpoint (WS)")
+            self._websocket = WebSocketTransport(self.WS, ids=self.ids)
+        return self._websocket
+
+    async def post(self, method : str, params : list = None):
+        if self.cache is not None:
+            result = self.cache.get(method, params)
+            if result is not MISS:
+                return result
+
+        if self.single_flight is not None:
+            r = await self.single_flight.call(method, params, lambda: self._send(method, params))
+        else:
+            r = await self._send(method, params)
+        try :
+            result = r["result"]
+        except:
+            return r["error"]
+        if self.cache is not None:
+            self.cache.put(method, params, result)
+        return result
+
+    async def _send(self, method : str, params : list = None) -> dict:
+        return await self.transport.post(request(method, params, next(self.ids)))
+
+    async def subscribe(self, namespace : str, event : str, params : list = None, callback=None, **options):
+        """
+        Subscribe to `event` of the node's `namespace` API over the `WS`
+        connection and return the :class:`pyqlc.transport.Subscription`
+        """
+        return await self.websocket.subscribe(namespace, event, params, callback=callback, **options)
+
+    def batch(self) -> AsyncBatch:
+        """
+        Return an :class:`AsyncBatch` that sends the calls made through its
+        module facades as one JSON-RPC batch request
+        """
+        return AsyncBatch(self)
+
+    async def close(self):
+        """
+        Close the connection pool and the websocket connection, and stop the
+        work cache
+        """
+        if self.work_cache is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self.work_cache.close)
+        await self.transport.close()
+        if self._websocket is not None and self._websocket is not self.transport:
+            await self._websocket.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
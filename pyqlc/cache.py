@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+FOREVER = "forever"
+POV_HEIGHT = "pov_height"
+
+MISS = object()
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Responses which never change once they exist are kept until evicted,
+# PoV lookups by height until the PoV chain grows, lists for a minute.
+DEFAULT_POLICIES = {
+    "ledger_blocksInfo": FOREVER,
+    "ledger_tokenInfoById": FOREVER,
+    "contract_getAbiByContractAddress": FOREVER,
+    "pov_getHeaderByHash": FOREVER,
+    "pov_getBlockByHash": FOREVER,
+    "pov_getTransaction": FOREVER,
+    "pov_getTransactionByBlockHashAndIndex": FOREVER,
+    "pov_getHeaderByHeight": POV_HEIGHT,
+    "pov_getBlockByHeight": POV_HEIGHT,
+    "pov_getTransactionByBlockHeightAndIndex": POV_HEIGHT,
+    "ledger_tokenInfoByName": 60,
+    "ledger_tokens": 60,
+    "contract_contractAddressList": 60,
+}
+
+_POV_HEADER_METHODS = ("pov_getLatestHeader", "pov_getFittestHeader")
+
+
+class ResponseCache:
+    """
+    LRU cache of RPC results with a policy per method
+
+    A policy is :data:`FOREVER` (kept until evicted), a number of seconds
+    to keep the result, or :data:`POV_HEIGHT` (dropped once a higher PoV
+    height is seen). Methods without a policy are never cached, and
+    neither are errors and empty results.
+
+    Results are stored as JSON, so callers always get their own copy, and
+    their JSON size counts against `max_bytes`; the least recently used
+    entries are evicted beyond it. The PoV height is taken from every
+    `pov_getLatestHeader` / `pov_getFittestHeader` result that passes
+    through :meth:`put`, or set with :meth:`set_pov_height`.
+
+    Parameters
+    ----------
+    policies : dict
+        optional , method name to policy, default is :data:`DEFAULT_POLICIES`
+    max_bytes : int
+        optional , upper bound for the size of the cached results
+    """
+    def __init__(self, policies : dict = None, max_bytes : int = DEFAULT_MAX_BYTES):
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.pov_height = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, method : str, params):
+        """
+        Return the cache key for a call, or ``None`` if `method` isn't cached
+        """
+        if method not in self.policies:
+            return None
+        return method + json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    def get(self, method : str, params):
+        """
+        Return the cached result for a call, or :data:`MISS`
+        """
+        key = self.key(method, params)
+        if key is None:
+            return MISS
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                data, expires, height = entry
+                if (expires is None or expires > time.monotonic()) and \
+                        (height is None or height == self.pov_height):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(data)
+                self._remove(key)
+            self.misses += 1
+            return MISS
+
+    def put(self, method : str, params, result):
+        """
+        Store the result of a successful call if `method` has a policy
+        """
+        if method in _POV_HEADER_METHODS:
+            self._observe_header(result)
+
+        key = self.key(method, params)
+        if key is None or result is None or result == [] or result == {}:
+            # an empty answer may just mean the object doesn't exist yet
+            return
+
+        policy = self.policies[method]
+        data = json.dumps(result, separators=(",", ":"))
+        expires = height = None
+        if policy == POV_HEIGHT:
+            height = self.pov_height
+        elif policy != FOREVER:
+            expires = time.monotonic() + policy
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, expires, height)
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def set_pov_height(self, height : int):
+        """
+        Record the latest PoV height, invalidating :data:`POV_HEIGHT` entries
+        stored at a lower one
+        """
+        with self._lock:
+            if height > self.pov_height:
+                self.pov_height = height
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _observe_header(self, header):
+        try:
+            height = int(header["basHdr"]["height"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self.set_pov_height(height)
+
+    def _remove(self, key):
+        data, _, _ = self._entries.pop(key)
+        self.size -= len(data)
@@ -1,62 +1,184 @@
-import requests
-from random import randint
-from . import (
-    account,
-    ledger,
-    contract,
-    mintage,
-    rewards,
-    net,
-    pov,
-#    pledge,
-    destroy,
-    miner,
-    representation,
-#    pub_sub,
-    dpki,
-    settlement,
-    permission,
-    ptmkey,
-    kyc,
-    util
-#    dodsettlement
-)
-
-class Client:
-    def __init__(self, URI : str = None, WS : str = None):
+import asyncio
+import threading
+
+from .transport import WebSocketTransport, get_transport
+from .rpc import Facades, Batch, InflightTable, RequestIds, request
+from .coalescer import Coalescer, DEFAULT_WINDOW, DEFAULT_MAX_SIZE
+from .cache import MISS, ResponseCache
+from .singleflight import SingleFlight
+from .work_cache import WorkCache
+
+
+class Client(Facades):
+    """
+    QLC node RPC client
+
+    Every client for the same `URI` shares one pooled keep-alive transport,
+    see :func:`pyqlc.transport.get_transport`. Module facades (`Ledger`,
+    `Pov`, ...) are created on first access and send their requests through
+    this client.
+
+    Node events can be subscribed to through `Pub_Sub` when `WS` is set.
+
+    With `cache` set, results of immutable and slow-changing calls are
+    served from a :class:`pyqlc.cache.ResponseCache`. With `single_flight`
+    set, identical calls made while one of them is in flight share its
+    response, see :class:`pyqlc.singleflight.SingleFlight`. With
+    `work_cache` set, the work of the next block of every account whose
+    block goes through `Ledger.process` is solved in the background and
+    used by the `Ledger.generate*Block` helpers, see
+    :class:`pyqlc.work_cache.WorkCache`.
+
+    Request ids come from a per-client monotonic counter, so they never
+    collide among concurrent requests. Several calls can be sent in one HTTP
+    request with :meth:`batch`. With
+    `coalesce` set, calls made from many threads within `coalesce_window`
+    seconds are merged into batch requests automatically, see
+    :class:`pyqlc.coalescer.Coalescer`.
+
+    Parameters
+    ----------
+    URI : str
+        node RPC endpoint
+    WS : str
+        node websocket endpoint
+    pool_maxsize : int
+        optional , maximum number of keep-alive connections to the node,
+        raises ValueError if the shared pool for `URI` was created with
+        another size
+    warm_up : int
+        optional , number of connections to open right away, default is 0
+    transport
+        optional , object with a ``post(payload)`` method to use instead of
+        the shared transport for `URI`
+    coalesce : bool
+        optional , merge concurrent calls into batch requests, default is False
+    coalesce_window : float
+        optional , seconds a call waits for others to join its batch, default is 2 ms
+    coalesce_max_size : int
+        optional , maximum number of calls per merged batch, default is 100
+    cache : ResponseCache or bool
+        optional , response cache to use, ``True`` for one with the default
+        policies, default is no caching
+    single_flight : bool
+        optional , share responses among identical concurrent calls, default is False
+    work_cache : WorkCache or bool
+        optional , pre-computed work to use, ``True`` for one with the
+        default settings, default is solving work when it's needed
+    """
+    def __init__(
+        self,
+        URI : str = None,
+        WS : str = None,
+        pool_maxsize : int = None,
+        warm_up : int = 0,
+        transport = None,
+        coalesce : bool = False,
+        coalesce_window : float = DEFAULT_WINDOW,
+        coalesce_max_size : int = DEFAULT_MAX_SIZE,
+        cache = None,
+        single_flight : bool = False,
+        work_cache = None):
         self.URI = URI 
         self.WS = WS
-        self.Account = account.Account(URI)
-        self.Ledger = ledger.Ledger(URI)
-        self.Contract = contract.Contract(URI)
-        self.Mintage = mintage.Mintage(URI)
-        self.Rewards = rewards.Rewards(URI)
-        self.Net = net.Net(URI)
-        self.Pov = pov.Pov(URI)
-#        self.Pledge = pledge.Pledge(URI)
-        self.Destroy = destroy.Destroy(URI)
-        self.Miner = miner.Miner(URI)
-        self.Representation = representation.Representation(URI)
-#        self.Pub_Sub = pub_sub.Pub_Sub(WS)
-        self.DPKI = dpki.DPKI(URI)
-        self.Settlement = settlement.Settlement(URI)
-        self.Permissiom = permission.Permission(URI)
-        self.Ptmkey = ptmkey.Ptmkey(URI)
-        self.Kyc = kyc.Kyc(URI)
-        self.Util = util.Util(URI)
-#        self.DoDSettlement = dodsettlement.DoDSettlement(URI)
+        if transport is None:
+            transport = get_transport(URI, pool_maxsize)
+        self.transport = transport
+        if warm_up:
+            self.transport.warm_up(warm_up)
+        self.ids = RequestIds()
+        self.inflight = InflightTable()
+        self._ws = None
+        self._ws_loop = None
+        self._ws_lock = threading.Lock()
+        if cache is True:
+            cache = ResponseCache()
+        self.cache = cache if cache is not False else None
+        self.single_flight = SingleFlight() if single_flight else None
+        if work_cache is True:
+            work_cache = WorkCache()
+        self.work_cache = work_cache if work_cache is not False else None
+        self.coalescer = None
+        if coalesce:
+            self.coalescer = Coalescer(
+                self.transport, window=coalesce_window, max_size=coalesce_max_size,
+                ids=self.ids, inflight=self.inflight)
 
     def post(self, method : str, params : list = None):
-        data = {
-        	"jsonrpc" : "2.0",
-            "id" : randint(1, 999),
-            "method": method,
-            "params" : params
-        }
-
-        r = requests.post(self.URI , json = data) 
-        r =  r.json()
+        if self.cache is not None:
+            result = self.cache.get(method, params)
+            if result is not MISS:
+                return result
+
+        if self.single_flight is not None:
+            r = self.single_flight.call(method, params, lambda: self._send(method, params))
+        else:
+            r = self._send(method, params)
         try :
-            return r["result"]
+            result = r["result"]
         except: 
-            return r["error"]
\ No newline at end of file
+            return r["error"]
+        if self.cache is not None:
+            self.cache.put(method, params, result)
+        return result
+
+    def _send(self, method : str, params : list = None) -> dict:
+        if self.coalescer is not None:
+            return self.coalescer.submit(method, params).result()
+        return self.transport.post(request(method, params, next(self.ids)))
+
+    def batch(self) -> Batch:
+        """
+        Return a :class:`pyqlc.rpc.Batch` that sends the calls made through
+        its module facades as one JSON-RPC batch request
+
+        >>> with qlc.batch() as b:
+        ...     info = b.Ledger.accountInfo(address)
+        ...     header = b.Pov.getLatestHeader()
+        >>> info.result()
+        """
+        return Batch(self)
+
+    def subscribe(self, namespace : str, event : str, params : list = None, callback=None, **options):
+        """
+        Subscribe to `event` of the node's `namespace` API over the `WS`
+        connection and return the :class:`pyqlc.transport.Subscription`
+
+        The connection is served by a background thread, which is also where
+        `callback` is called.
+        """
+        ws, loop = self._websocket()
+        return asyncio.run_coroutine_threadsafe(
+            ws.subscribe(namespace, event, params, callback=callback, **options), loop).result()
+
+    def unsubscribe(self, subscription) -> bool:
+        """
+        Cancel a subscription returned by :meth:`subscribe`
+        """
+        ws, loop = self._websocket()
+        return asyncio.run_coroutine_threadsafe(ws.unsubscribe(subscription), loop).result()
+
+    def _websocket(self):
+        with self._ws_lock:
+            if self._ws is None:
+                if self.WS is None:
+                    raise ValueError("Client has no websocket endpoint (WS)")
+                self._ws_loop = asyncio.new_event_loop()
+                threading.Thread(target=self._ws_loop.run_forever, name="pyqlc-ws", daemon=True).start()
+                self._ws = WebSocketTransport(self.WS, ids=self.ids)
+            return self._ws, self._ws_loop
+
+    def close(self):
+        """
+        Flush and stop the background coalescer, stop the work cache and
+        close the websocket connection, if any
+        """
+        if self.coalescer is not None:
+            self.coalescer.close()
+        if self.work_cache is not None:
+            self.work_cache.close()
+        with self._ws_lock:
+            ws, loop, self._ws, self._ws_loop = self._ws, self._ws_loop, None, None
+        if ws is not None:
+            asyncio.run_coroutine_threadsafe(ws.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
@@ -0,0 +1,161 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .rpc import InflightTable, RequestIds, match_responses, request
+from .utils.exceptions import RPCError
+
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_SIZE = 100
+DEFAULT_MAX_INFLIGHT = 4
+
+
+class CoalescerStats:
+    """
+    Counters for the batches sent by a :class:`Coalescer`
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.calls = 0
+        self.max_batch_size = 0
+        self.batch_sizes = {}
+
+    def record(self, size : int):
+        with self._lock:
+            self.batches += 1
+            self.calls += size
+            self.max_batch_size = max(self.max_batch_size, size)
+            self.batch_sizes[size] = self.batch_sizes.get(size, 0) + 1
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.calls / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "calls": self.calls,
+                "mean_batch_size": self.mean_batch_size,
+                "max_batch_size": self.max_batch_size,
+                "batch_sizes": dict(self.batch_sizes)
+            }
+
+
+class Coalescer:
+    """
+    Merges calls submitted from any number of threads into JSON-RPC batch
+    requests
+
+    A batch is sent once `window` seconds have passed since its first call
+    or as soon as it holds `max_size` calls, whichever comes first. Up to
+    `max_inflight` batches are sent concurrently. Each caller gets a future
+    resolved with its own response object.
+
+    From asyncio code, wrap the future with :func:`asyncio.wrap_future`.
+
+    Parameters
+    ----------
+    transport
+        object with a ``post(payload)`` method
+    window : float
+        seconds to wait for more calls before sending a batch, default is 2 ms
+    max_size : int
+        maximum number of calls per batch, default is 100
+    max_inflight : int
+        maximum number of batches being sent at the same time, default is 4
+    ids : RequestIds
+        optional , id allocator to share with the owning client
+    inflight : InflightTable
+        optional , table the queued calls are registered in
+    """
+    def __init__(
+        self,
+        transport,
+        window : float = DEFAULT_WINDOW,
+        max_size : int = DEFAULT_MAX_SIZE,
+        max_inflight : int = DEFAULT_MAX_INFLIGHT,
+        ids : RequestIds = None,
+        inflight : InflightTable = None):
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.transport = transport
+        self.window = window
+        self.max_size = max_size
+        self.stats = CoalescerStats()
+
+        self.ids = ids if ids is not None else RequestIds()
+        self.inflight = inflight if inflight is not None else InflightTable()
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight)
+        self._thread = threading.Thread(target=self._run, name="pyqlc-coalescer", daemon=True)
+        self._thread.start()
+
+    def submit(self, method : str, params : list = None) -> Future:
+        """
+        Queue a call and return a future for its JSON-RPC response object
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("coalescer is closed")
+            payload = request(method, params, next(self.ids))
+            future = self.inflight.add(payload["id"])
+            self._pending.append((payload, time.monotonic()))
+            if len(self._pending) == 1 or len(self._pending) >= self.max_size:
+                self._cond.notify()
+        return future
+
+    def close(self):
+        """
+        Send the calls still queued and stop the background thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                deadline = self._pending[0][1] + self.window
+                while len(self._pending) < self.max_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                calls = self._pending[:self.max_size]
+                del self._pending[:self.max_size]
+
+            self._executor.submit(self._send, calls)
+
+    def _send(self, calls):
+        self.stats.record(len(calls))
+        payloads = [payload for payload, _ in calls]
+        try:
+            if len(payloads) == 1:
+                items = [dict(self.transport.post(payloads[0]), id=payloads[0]["id"])]
+            else:
+                items = match_responses(payloads, self.transport.post(payloads))
+        except Exception as e:
+            for payload in payloads:
+                self.inflight.fail(payload["id"], e)
+            return
+
+        for payload, item in zip(payloads, items):
+            if item is None or not self.inflight.resolve(item):
+                self.inflight.fail(
+                    payload["id"],
+                    RPCError({"message": "no response for request id {}".format(payload["id"])}))
@@ -1,14 +1,15 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Contract:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def contractAddressList(self) -> list:
         """
         Get all contract addresses
         """  
-        return client.Client(self.URI).post("contract_contractAddressList")
+        return self.client.post("contract_contractAddressList")
 
     def getAbiByContractAddress(self, contract_address : str) -> str:
         """
@@ -19,7 +20,7 @@ class Contract:
         contract_address : str
             contract address
         """  
-        return client.Client(self.URI).post("contract_getAbiByContractAddress", [contract_address])
+        return self.client.post("contract_getAbiByContractAddress", [contract_address])
 
     def packContractData(self, abi_string : str, method_name : str, *args) -> str:
         """
@@ -39,4 +40,4 @@ class Contract:
             method_args += arg
 
         params = [abi_string, method_name, method_args]
-        return client.Client(self.URI).post("contract_packContractData", params)
\ No newline at end of file
+        return self.client.post("contract_packContractData", params)
\ No newline at end of file
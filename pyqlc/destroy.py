@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Destroy:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getSendBlock(
         self,
@@ -43,7 +44,7 @@ class Destroy:
             params["amount"] = k["amount"]
             params["signature"] = k["signature"]
 
-        return client.Client(self.URI).post("destroy_getSendBlock", [params])
+        return self.client.post("destroy_getSendBlock", [params])
 
     def getRewardsBlock(self, block_hash : str) -> dict:
         """
@@ -54,7 +55,7 @@ class Destroy:
         block_hash : str
             ContractSend block hash
         """
-        return client.Client(self.URI).post("destroy_getRewardsBlock", [block_hash])
+        return self.client.post("destroy_getRewardsBlock", [block_hash])
 
     def getDestroyInfoDetail(self, address : str) -> list:
         """
@@ -65,7 +66,7 @@ class Destroy:
         address : str
             QLC address
         """
-        return client.Client(self.URI).post("destroy_getDestroyInfoDetail", [address])
+        return self.client.post("destroy_getDestroyInfoDetail", [address])
 
     def getTotalDestroyInfo(self, address : str) -> int:
         """
@@ -76,4 +77,4 @@ class Destroy:
         address : str
             QLC address
         """
-        return client.Client(self.URI).post("destroy_getTotalDestroyInfo", [address])
\ No newline at end of file
+        return self.client.post("destroy_getTotalDestroyInfo", [address])
\ No newline at end of file
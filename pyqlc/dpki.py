@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class DPKI:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getVerifierRegisterBlock(self, account : str, Type : str, ID : str, **kwargs) -> dict:
         """
@@ -38,7 +39,7 @@ class DPKI:
             params["type"] = k["type"]
             params["id"] = k["id"]
 
-        return client.Client(self.URI).post("dpki_getVerifierRegisterBlock", [params])
+        return self.client.post("dpki_getVerifierRegisterBlock", [params])
 
 
     def getVerifierUnregisterBlock(self, account : str, Type : str, **kwargs) -> dict:
@@ -69,13 +70,13 @@ class DPKI:
             params["account"] = k["account"]
             params["type"] = k["type"]
         
-        return client.Client(self.URI).post("dpki_getVerifierUnregisterBlock", [params])
+        return self.client.post("dpki_getVerifierUnregisterBlock", [params])
 
     def getAllVerifiers(self) -> list:
         """
         Get all the verifiers
         """ 
-        return client.Client(self.URI).post("dpki_getAllVerifiers")
+        return self.client.post("dpki_getAllVerifiers")
 
     def getVerifiersByType(self, Type : str) -> list:
         """
@@ -86,7 +87,7 @@ class DPKI:
         Type : str
             verifier type (email/weChat)
         """ 
-        return client.Client(self.URI).post("dpki_getVerifiersByType", [Type])
+        return self.client.post("dpki_getVerifiersByType", [Type])
 
     def getActiveVerifiers(self, Type : str) -> list:
         """
@@ -97,7 +98,7 @@ class DPKI:
         Type : str
             verifier type (email/weChat)
         """ 
-        return client.Client(self.URI).post("dpki_getActiveVerifiers", [Type])
+        return self.client.post("dpki_getActiveVerifiers", [Type])
 
     def getVerifiersByAccount(self, account : str) -> list:
         """
@@ -108,7 +109,7 @@ class DPKI:
         account : str
             verifier register account
         """ 
-        return client.Client(self.URI).post("dpki_getVerifiersByAccount", [account])
+        return self.client.post("dpki_getVerifiersByAccount", [account])
 
     def getVerifierStateByBlockHeight(self, height : int, account : str) -> dict:
         """
@@ -122,7 +123,7 @@ class DPKI:
             verifier register account
         """ 
         params = [height, account]
-        return client.Client(self.URI).post("dpki_getVerifierStateByBlockHeight", params)
+        return self.client.post("dpki_getVerifierStateByBlockHeight", params)
 
     def getAllVerifierStatesByBlockHeight(self, height : int) -> dict:
         """
@@ -133,7 +134,7 @@ class DPKI:
         height : int
             pov height
         """ 
-        return client.Client(self.URI).post("dpki_getAllVerifierStatesByBlockHeight", [height])
+        return self.client.post("dpki_getAllVerifierStatesByBlockHeight", [height])
 
     def getVerifierHeartBlock(self,account : str, Types : list) -> dict:
         """
@@ -147,7 +148,7 @@ class DPKI:
             verifier types
         """ 
         params = [account, Types]
-        return client.Client(self.URI).post("dpki_getVerifierHeartBlock", params)
+        return self.client.post("dpki_getVerifierHeartBlock", params)
 
     def getPublishBlock(
         self,
@@ -214,7 +215,7 @@ class DPKI:
             params["fee"] = k["fee"]
             params["verifiers"] = k["verifiers"]
 
-        return client.Client(self.URI).post("dpki_getPublishBlock", [params])
+        return self.client.post("dpki_getPublishBlock", [params])
 
     def getUnPublishBlock(
         self,
@@ -272,7 +273,7 @@ class DPKI:
             params["pubkey"] = k["pubkey"]
             params["hash"] = k["hash"]
         
-        return client.Client(self.URI).post("dpki_getUnPublishBlock", [params])
+        return self.client.post("dpki_getUnPublishBlock", [params])
 
     def getPubKeyByTypeAndID(self, Type : str, ID : str) -> list:
         """
@@ -286,7 +287,7 @@ class DPKI:
             id address
         """ 
         params = [Type, ID]
-        return client.Client(self.URI).post("dpki_getPubKeyByTypeAndID", params)
+        return self.client.post("dpki_getPubKeyByTypeAndID", params)
 
     def getRecommendPubKey(self, Type : str, ID : str) -> list:
         """
@@ -300,7 +301,7 @@ class DPKI:
             id address
         """ 
         params = [Type, ID]
-        return client.Client(self.URI).post("dpki_getRecommendPubKey", params)
+        return self.client.post("dpki_getRecommendPubKey", params)
 
     def getPublishInfosByType(self, Type : str) -> list:
         """
@@ -311,7 +312,7 @@ class DPKI:
         Type : str
             id type (email/weChat)
         """ 
-        return client.Client(self.URI).post("dpki_getPublishInfosByType", [Type])
+        return self.client.post("dpki_getPublishInfosByType", [Type])
 
     def getPublishInfosByAccountAndType(self, account : str, Type : str) -> list:
         """
@@ -325,7 +326,7 @@ class DPKI:
             verifier type (email/weChat)
         """ 
         params = [account, Type]
-        return client.Client(self.URI).post("dpki_getPublishInfosByAccountAndType", params)
+        return self.client.post("dpki_getPublishInfosByAccountAndType", params)
 
     def getOracleBlock(
         self,
@@ -389,7 +390,7 @@ class DPKI:
             params["code"] = k["code"]
             params["hash"] = k["hash"]
         
-        return client.Client(self.URI).post("dpki_getOracleBlock", [params])
+        return self.client.post("dpki_getOracleBlock", [params])
 
     def getOracleInfosByType(self, Type : str) -> list:
         """
@@ -400,7 +401,7 @@ class DPKI:
         Type : str
             verify type (email/weChat), get all types if type is empty
         """ 
-        return client.Client(self.URI).post("dpki_getOracleInfosByType", [Type])
+        return self.client.post("dpki_getOracleInfosByType", [Type])
 
     def getOracleInfosByTypeAndID(self, Type : str, ID : str) -> list:
         """
@@ -414,7 +415,7 @@ class DPKI:
             id address
         """ 
         params = [Type, ID]
-        return client.Client(self.URI).post("dpki_getOracleInfosByTypeAndID", params)
+        return self.client.post("dpki_getOracleInfosByTypeAndID", params)
 
     def getOracleInfosByAccountAndType(self, account : str, Type : str) -> list:
         """
@@ -428,7 +429,7 @@ class DPKI:
             verify type (email/weChat), get all types if type is empty
         """ 
         params = [account, Type]
-        return client.Client(self.URI).post("dpki_getOracleInfosByAccountAndType", params)
+        return self.client.post("dpki_getOracleInfosByAccountAndType", params)
 
     def getOracleInfosByHash(self, Hash : str) -> list:
         """
@@ -439,7 +440,7 @@ class DPKI:
         Hash : str
             publish block hash to verify
         """ 
-        return client.Client(self.URI).post("dpki_getOracleInfosByHash", [Hash])
+        return self.client.post("dpki_getOracleInfosByHash", [Hash])
 
     def getAvailRewardInfo(self, account : str) -> dict:
         """
@@ -450,7 +451,7 @@ class DPKI:
         account : str
             verifier account
         """ 
-        return client.Client(self.URI).post("dpki_getAvailRewardInfo", [account])
+        return self.client.post("dpki_getAvailRewardInfo", [account])
 
     def getRewardSendBlock(
         self,
@@ -495,7 +496,7 @@ class DPKI:
             params["endHeight"] = k["endHeight"]
             params["rewardAmount"] = k["rewardAmount"]
         
-        return client.Client(self.URI).post("dpki_getRewardSendBlock", [params])
+        return self.client.post("dpki_getRewardSendBlock", [params])
 
     def getRewardRecvBlockBySendHash(self, Hash : str) -> dict:
         """
@@ -506,7 +507,7 @@ class DPKI:
         Hash : str
             send block hash
         """ 
-        return client.Client(self.URI).post("dpki_getRewardRecvBlockBySendHash", [Hash])
+        return self.client.post("dpki_getRewardRecvBlockBySendHash", [Hash])
 
     def getRewardHistory(self, account : str) -> dict:
         """
@@ -517,4 +518,4 @@ class DPKI:
         account : str
             verifier account
         """ 
-        return client.Client(self.URI).post("dpki_getRewardHistory", [account])
\ No newline at end of file
+        return self.client.post("dpki_getRewardHistory", [account])
\ No newline at end of file
@@ -1,5 +1,4 @@
-from .utils.helper import size_in_bytes
-from . import client
+from .utils.helper import size_in_bytes, as_client
 
 STATUSES = [
     "KYC_STATUS_NOT_STARTED", "KYC_STATUS_IN_PROGRESS", "KYC_STATUS_PROCESSING", "KYC_STATUS_FAILED_JUMIO",
@@ -25,8 +24,8 @@ class Kyc:
 
     Customer
     """
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
     
     def getAdminHandoverBlock(self, admin : str, successor : str, comment : str, **kwargs) -> dict:
         """
@@ -52,7 +51,7 @@ class Kyc:
             params["successor"] = k["successor"]
             params["comment"] = k["comment"]
 
-        return client.Client(self.URI).post("KYC_getAdminHandoverBlock", [params])
+        return self.client.post("KYC_getAdminHandoverBlock", [params])
 
 
     def getUpdateOperatorBlock(self, admin : str, operator : str, action : str, comment : str, **kwargs) -> dict:
@@ -89,7 +88,7 @@ class Kyc:
         if size_in_bytes(params["comment"]) > 128:
             raise Exception("size of comment is > 128 bytes")
 
-        return client.Client(self.URI).post("KYC_getUpdateOperatorBlock", [params])
+        return self.client.post("KYC_getUpdateOperatorBlock", [params])
     
     def getUpdateStatusBlock(self, operator : str, chainAddress : str, status : str, **kwargs) -> dict:
         """
@@ -130,7 +129,7 @@ class Kyc:
         if params["status"] not in STATUSES:
             raise Exception("Invalid status")
 
-        return client.Client(self.URI).post("KYC_getUpdateStatusBlock", [params])
+        return self.client.post("KYC_getUpdateStatusBlock", [params])
 
     def getUpdateTradeAddressBlock(self, operator : str, chainAddress : str, action : str, tradeAddress : str, comment : str, **kwargs):
         """
@@ -170,19 +169,19 @@ class Kyc:
         if size_in_bytes(params["comment"]) > 128:
             raise Exception("size of comment is > 128 bytes")
 
-        return client.Client(self.URI).post("KYC_getUpdateTradeAddressBlock", [params])
+        return self.client.post("KYC_getUpdateTradeAddressBlock", [params])
 
     def getAdmin(self) -> dict:
         """
         Get current admin
         """
-        return client.Client(self.URI).post("KYC_getAdmin")
+        return self.client.post("KYC_getAdmin")
 
     def getStatusCount(self) -> int:
         """
         Get all KYC status count
         """
-        return client.Client(self.URI).post("KYC_getStatusCount")
+        return self.client.post("KYC_getStatusCount")
 
     def getStatus(self, count : int, offset : int) -> list:
         """
@@ -197,7 +196,7 @@ class Kyc:
         """
         params = [count, offset]
 
-        return client.Client(self.URI).post("KYC_getStatus", params)
+        return self.client.post("KYC_getStatus", params)
 
     def getStatusByChainAddress(self, address : str) -> dict:
         """
@@ -208,7 +207,7 @@ class Kyc:
         address : str
             qlcchain address
         """
-        return client.Client(self.URI).post("KYC_getStatusByChainAddress", [address])
+        return self.client.post("KYC_getStatusByChainAddress", [address])
 
     def getStatusByTradeAddress(self, trade_Address : str) -> dict:
         """
@@ -219,7 +218,7 @@ class Kyc:
         trade_Address : str
             stable coin address
         """
-        return client.Client(self.URI).post("KYC_getStatusByTradeAddress", [trade_Address])
+        return self.client.post("KYC_getStatusByTradeAddress", [trade_Address])
 
     def getTradeAddress(self, address : str):
         """
@@ -230,13 +229,13 @@ class Kyc:
         address : str
             qlcchain address
         """
-        return client.Client(self.URI).post("KYC_getTradeAddress", [address])
+        return self.client.post("KYC_getTradeAddress", [address])
 
     def getOperatorCount(self):
         """
         Get all operator count
         """
-        return client.Client(self.URI).post("KYC_getOperatorCount")
+        return self.client.post("KYC_getOperatorCount")
 
     def getOperator(self, count : int, offset : int) -> list:
         """
@@ -251,4 +250,4 @@ class Kyc:
         """
         params = [count, offset]
 
-        return client.Client(self.URI).post("KYC_getOperator", params)
\ No newline at end of file
+        return self.client.post("KYC_getOperator", params)
\ No newline at end of file
@@ -1,10 +1,10 @@
-from . import client
 from .utils.block import Block
+from .utils.helper import as_client
 
 
 class Ledger:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def accountBlocksCount(self, address : str) -> int:
         """
@@ -15,7 +15,7 @@ class Ledger:
         address : str
             the account address
         """  
-        return client.Client(self.URI).post("ledger_accountBlocksCount", [address])
+        return self.client.post("ledger_accountBlocksCount", [address])
 
     def accountHistoryTopn(self, address : str, num_of_blocks : int, idx : int = 0):
         """
@@ -31,7 +31,7 @@ class Ledger:
             optional , offset, index of block where to start, default is 0
         """  
         params = [address, num_of_blocks, idx]
-        return client.Client(self.URI).post("ledger_accountHistoryTopn", params)
+        return self.client.post("ledger_accountHistoryTopn", params)
 
     def accountInfo(self, address : str):
         """
@@ -42,7 +42,7 @@ class Ledger:
         address : str
             the account address
         """  
-        return client.Client(self.URI).post("ledger_accountInfo", [address])
+        return self.client.post("ledger_accountInfo", [address])
 
     def confirmedAccountInfo(self, address : str):
         """
@@ -53,7 +53,7 @@ class Ledger:
         address : str
             the account address
         """  
-        return client.Client(self.URI).post("ledger_confirmedAccountInfo", [address])
+        return self.client.post("ledger_confirmedAccountInfo", [address])
     
     def accountRepresentative(self, address : str):
         """
@@ -64,7 +64,7 @@ class Ledger:
         address : str
             the account address
         """  
-        return client.Client(self.URI).post("ledger_accountRepresentative", [address])
+        return self.client.post("ledger_accountRepresentative", [address])
 
     def accountVotingWeight(self, address : str):
         """
@@ -75,7 +75,7 @@ class Ledger:
         address : str
             the account address
         """  
-        return client.Client(self.URI).post("ledger_accountVotingWeight", [address])
+        return self.client.post("ledger_accountVotingWeight", [address])
 
     def accounts(self, num_of_accounts : int, idx : int = 0):
         """
@@ -89,7 +89,7 @@ class Ledger:
             optional , offset, index of account where to start, default is 0
         """  
         params = [num_of_accounts, idx]
-        return client.Client(self.URI).post("ledger_accounts", params)
+        return self.client.post("ledger_accounts", params)
 
     def accountsBalance(self, addresses : list):
         """
@@ -100,7 +100,7 @@ class Ledger:
         addresses : list
             addresses list
         """  
-        return client.Client(self.URI).post("ledger_accountsBalance", [addresses])
+        return self.client.post("ledger_accountsBalance", [addresses])
 
     def accountsFrontiers(self, addresses : list):
         """
@@ -111,7 +111,7 @@ class Ledger:
         addresses : list
             addresses list
         """  
-        return client.Client(self.URI).post("ledger_accountsFrontiers", [addresses])
+        return self.client.post("ledger_accountsFrontiers", [addresses])
 
     def accountsPending(self, addresses : list, num_of_pending : int = -1):
         """
@@ -125,13 +125,13 @@ class Ledger:
             get the maximum number of pending for each account, if set -1, return all pending
         """  
         params = [addresses, num_of_pending]
-        return client.Client(self.URI).post("ledger_accountsPending", params)
+        return self.client.post("ledger_accountsPending", params)
 
     def accountsCount(self):
         """
         Return total number of accounts of chain
         """ 
-        return client.Client(self.URI).post("ledger_accountsCount")
+        return self.client.post("ledger_accountsCount")
 
     def blockAccount(self, block_hash : str):
         """
@@ -142,7 +142,7 @@ class Ledger:
         block_hash : str
             block hash
         """ 
-        return client.Client(self.URI).post("ledger_blockAccount", [block_hash])
+        return self.client.post("ledger_blockAccount", [block_hash])
 
     def blockHash(self, **block):
         """
@@ -152,7 +152,7 @@ class Ledger:
         ----------
         block
         """ 
-        return client.Client(self.URI).post("ledger_blockHash", [block])
+        return self.client.post("ledger_blockHash", [block])
 
     def blocks(self, num_of_blocks : int, idx : int):
         """
@@ -166,19 +166,19 @@ class Ledger:
             optional , offset, index of block where to start, default is 0
         """
         params = [num_of_blocks, idx] 
-        return client.Client(self.URI).post("ledger_blocks", params)
+        return self.client.post("ledger_blocks", params)
 
     def blocksCount(self):
         """
         Return the number of blocks (include smartcontrant block) and unchecked blocks of chain
         """
-        return client.Client(self.URI).post("ledger_blocksCount")
+        return self.client.post("ledger_blocksCount")
 
     def blocksCountByType(self):
         """
         Report number of blocks by type of chain
         """
-        return client.Client(self.URI).post("ledger_blocksCountByType")
+        return self.client.post("ledger_blocksCountByType")
 
     def blocksInfo(self, blocks_hash : list):
         """
@@ -189,7 +189,7 @@ class Ledger:
         blocks_hash : str
             blocks hash
         """
-        return client.Client(self.URI).post("ledger_blocksInfo", [blocks_hash])
+        return self.client.post("ledger_blocksInfo", [blocks_hash])
 
     def blockConfirmedStatus(self, block_hash : str):
         """
@@ -200,7 +200,7 @@ class Ledger:
         block_hash : str
             block hash
         """
-        return client.Client(self.URI).post("ledger_blockConfirmedStatus", [block_hash])
+        return self.client.post("ledger_blockConfirmedStatus", [block_hash])
 
     def chain(self, block_hash_start : str, max_num_of_blocks : int):
         """
@@ -214,7 +214,7 @@ class Ledger:
             get the maximum number of blocks, if set n to -1, will list blocks to open block
         """
         params = [block_hash_start, max_num_of_blocks]
-        return client.Client(self.URI).post("ledger_chain", params)
+        return self.client.post("ledger_chain", params)
 
     def delegators(self, representative_acc_address : str):
         """
@@ -225,7 +225,7 @@ class Ledger:
         representative_acc_address : str
             representative account address
         """
-        return client.Client(self.URI).post("ledger_delegators", [representative_acc_address])
+        return self.client.post("ledger_delegators", [representative_acc_address])
 
     def delegatorsCount(self, representative_acc_address : str):
         """
@@ -236,7 +236,7 @@ class Ledger:
         representative_acc_address : str
             representative account address
         """
-        return client.Client(self.URI).post("ledger_delegatorsCount", [representative_acc_address])
+        return self.client.post("ledger_delegatorsCount", [representative_acc_address])
 
     def generateSendBlock(
         self,
@@ -263,47 +263,10 @@ class Ledger:
         :param str message: optional , sms message hash
         :param str privKey: optional , private key ,if not set ,will return block without signature and work
         """
-        params = {
-            "from": From,
-            "to": to,
-            "tokenName": tokenName,
-            "amount": amount
-        }
-
-        if sender is not None:
-            params["sender"] = sender
-        if receiver is not None:
-            params["receiver"] = receiver
-        if message is not None:
-            params["message"] = message
-
-        for k, _ in kwargs.items():
-            params["From"] = k["from"]
-            params["to"] = k["to"]
-            params["tokenName"] = k["tokenName"]
-            params["amount"] = k["amount"]
-            if k == k["sender"]:
-                params["sender"] = k["sender"]
-            if k == k["receiver"]:
-                params["receiver"] = k["receiver"]
-            if k == k["message"]:
-                params["message"] = k["message"]
-            if k == k["privKey"]:
-                privKey = k["privKey"]
-
-        if privKey is None:
-            raise Exception("Private Key is required for creating signatures localy")
-
-
-        new_block = client.Client(self.URI).post("ledger_generateSendBlock", [params])
-        Hash = self.blockHash(**new_block)
-
-        blk = Block.from_dict(new_block)
-        blk.private_key = privKey
-        blk.block_hash = Hash
-        blk.set_signature()
-        blk.solve_work()
-        return blk.to_dict()
+        params, privKey = self._send_block_params(
+            From, to, tokenName, amount, sender, receiver, message, privKey, kwargs)
+        new_block = self.client.post("ledger_generateSendBlock", [params])
+        return self._sign_and_solve(new_block, privKey, self._work_cache())
 
 
     def generateReceiveBlock(self, privKey : str = None, **block):
@@ -319,15 +282,8 @@ class Ledger:
             raise Exception("Private Key is required for creating signatures localy")
 
 
-        rec_block = client.Client(self.URI).post("ledger_generateReceiveBlock", [block])
-        Hash = self.blockHash(**rec_block)
-
-        blk = Block.from_dict(rec_block)
-        blk.private_key = privKey
-        blk.block_hash = Hash
-        blk.set_signature()
-        blk.solve_work()
-        return blk.to_dict()
+        rec_block = self.client.post("ledger_generateReceiveBlock", [block])
+        return self._sign_and_solve(rec_block, privKey, self._work_cache())
 
     def generateChangeBlock(self, account_address : str, new_representative_account : str, privKey : str = None):
         """
@@ -340,26 +296,23 @@ class Ledger:
         :param str privKey: optional , private key ,if not set ,will return block without signature and work
         """
         params = [account_address, new_representative_account, privKey]
-        chng_block = client.Client(self.URI).post("ledger_generateChangeBlock", [params])
-        Hash = self.blockHash(**chng_block)
-
-        blk = Block.from_dict(chng_block)
-        blk.private_key = privKey
-        blk.block_hash = Hash
-        blk.set_signature()
-        blk.solve_work()
-        return blk.to_dict()
+        chng_block = self.client.post("ledger_generateChangeBlock", [params])
+        return self._sign_and_solve(chng_block, privKey, self._work_cache())
 
     def process(self, **block) -> str:
         """
         Check block base info, update chain info for the block, and broadcast block
 
+        With a work cache on the client, the work of the account's next
+        block starts being solved in the background.
+
         Parameters
         ----------
         :param str block: block
         """
-
-        return client.Client(self.URI).post("ledger_process", [block])
+        result = self.client.post("ledger_process", [block])
+        self._precompute_next(result)
+        return result
 
 
     def representatives(self, Bool : bool) -> list:
@@ -371,13 +324,13 @@ class Ledger:
         Bool : bool
             bool , optional , if not set or set false, will return representatives randomly, if set true, will sorting represetntative balance in descending order
         """
-        return client.Client(self.URI).post("ledger_representatives", [Bool])
+        return self.client.post("ledger_representatives", [Bool])
 
     def tokens(self) -> list:
         """
         Return tokens of the chain
         """
-        return client.Client(self.URI).post("ledger_tokens")
+        return self.client.post("ledger_tokens")
 
     def tokenInfoById(self,  token_id : str) -> dict:
         """
@@ -388,7 +341,7 @@ class Ledger:
         token_id : str
             token id
         """
-        return client.Client(self.URI).post("ledger_tokenInfoById", [token_id])
+        return self.client.post("ledger_tokenInfoById", [token_id])
 
     def tokenInfoByName(self,  token_name : str) -> dict:
         """
@@ -399,10 +352,81 @@ class Ledger:
         token_name : str
              token name
         """
-        return client.Client(self.URI).post("ledger_tokenInfoByName", [token_name])
+        return self.client.post("ledger_tokenInfoByName", [token_name])
 
     def transactionsCount(self) -> dict:
         """
         Return the number of blocks (not include smartcontrant block) and unchecked blocks of chain
         """
-        return client.Client(self.URI).post("ledger_transactionsCount")
\ No newline at end of file
+        return self.client.post("ledger_transactionsCount")
+
+    @staticmethod
+    def _send_block_params(From, to, tokenName, amount, sender, receiver, message, privKey, kwargs):
+        """
+        Return the `ledger_generateSendBlock` params and the private key for
+        :meth:`generateSendBlock`
+        """
+        params = {
+            "from": From,
+            "to": to,
+            "tokenName": tokenName,
+            "amount": amount
+        }
+
+        if sender is not None:
+            params["sender"] = sender
+        if receiver is not None:
+            params["receiver"] = receiver
+        if message is not None:
+            params["message"] = message
+
+        for k, _ in kwargs.items():
+            params["From"] = k["from"]
+            params["to"] = k["to"]
+            params["tokenName"] = k["tokenName"]
+            params["amount"] = k["amount"]
+            if k == k["sender"]:
+                params["sender"] = k["sender"]
+            if k == k["receiver"]:
+                params["receiver"] = k["receiver"]
+            if k == k["message"]:
+                params["message"] = k["message"]
+            if k == k["privKey"]:
+                privKey = k["privKey"]
+
+        if privKey is None:
+            raise Exception("Private Key is required for creating signatures localy")
+        return params, privKey
+
+    def _work_cache(self):
+        return getattr(self.client, "work_cache", None)
+
+    def _precompute_next(self, result):
+        """
+        Queue the work of the block following a processed one, whose root
+        is the hash `ledger_process` returned
+        """
+        work_cache = self._work_cache()
+        if work_cache is not None and isinstance(result, str) and len(result) == 64:
+            work_cache.precompute(result)
+
+    @staticmethod
+    def _sign_and_solve(block : dict, privKey : str, work_cache = None) -> dict:
+        """
+        Sign `block` with `privKey`, solve its work, or take it from
+        `work_cache`, and return it as a dict
+
+        The block is hashed locally, see :meth:`pyqlc.utils.block.Block.compute_hash`.
+        """
+        blk = Block.from_dict(block)
+        blk.private_key = privKey
+        blk.block_hash = blk.compute_hash()
+        blk.set_signature()
+        work = None
+        if work_cache is not None:
+            work = work_cache.take(blk.root)
+        if work is not None:
+            blk.work = work
+        else:
+            blk.solve_work()
+        return blk.to_dict()
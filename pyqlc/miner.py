@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Miner:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getAvailRewardInfo(self, coinbase : str) -> dict:
         """
@@ -13,7 +14,7 @@ class Miner:
         coinbase : str
             miner address
         """
-        return client.Client(self.URI).post("miner_getAvailRewardInfo", [coinbase])
+        return self.client.post("miner_getAvailRewardInfo", [coinbase])
 
     def getRewardSendBlock(
         self,
@@ -60,7 +61,7 @@ class Miner:
             params["endHeight"] = k["endHeight"]
             params["rewardBlocks"] = k["rewardBlocks"] 
         
-        return client.Client(self.URI).post("miner_getRewardSendBlock", [params])
+        return self.client.post("miner_getRewardSendBlock", [params])
 
 
     def getRewardRecvBlockBySendHash(self, sendHash : str) -> dict:
@@ -72,7 +73,7 @@ class Miner:
         sendHash : str
             contract send block hash
         """
-        return client.Client(self.URI).post("miner_getRewardRecvBlockBySendHash", [sendHash])
+        return self.client.post("miner_getRewardRecvBlockBySendHash", [sendHash])
 
     def getRewardRecvBlock(
         self,
@@ -183,7 +184,7 @@ class Miner:
             params["vote"] = k["vote"]
             params["work"] = k["work"]
 
-        return client.Client(self.URI).post("miner_getRewardRecvBlock", [params])
+        return self.client.post("miner_getRewardRecvBlock", [params])
 
     def getRewardHistory(self, coinbase : str) -> dict:
         """
@@ -194,4 +195,4 @@ class Miner:
         coinbase : str
             miner's address
         """
-        return client.Client(self.URI).post("miner_getRewardHistory", [coinbase])
\ No newline at end of file
+        return self.client.post("miner_getRewardHistory", [coinbase])
\ No newline at end of file
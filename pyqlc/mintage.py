@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Mintage:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getMintageData(
         self,
@@ -56,7 +57,7 @@ class Mintage:
             params["decimals"] = k["decimals"]
             params["pledgeAmount"] = k["pledgeAmount"] 
 
-        return client.Client(self.URI).post("mintage_getMintageBlock", [params])
+        return self.client.post("mintage_getMintageBlock", [params])
 
     def getMintageBlock(
         self,
@@ -110,7 +111,7 @@ class Mintage:
             params["decimals"] = k["decimals"]
             params["pledgeAmount"] = k["pledgeAmount"] 
 
-        return client.Client(self.URI).post("mintage_getMintageBlock", [params])
+        return self.client.post("mintage_getMintageBlock", [params])
 
     def getRewardBlock(
         self,
@@ -215,4 +216,4 @@ class Mintage:
             params["vote"] = k["vote"]
             params["work"] = k["work"]
         
-        return client.Client(self.URI).post("mintage_getRewardBlock", [params])
\ No newline at end of file
+        return self.client.post("mintage_getRewardBlock", [params])
\ No newline at end of file
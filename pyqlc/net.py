@@ -1,14 +1,15 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Net:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def peersCount(self):
         """
         Return peers count
         """
-        return client.Client(self.URI).post("net_peersCount")
+        return self.client.post("net_peersCount")
 
     def getAllPeersInfo(self, count : int, offset : int):
         """
@@ -22,7 +23,7 @@ class Net:
             offset of all peers records
         """
         params = [count, offset]
-        return client.Client(self.URI).post("net_getAllPeersInfo", params)
+        return self.client.post("net_getAllPeersInfo", params)
 
     def getOnlinePeersInfo(self, count : int, offset : int):
         """
@@ -36,7 +37,7 @@ class Net:
             offset of online peers
         """
         params = [count, offset]
-        return client.Client(self.URI).post("net_getOnlinePeersInfo", params)
+        return self.client.post("net_getOnlinePeersInfo", params)
 
     def connectPeersInfo(self, count : int, offset : int):
         """
@@ -50,34 +51,34 @@ class Net:
             offset of connect peers
         """
         params = [count, offset]
-        return client.Client(self.URI).post("net_connectPeersInfo", params)
+        return self.client.post("net_connectPeersInfo", params)
 
     def onlineRepresentatives(self):
         """
         Return online representative accounts that have voted recently
         """
-        return client.Client(self.URI).post("net_onlineRepresentatives")
+        return self.client.post("net_onlineRepresentatives")
 
     def syncing(self):
         """
         Return sync status
         """
-        return client.Client(self.URI).post("net_syncing")
+        return self.client.post("net_syncing")
 
     def getBandwidthStats(self):
         """
         Return bandwidth metrics
         """
-        return client.Client(self.URI).post("net_getBandwidthStats")
+        return self.client.post("net_getBandwidthStats")
 
     def onlineRepsInfo(self):
         """
         Return online representative info ，validVotes and validVotesPercent
         """
-        return client.Client(self.URI).post("net_onlineRepsInfo")
+        return self.client.post("net_onlineRepsInfo")
 
     def getPeerId(self):
         """
         Return node peerid
         """
-        return client.Client(self.URI).post("net_getPeerId")
\ No newline at end of file
+        return self.client.post("net_getPeerId")
\ No newline at end of file
@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Permission:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getAdminHandoverBlock(self, admin : str, successor : str, comment : str, **kwargs) -> dict:
         """
@@ -28,13 +29,13 @@ class Permission:
             params["successor"] = k["successor"]
             params["comment"] = k["comment"]
 
-        return client.Client(self.URI).post("permission_getAdminHandoverBlock", [params])
+        return self.client.post("permission_getAdminHandoverBlock", [params])
 
     def getAdmin(self) -> dict:
         """
         Get the current admin
         """
-        return client.Client(self.URI).post("permission_getAdmin")
+        return self.client.post("permission_getAdmin")
 
     def getNodeUpdateBlock(self, admin : str, nodeId : str, nodeUrl : str, comment : str, **kwargs) -> dict:
         """
@@ -65,13 +66,13 @@ class Permission:
             params["nodeUrl"] = k["nodeUrl"]
             params["comment"] = k["comment"]
 
-        return client.Client(self.URI).post("permission_getNodeUpdateBlock", [params])
+        return self.client.post("permission_getNodeUpdateBlock", [params])
 
     def getNodesCount(self) -> int:
         """
         Get all the valid nodes count
         """
-        return client.Client(self.URI).post("permission_getNodesCount")
+        return self.client.post("permission_getNodesCount")
 
     def getNode(self, node_id : str) -> dict:
         """
@@ -82,7 +83,7 @@ class Permission:
         node_id : str
             node id
         """
-        return client.Client(self.URI).post("permission_getNode", [node_id])
+        return self.client.post("permission_getNode", [node_id])
 
     def getNodes(self, count : int, offset : int) -> list:
         """
@@ -96,4 +97,4 @@ class Permission:
             offset of the node
         """
         params = [count, offset]
-        return client.Client(self.URI).post("permission_getNodes", params)
\ No newline at end of file
+        return self.client.post("permission_getNodes", params)
\ No newline at end of file
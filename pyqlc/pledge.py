@@ -1,9 +1,8 @@
-from . import client
-from .utils.helper import getBlock
+from .utils.helper import getBlock, as_client
 
 class Pledge:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getPledgeData(
         self,
@@ -53,7 +52,7 @@ class Pledge:
             params["ptype"] = k["ptype"]
             params["nEP5TxId"] = k["nEP5TxId"]
 
-        return client.Client(self.URI).post("pledge_getPledgeData", [params])
+        return self.client.post("pledge_getPledgeData", [params])
 
     def getPledgeBlock(
         self,
@@ -103,7 +102,7 @@ class Pledge:
             params["ptype"] = k["ptype"]
             params["nEP5TxId"] = k["nEP5TxId"]
 
-        return client.Client(self.URI).post("pledge_getPledgeBlock", [params])
+        return self.client.post("pledge_getPledgeBlock", [params])
 
     def getPledgeRewardBlock(
         self,
@@ -178,7 +177,7 @@ class Pledge:
                             representative=representative, signature=signature, storage=storage, timestamp=timestamp,
                             token=token, type=type, vote=vote, work=work, **kwargs)
 
-        return  client.Client(self.URI).post("pledge_getPledgeRewardBlock", [block])
+        return  self.client.post("pledge_getPledgeRewardBlock", [block])
 
     def getWithdrawPledgeData(
         self,
@@ -222,7 +221,7 @@ class Pledge:
             params["ptype"] = k["ptype"]
             params["nEP5TxId"] = k["nEP5TxId"]
 
-        return client.Client(self.URI).post("pledge_getWithdrawPledgeData", [params])
+        return self.client.post("pledge_getWithdrawPledgeData", [params])
 
     def getWithdrawPledgeBlock(
         self,
@@ -266,7 +265,7 @@ class Pledge:
             params["ptype"] = k["ptype"]
             params["nEP5TxId"] = k["nEP5TxId"]
 
-        return client.Client(self.URI).post("pledge_getWithdrawPledgeBlock", [params])
+        return self.client.post("pledge_getWithdrawPledgeBlock", [params])
 
     def getWithdrawRewardBlock(
         self,
@@ -340,7 +339,7 @@ class Pledge:
                             network=network, oracle=oracle, povHeight=povHeight, previous=previous,
                             representative=representative, signature=signature, storage=storage, timestamp=timestamp,
                             token=token, type=type, vote=vote, work=work, **kwargs)
-        return  client.Client(self.URI).post("pledge_getWithdrawRewardBlock", [block])
+        return  self.client.post("pledge_getWithdrawRewardBlock", [block])
 
     def GetPledgeInfosByPledgeAddress(self, pledge_address : str) -> dict:
         """
@@ -351,7 +350,7 @@ class Pledge:
         pledge_address : str
             pledge address
         """ 
-        return  client.Client(self.URI).post("pledge_getPledgeInfosByPledgeAddress", [pledge_address])
+        return  self.client.post("pledge_getPledgeInfosByPledgeAddress", [pledge_address])
 
     def getPledgeBeneficialTotalAmount(self, beneficial_address : str) -> int:
         """
@@ -362,7 +361,7 @@ class Pledge:
         beneficial_address : str
             beneficial address
         """ 
-        return  client.Client(self.URI).post("pledge_getPledgeBeneficialTotalAmount", [beneficial_address])
+        return  self.client.post("pledge_getPledgeBeneficialTotalAmount", [beneficial_address])
 
     def getBeneficialPledgeInfosByAddress(self, beneficial_address : str) -> dict:
         """
@@ -373,7 +372,7 @@ class Pledge:
         beneficial_address : str
             beneficial address
         """ 
-        return  client.Client(self.URI).post("pledge_getBeneficialPledgeInfosByAddress", [beneficial_address])
+        return  self.client.post("pledge_getBeneficialPledgeInfosByAddress", [beneficial_address])
 
     def getBeneficialPledgeInfos(self, beneficial_address : str, pledge_type : str) -> list:
         """
@@ -387,7 +386,7 @@ class Pledge:
             pledge type
         """ 
         params = [beneficial_address, pledge_type]
-        return  client.Client(self.URI).post("pledge_getBeneficialPledgeInfos", params)
+        return  self.client.post("pledge_getBeneficialPledgeInfos", params)
 
     def getPledgeBeneficialAmount(self, beneficial_address : str, pledge_type : str) -> int:
         """
@@ -401,7 +400,7 @@ class Pledge:
             pledge type
         """ 
         params = [beneficial_address, pledge_type]
-        return  client.Client(self.URI).post("pledge_getPledgeBeneficialAmount", params)
+        return  self.client.post("pledge_getPledgeBeneficialAmount", params)
 
     def getPledgeInfoWithNEP5TxId(
         self,
@@ -445,7 +444,7 @@ class Pledge:
             params["ptype"] = k["ptype"]
             params["nEP5TxId"] = k["nEP5TxId"]
 
-        return  client.Client(self.URI).post("pledge_getPledgeInfoWithNEP5TxId", [params])
+        return  self.client.post("pledge_getPledgeInfoWithNEP5TxId", [params])
 
     def getPledgeInfo(
         self,
@@ -484,16 +483,16 @@ class Pledge:
             params["amount"] = k["amount"]
             params["ptype"] = k["ptype"]
 
-        return  client.Client(self.URI).post("pledge_getPledgeInfo", [params])
+        return  self.client.post("pledge_getPledgeInfo", [params])
 
     def getAllPledgeInfo(self) -> list:
         """
         Return all pledge info
         """ 
-        return  client.Client(self.URI).post("pledge_getAllPledgeInfo")
+        return  self.client.post("pledge_getAllPledgeInfo")
 
     def getTotalPledgeAmount(self) -> int:
         """
         returns total pledge amount on chain
         """ 
-        return  client.Client(self.URI).post("pledge_getTotalPledgeAmount")
\ No newline at end of file
+        return  self.client.post("pledge_getTotalPledgeAmount")
\ No newline at end of file
@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Pov:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getFittestHeader(self, gap : int = 0):
         """
@@ -13,13 +14,13 @@ class Pov:
         gap : int
             gap before latest block header, default is 0
         """
-        return client.Client(self.URI).post("pov_getFittestHeader", [gap])
+        return self.client.post("pov_getFittestHeader", [gap])
 
     def getLatestHeader(self):
         """
         Return latest block header of PoV main chain
         """
-        return client.Client(self.URI).post("pov_getLatestHeader")
+        return self.client.post("pov_getLatestHeader")
 
     def getHeaderByHeight(self, block_heigth : int):
         """
@@ -30,7 +31,7 @@ class Pov:
         block_heigth : int
             block heigth
         """
-        return client.Client(self.URI).post("pov_getFittestHeader", [block_heigth])
+        return self.client.post("pov_getHeaderByHeight", [block_heigth])
 
     def getHeaderByHash(self, block_hash : str):
         """
@@ -41,7 +42,7 @@ class Pov:
         block_hash : str
             block hash
         """
-        return client.Client(self.URI).post("pov_getHeaderByHash", [block_hash])
+        return self.client.post("pov_getHeaderByHash", [block_hash])
 
     def batchGetHeadersByHeight(self, block_heigth : int, block_count : int, direction : bool):
         """
@@ -57,7 +58,7 @@ class Pov:
             true - ascend(forward), false - descend(backward)
         """
         params = [block_heigth, block_count, direction]
-        return client.Client(self.URI).post("pov_batchGetHeadersByHeight", params)
+        return self.client.post("pov_batchGetHeadersByHeight", params)
 
     def getLatestBlock(self, txOffset : int, txLimit : int):
         """
@@ -71,7 +72,7 @@ class Pov:
             return transcations not excced limit, default is 100
         """
         params = [txOffset, txLimit]
-        return client.Client(self.URI).post("pov_getLatestBlock", params)
+        return self.client.post("pov_getLatestBlock", params)
 
     def getBlockByHeight(self, height : int, txOffset : int, txLimit : int):
         """
@@ -87,7 +88,7 @@ class Pov:
             return transcations not excced limit, default is 100
         """
         params = [height, txOffset, txLimit]
-        return client.Client(self.URI).post("pov_getBlockByHeight", params)
+        return self.client.post("pov_getBlockByHeight", params)
 
     def getBlockByHash(self, hash : str, txOffset : int, txLimit : int):
         """
@@ -103,7 +104,7 @@ class Pov:
             return transcations not excced limit, default is 100
         """
         params = [hash, txOffset, txLimit]
-        return client.Client(self.URI).post("pov_getBlockByHash", params)
+        return self.client.post("pov_getBlockByHash", params)
 
     def getTransaction(self, txHash : str):
         """
@@ -114,7 +115,7 @@ class Pov:
         txHash : str
             transaction hash
         """
-        return client.Client(self.URI).post("pov_getTransaction", [txHash])
+        return self.client.post("pov_getTransaction", [txHash])
 
     def getTransactionByBlockHashAndIndex(self, blockHash : str, txIndex : int):
         """
@@ -128,7 +129,7 @@ class Pov:
             tx index
         """
         params = [blockHash, txIndex]
-        return client.Client(self.URI).post("pov_getTransactionByBlockHashAndIndex", params)
+        return self.client.post("pov_getTransactionByBlockHashAndIndex", params)
 
     def getTransactionByBlockHeightAndIndex(self, blockHeight : int, txIndex : int):
         """
@@ -142,7 +143,7 @@ class Pov:
             tx index
         """
         params = [blockHeight, txIndex]
-        return client.Client(self.URI).post("pov_getTransactionByBlockHeightAndIndex", params)
+        return self.client.post("pov_getTransactionByBlockHeightAndIndex", params)
 
     def getLatestAccountState(self, address : str):
         """
@@ -153,7 +154,7 @@ class Pov:
         address : str
             account address
         """
-        return client.Client(self.URI).post("pov_getLatestAccountState", [address])
+        return self.client.post("pov_getLatestAccountState", [address])
 
     def getAccountStateByBlockHeight(self, address : str, height : int):
         """
@@ -167,7 +168,7 @@ class Pov:
             block height
         """
         params = [address, height]
-        return client.Client(self.URI).post("pov_getLatestAccountState", params)
+        return self.client.post("pov_getLatestAccountState", params)
 
     def getAccountStateByBlockHash(self, address : str, hash : str):
         """
@@ -181,7 +182,7 @@ class Pov:
             block hash
         """
         params = [address, hash]
-        return client.Client(self.URI).post("pov_getAccountStateByBlockHash", params)
+        return self.client.post("pov_getAccountStateByBlockHash", params)
 
     def getHashInfo(self, block_height : int = 0, block_count : int = 120):
         """
@@ -195,13 +196,13 @@ class Pov:
             block count, defautl is 120
         """
         params = [block_height, block_count]
-        return client.Client(self.URI).post("pov_getHashInfo", params)
+        return self.client.post("pov_getHashInfo", params)
 
     def getMiningInfo(self):
         """
         Return mining info
         """
-        return client.Client(self.URI).post("pov_getMiningInfo")
+        return self.client.post("pov_getMiningInfo")
 
     def getMinerStats(self, addresses : list):
         """
@@ -212,7 +213,7 @@ class Pov:
         addresses : list
             addresses of miners
         """
-        return client.Client(self.URI).post("pov_getMinerStats", [addresses])
+        return self.client.post("pov_getMinerStats", [addresses])
 
     def getRepStats(self, addresses : list):
         """
@@ -223,7 +224,7 @@ class Pov:
         addresses : list
             addresses of representatives
         """
-        return client.Client(self.URI).post("pov_getRepStats", [addresses])
+        return self.client.post("pov_getRepStats", [addresses])
 
     def getDiffDayStat(self, dayIndex : int = 0):
         """
@@ -234,7 +235,7 @@ class Pov:
         dayIndex : int
             day index, default is 0
         """
-        return client.Client(self.URI).post("pov_getDiffDayStat", [dayIndex])
+        return self.client.post("pov_getDiffDayStat", [dayIndex])
 
     def getDiffDayStatByHeight(self, blockHeight : int):
         """
@@ -245,7 +246,7 @@ class Pov:
         blockHeight : int
             height of pov block
         """
-        return client.Client(self.URI).post("pov_getDiffDayStatByHeight", [blockHeight])
+        return self.client.post("pov_getDiffDayStatByHeight", [blockHeight])
 
     def getMinerDayStat(self, dayIndex : int = 0):
         """
@@ -256,7 +257,7 @@ class Pov:
         dayIndex : int
             day index, default is 0
         """
-        return client.Client(self.URI).post("pov_getMinerDayStat", [dayIndex])
+        return self.client.post("pov_getMinerDayStat", [dayIndex])
 
     def getMinerDayStatByHeight(self, blockHeight : int):
         """
@@ -267,7 +268,7 @@ class Pov:
         blockHeight : int
             height of pov block
         """
-        return client.Client(self.URI).post("pov_getMinerDayStatByHeight", [blockHeight])
+        return self.client.post("pov_getMinerDayStatByHeight", [blockHeight])
 
     def pov_getWork(self, miner : str, algo : str):
         """
@@ -281,7 +282,7 @@ class Pov:
             algorithm name of pow, such as SHA256D/X11/SCRYPT
         """
         params = [miner, algo]
-        return client.Client(self.URI).post("pov_getWork", params)
+        return self.client.post("pov_getWork", params)
 
     def submitWork(self, address_of_miner : str, algo : str, **kwargs):
         """
@@ -303,7 +304,7 @@ class Pov:
             params["address_of_miner"] = k["address_of_miner"]
             params["algo"] = k["algo"]
 
-        return client.Client(self.URI).post("pov_submitWork", [params])
+        return self.client.post("pov_submitWork", [params])
 
     def getLastNHourInfo(self, endHeight : int, timeSpan : int):
         """
@@ -317,4 +318,4 @@ class Pov:
             range should be in range [2 ~ 24] hour or [23600, 243600] seconds, 0 is 24 hour.
         """
         params = [endHeight, timeSpan]
-        return client.Client(self.URI).post("pov_getLastNHourInfo", params)
\ No newline at end of file
+        return self.client.post("pov_getLastNHourInfo", params)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Ptmkey:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getPtmKeyByAccount(self, account : str) -> list:
         """
@@ -13,7 +14,7 @@ class Ptmkey:
         account : str
             target account
         """
-        return client.Client(self.URI).post("ptmkey_getPtmKeyByAccount", [account])
+        return self.client.post("ptmkey_getPtmKeyByAccount", [account])
 
     def getPtmKeyByAccountAndBtype(self, account : str, btype : str) -> list:
         """
@@ -27,7 +28,7 @@ class Ptmkey:
             business type
         """
         params = [account, btype]
-        return client.Client(self.URI).post("ptmkey_getPtmKeyByAccountAndBtype", params)
+        return self.client.post("ptmkey_getPtmKeyByAccountAndBtype", params)
 
     def getPtmKeyUpdateBlock(self, account : str, btype : str, pubkey : str) -> dict:
         """
@@ -47,7 +48,7 @@ class Ptmkey:
             "btype" : btype,
             "pubkey" : pubkey
         }
-        return client.Client(self.URI).post("ptmkey_getPtmKeyUpdateBlock", [params])
+        return self.client.post("ptmkey_getPtmKeyUpdateBlock", [params])
 
     def getPtmKeyDeleteBlock(self, account : str, btype : str) -> dict:
         """
@@ -64,4 +65,4 @@ class Ptmkey:
             "account" : account,
             "btype" : btype
         }
-        return client.Client(self.URI).post("ptmkey_getPtmKeyDeleteBlock", [params])
\ No newline at end of file
+        return self.client.post("ptmkey_getPtmKeyDeleteBlock", [params])
\ No newline at end of file
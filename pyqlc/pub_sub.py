@@ -0,0 +1,67 @@
+from .utils.helper import as_client
+
+
+class Pub_Sub:
+    """
+    Node event subscriptions over the client's websocket (`WS`) connection
+
+    Each method returns a :class:`pyqlc.transport.Subscription` (awaited
+    with :class:`pyqlc.async_client.AsyncClient`). Events go to `callback`
+    if one is given, otherwise they are buffered for ``async for``; the
+    `buffer` and `overflow` options are described in
+    :class:`pyqlc.transport.Subscription`.
+    With :class:`pyqlc.client.Client` callbacks run on a background thread.
+    """
+    def __init__(self, client):
+        self.client = as_client(client)
+
+    def newBlock(self, callback=None, **options):
+        """
+        Subscribe to new blocks of the ledger
+        """
+        return self.client.subscribe(
+            "ledger", "newBlock", callback=callback, **options)
+
+    def newAccountBlock(self, address : str, callback=None, **options):
+        """
+        Subscribe to new blocks of an account
+
+        Parameters
+        ----------
+        address : str
+            the account address
+        """
+        return self.client.subscribe(
+            "ledger", "newAccountBlock", [address], callback=callback, **options)
+
+    def balanceChange(self, address : str, callback=None, **options):
+        """
+        Subscribe to balance changes of an account
+
+        Parameters
+        ----------
+        address : str
+            the account address
+        """
+        return self.client.subscribe(
+            "ledger", "balanceChange", [address], callback=callback, **options)
+
+    def newPending(self, address : str, callback=None, **options):
+        """
+        Subscribe to new pending (receivable) blocks of an account, instead of
+        polling `Ledger.accountsPending`
+
+        Parameters
+        ----------
+        address : str
+            the account address
+        """
+        return self.client.subscribe(
+            "ledger", "newPending", [address], callback=callback, **options)
+
+    def newPovBlock(self, callback=None, **options):
+        """
+        Subscribe to new PoV block headers
+        """
+        return self.client.subscribe(
+            "pov", "newBlock", callback=callback, **options)
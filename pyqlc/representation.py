@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Representation:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getAvailRewardInfo(self, account : str):
         """
@@ -13,7 +14,7 @@ class Representation:
         account : str
             representation address
         """
-        return client.Client(self.URI).post("rep_getAvailRewardInfo", [account])
+        return self.client.post("rep_getAvailRewardInfo", [account])
 
     def getRewardSendBlock(
         self,
@@ -59,7 +60,7 @@ class Representation:
             params["endHeight"] = k["endHeight"]
             params["rewardBlocks"] = k["rewardBlocks"]
 
-            return client.Client(self.URI).post("rep_getRewardSendBlock", [params])
+            return self.client.post("rep_getRewardSendBlock", [params])
 
     def getRewardRecvBlockBySendHash(self, sendHash : str):
         """
@@ -70,7 +71,7 @@ class Representation:
         sendHash : str
             contract send block hash
         """
-        return client.Client(self.URI).post("rep_getRewardRecvBlockBySendHash", [sendHash])
+        return self.client.post("rep_getRewardRecvBlockBySendHash", [sendHash])
 
     def getRewardRecvBlock(
         self,
@@ -181,7 +182,7 @@ class Representation:
             params["vote"] = k["vote"]
             params["work"] = k["work"]
 
-        return client.Client(self.URI).post("rep_getRewardRecvBlock", [params])
+        return self.client.post("rep_getRewardRecvBlock", [params])
 
     def getRewardHistory(self, account : str):
         """
@@ -192,4 +193,4 @@ class Representation:
         account : str
             representative's address
         """
-        return client.Client(self.URI).post("rep_getRewardHistory", [account])
\ No newline at end of file
+        return self.client.post("rep_getRewardHistory", [account])
\ No newline at end of file
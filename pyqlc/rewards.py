@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Rewards:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getReceiveRewardBlock(self, send_block_hash : str) -> dict:
         """
@@ -14,7 +15,7 @@ class Rewards:
             contract send block hash
         ----------
         """
-        return client.Client(self.URI).post("rewards_getReceiveRewardBlock", [send_block_hash])
+        return self.client.post("rewards_getReceiveRewardBlock", [send_block_hash])
 
     def getTotalRewards(self, tx_id : str) -> int:
         """
@@ -25,7 +26,7 @@ class Rewards:
         tx_id : str
              transaction id for the pledge
         """
-        return client.Client(self.URI).post("rewards_getTotalRewards", [tx_id])
+        return self.client.post("rewards_getTotalRewards", [tx_id])
 
     def getRewardsDetail(self, tx_id : str) -> list:
         """
@@ -36,7 +37,7 @@ class Rewards:
         tx_id : str
             transaction id for the pledge
         """
-        return client.Client(self.URI).post("rewards_getRewardsDetail", [tx_id])
+        return self.client.post("rewards_getRewardsDetail", [tx_id])
 
     def getConfidantRewards(self, confidant_address : str) -> dict:
         """
@@ -47,7 +48,7 @@ class Rewards:
         confidant_address : str
             confidant address
         """
-        return client.Client(self.URI).post("rewards_getConfidantRewards", [confidant_address])
+        return self.client.post("rewards_getConfidantRewards", [confidant_address])
 
     def getConfidantRewordsDetail(self, confidant_address : str) -> dict:
         """
@@ -58,4 +59,4 @@ class Rewards:
         confidant_address : str
             confidant address
         """
-        return client.Client(self.URI).post("rewards_getConfidantRewordsDetail", [confidant_address])  
\ No newline at end of file
+        return self.client.post("rewards_getConfidantRewordsDetail", [confidant_address])  
\ No newline at end of file
@@ -0,0 +1,261 @@
+import abc
+import itertools
+import threading
+from concurrent.futures import Future
+
+from .utils.exceptions import RPCError
+from . import (
+    account,
+    ledger,
+    contract,
+    mintage,
+    rewards,
+    net,
+    pov,
+#    pledge,
+    destroy,
+    miner,
+    representation,
+    pub_sub,
+    dpki,
+    settlement,
+    permission,
+    ptmkey,
+    kyc,
+    util
+#    dodsettlement
+)
+
+
+class _Module:
+    """
+    Class attribute that builds a module facade bound to the client on first
+    access and caches it on the instance
+    """
+    def __init__(self, cls):
+        self.cls = cls
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        module = self.cls(instance)
+        instance.__dict__[self.name] = module
+        return module
+
+
+class Facades(abc.ABC):
+    """
+    Base class giving a request sender the `Ledger`, `Pov`, ... module
+    facades. Subclasses implement ``post(method, params)``.
+    """
+    Account = _Module(account.Account)
+    Ledger = _Module(ledger.Ledger)
+    Contract = _Module(contract.Contract)
+    Mintage = _Module(mintage.Mintage)
+    Rewards = _Module(rewards.Rewards)
+    Net = _Module(net.Net)
+    Pov = _Module(pov.Pov)
+#    Pledge = _Module(pledge.Pledge)
+    Destroy = _Module(destroy.Destroy)
+    Miner = _Module(miner.Miner)
+    Representation = _Module(representation.Representation)
+    Pub_Sub = _Module(pub_sub.Pub_Sub)
+    DPKI = _Module(dpki.DPKI)
+    Settlement = _Module(settlement.Settlement)
+    Permissiom = _Module(permission.Permission)
+    Ptmkey = _Module(ptmkey.Ptmkey)
+    Kyc = _Module(kyc.Kyc)
+    Util = _Module(util.Util)
+#    DoDSettlement = _Module(dodsettlement.DoDSettlement)
+
+    @abc.abstractmethod
+    def post(self, method : str, params : list = None):
+        """
+        Send the call `method` with `params` and return its result
+        """
+
+    @abc.abstractmethod
+    def subscribe(self, namespace : str, event : str, params : list = None, callback=None, **options):
+        """
+        Subscribe to `event` of the node's `namespace` API, used by `Pub_Sub`
+        """
+
+
+def request(method : str, params, id : int) -> dict:
+    """
+    Build a JSON-RPC 2.0 request object
+    """
+    return {
+        "jsonrpc" : "2.0",
+        "id" : id,
+        "method": method,
+        "params" : params
+    }
+
+
+class RequestIds:
+    """
+    Thread-safe allocator of monotonically increasing JSON-RPC request ids
+
+    Each client owns one, so ids never repeat among its in-flight requests,
+    batches included.
+    """
+    def __init__(self, start : int = 1):
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> int:
+        with self._lock:
+            return next(self._counter)
+
+
+class InflightTable:
+    """
+    Requests sent but not answered yet, keyed by request id
+
+    Transports which carry many requests over one connection (batches,
+    pipelining, websockets) register a future per request with :meth:`add`
+    and hand every incoming response object to :meth:`resolve`, which
+    completes the matching future with it.
+    """
+    def __init__(self):
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, id) -> bool:
+        return id in self._futures
+
+    def add(self, id) -> Future:
+        """
+        Register request `id` and return the future its response will complete
+        """
+        future = Future()
+        with self._lock:
+            if id in self._futures:
+                raise ValueError("request id {} is already in flight".format(id))
+            self._futures[id] = future
+        return future
+
+    def resolve(self, item : dict) -> bool:
+        """
+        Complete the future waiting for response object `item`
+
+        Returns ``False`` if no request with the response's id is in flight.
+        """
+        with self._lock:
+            future = self._futures.pop(item.get("id"), None)
+        if future is None:
+            return False
+        future.set_result(item)
+        return True
+
+    def fail(self, id, exc : BaseException) -> bool:
+        """
+        Fail the future of request `id` with `exc`
+        """
+        with self._lock:
+            future = self._futures.pop(id, None)
+        if future is None:
+            return False
+        future.set_exception(exc)
+        return True
+
+    def fail_all(self, exc : BaseException):
+        """
+        Fail every in-flight request with `exc`, e.g. when the connection drops
+        """
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.set_exception(exc)
+
+
+def match_responses(requests : list, response) -> list:
+    """
+    Return the response object for each of `requests`, matched by id, or
+    ``None`` where the node sent no response for a request
+    """
+    if isinstance(response, dict):
+        # the node rejected the batch as a whole
+        return [dict(response, id=payload["id"]) for payload in requests]
+    by_id = {item.get("id"): item for item in response}
+    return [by_id.get(payload["id"]) for payload in requests]
+
+
+class Batch(Facades):
+    """
+    Collects calls made through its module facades and sends them as one
+    JSON-RPC batch request
+
+    Every call returns a :class:`concurrent.futures.Future` that is resolved
+    once the batch is sent, either with the call's result or with an
+    :class:`pyqlc.utils.exceptions.RPCError` for that call alone. The batch
+    is sent when the ``with`` block exits, or explicitly with :meth:`send`.
+
+    Only plain RPC wrappers can be batched; helpers which post-process a
+    response (e.g. `Ledger.generateSendBlock`) need the result right away.
+
+    Parameters
+    ----------
+    client : Client
+        client whose transport sends the batch
+    """
+    def __init__(self, client):
+        self.client = client
+        self._calls = []
+        self.results = []
+        self.errors = {}
+
+    def post(self, method : str, params : list = None) -> Future:
+        future = Future()
+        self._calls.append((request(method, params, next(self.client.ids)), future))
+        return future
+
+    def subscribe(self, namespace : str, event : str, params : list = None, callback=None, **options):
+        raise TypeError("subscriptions can't be batched, use the client's Pub_Sub")
+
+    def send(self) -> list:
+        """
+        Send all queued calls and return their results in call order
+
+        Failed calls have ``None`` in the returned list and their
+        :class:`RPCError` in :attr:`errors`, keyed by call index.
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return self.results
+
+        payloads = [payload for payload, _ in calls]
+        return self._resolve(calls, match_responses(payloads, self.client.transport.post(payloads)))
+
+    def _resolve(self, calls : list, items : list) -> list:
+        offset = len(self.results)
+        for idx, ((payload, future), item) in enumerate(zip(calls, items), offset):
+            if item is None:
+                error = RPCError({"message": "no response for request id {}".format(payload["id"])})
+            elif "error" in item and item["error"] is not None:
+                error = RPCError(item["error"])
+            else:
+                future.set_result(item.get("result"))
+                self.results.append(item.get("result"))
+                continue
+            future.set_exception(error)
+            self.results.append(None)
+            self.errors[idx] = error
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.send()
@@ -1,8 +1,9 @@
-from . import client
+from .utils.helper import as_client
+
 
 class Settlement:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def getSettlementRewardsBlock(self, ContractSend : str) -> dict:
         """
@@ -13,7 +14,7 @@ class Settlement:
         ContractSend : str
             ContractSend block hash
         """ 
-        return client.Client(self.URI).post("settlement_getSettlementRewardsBlock", [ContractSend])
+        return self.client.post("settlement_getSettlementRewardsBlock", [ContractSend])
 
     def getCreateContractBlock(
         self,
@@ -66,7 +67,7 @@ class Settlement:
             settlement contract end date
         """ 
         params = [partyA, partyB, services, startDate, endDate]
-        return client.Client(self.URI).post("settlement_getCreateContractBlock", params)
+        return self.client.post("settlement_getCreateContractBlock", params)
 
     def getSignContractBlock(self, contractAddress : str, address : str, **kwargs) -> list:
         """
@@ -88,7 +89,7 @@ class Settlement:
             params["contractAddress"] = k["contractAddress"]
             params["address"] = k["address"]
 
-        return client.Client(self.URI).post("settlement_getSignContractBlock", [params])
+        return self.client.post("settlement_getSignContractBlock", [params])
 
     def getTerminateContractBlock(self, contractAddress : str, address : str, request : bool, **kwargs) -> list:
         """
@@ -115,7 +116,7 @@ class Settlement:
             params["address"] = k["address"]
             params["request"] = k["request"]
 
-        return client.Client(self.URI).post("settlement_getTerminateContractBlock", [params])
+        return self.client.post("settlement_getTerminateContractBlock", [params])
 
 
     def getAddPreStopBlock(self, contractAddress : str, stopName : str, address : str, **kwargs) -> dict:
@@ -142,7 +143,7 @@ class Settlement:
             params["stopName"] = k["stopName"]
             params["request"] = k["request"]
         
-        return client.Client(self.URI).post("settlement_getAddPreStopBlock", [params])
+        return self.client.post("settlement_getAddPreStopBlock", [params])
 
     def getRemovePreStopBlock(self, contractAddress : str, stopName : str, address : str, **kwargs) -> dict:
         """
@@ -169,7 +170,7 @@ class Settlement:
             params["stopName"] = k["stopName"]
             params["address"] = k["address"]
         
-        return client.Client(self.URI).post("settlement_getRemovePreStopBlock", [params])
+        return self.client.post("settlement_getRemovePreStopBlock", [params])
 
 
     def getUpdatePreStopBlock(self, contractAddress : str, stopName : str, address : str, newName : str, **kwargs) -> dict:
@@ -201,7 +202,7 @@ class Settlement:
             params["address"] = k["address"]
             params["newName"] = k["newName"]
 
-        return client.Client(self.URI).post("settlement_getUpdatePreStopBlock", [params])
+        return self.client.post("settlement_getUpdatePreStopBlock", [params])
 
     def getAddNextStopBlock(self, contractAddress : str, stopName : str, address : str, **kwargs) -> dict:
         """
@@ -228,7 +229,7 @@ class Settlement:
             params["stopName"] = k["stopName"]
             params["address"] = k["address"]
 
-        return client.Client(self.URI).post("settlement_getAddNextStopBlock", [params])
+        return self.client.post("settlement_getAddNextStopBlock", [params])
 
 
     def getRemoveNextStopBlock(self, contractAddress : str, stopName : str, address : str, **kwargs) -> dict:
@@ -256,7 +257,7 @@ class Settlement:
             params["stopName"] = k["stopName"]
             params["address"] = k["address"]
 
-        return client.Client(self.URI).post("settlement_getRemoveNextStopBlock", [params])
+        return self.client.post("settlement_getRemoveNextStopBlock", [params])
 
     def getUpdateNextStopBlock(self, contractAddress : str, stopName : str, address : str, newName : str, **kwargs) -> dict:
         """
@@ -287,7 +288,7 @@ class Settlement:
             params["address"] = k["address"]
             params["newName"] = k["newName"]
         
-        return client.Client(self.URI).post("settlement_getUpdateNextStopBlock", [params])
+        return self.client.post("settlement_getUpdateNextStopBlock", [params])
 
     def getProcessCDRBlock(
         self,
@@ -364,4 +365,4 @@ class Settlement:
             params["preStop"] = k["preStop"]
             params["nextStop"] = k["nextStop"]
         
-        return client.Client(self.URI).post("settlement_getUpdateNextStopBlock", [params])
\ No newline at end of file
+        return self.client.post("settlement_getUpdateNextStopBlock", [params])
\ No newline at end of file
@@ -0,0 +1,113 @@
+import asyncio
+import copy
+import json
+import threading
+from concurrent.futures import Future
+
+# Calls whose every response must be unique to the caller: random values,
+# block submission, and the contract/ledger helpers building new blocks
+# (any method named "...Block" outside the pov namespace).
+DEFAULT_EXCLUDE = frozenset((
+    "account_newSeed", "account_newAccounts", "ledger_process",
+    "util_encrypt", "pov_submitWork"
+))
+
+
+class SingleFlight:
+    """
+    Shares one response among identical calls that are in flight at the same
+    time
+
+    The first caller of a (method, params) pair sends the request; callers
+    arriving before it completes wait for it and get a copy of its response
+    instead of sending their own. Nothing is kept once the call completes;
+    use :class:`pyqlc.cache.ResponseCache` for that.
+
+    Parameters
+    ----------
+    exclude : set
+        optional , methods that are always sent, default is :data:`DEFAULT_EXCLUDE`
+    """
+    def __init__(self, exclude : set = DEFAULT_EXCLUDE):
+        self.exclude = frozenset(exclude)
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def key(self, method : str, params):
+        """
+        Return the key identifying a call, or ``None`` if it must not be shared
+        """
+        if method in self.exclude:
+            return None
+        namespace, _, name = method.partition("_")
+        if name.endswith("Block") and namespace != "pov":
+            return None
+        return method + json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    def call(self, method : str, params, send):
+        """
+        Return ``send()``, or a copy of the response of an identical call
+        already in flight
+        """
+        key = self.key(method, params)
+        if key is None:
+            return send()
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            r = send()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+        # the caller may modify `r` while the others are still copying it
+        future.set_result(copy.deepcopy(r))
+        return r
+
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    :class:`SingleFlight` for coroutines running on one event loop
+    """
+    async def call(self, method : str, params, send):
+        """
+        Return ``await send()``, or a copy of the response of an identical
+        call already in flight
+        """
+        key = self.key(method, params)
+        if key is None:
+            return await send()
+
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            return copy.deepcopy(await asyncio.shield(future))
+
+        future = self._calls[key] = asyncio.get_event_loop().create_future()
+        try:
+            r = await send()
+        except Exception as e:
+            future.set_exception(e)
+            # don't warn about an exception nobody else was waiting for
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._calls[key]
+        future.set_result(copy.deepcopy(r))
+        return r
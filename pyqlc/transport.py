@@ -0,0 +1,428 @@
+import asyncio
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rpc import InflightTable, RequestIds, request
+from .utils.exceptions import RPCError
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_TIMEOUT = 30
+DEFAULT_ASYNC_POOL_MAXSIZE = 100
+DEFAULT_SUBSCRIPTION_BUFFER = 1000
+
+
+class HTTPTransport:
+    """
+    Keep-alive HTTP transport for JSON-RPC calls to a QLC node.
+
+    Connections are kept in a ``urllib3`` pool and reused across calls,
+    so only the first request to a host pays for the TCP/TLS handshake.
+    One instance can be shared by any number of threads.
+
+    Parameters
+    ----------
+    URI : str
+        node RPC endpoint
+    pool_connections : int
+        number of hosts to keep connection pools for
+    pool_maxsize : int
+        maximum number of connections kept open per host
+    timeout : float
+        socket timeout in seconds for every request
+    """
+    def __init__(
+        self,
+        URI : str,
+        pool_connections : int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize : int = DEFAULT_POOL_MAXSIZE,
+        timeout : float = DEFAULT_TIMEOUT):
+        self.URI = URI
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def post(self, payload, timeout=None):
+        """
+        Send a JSON-RPC payload and return the decoded JSON response
+
+        Parameters
+        ----------
+        payload : dict or list
+            single request object or a batch (list of request objects)
+        timeout : float or tuple
+            optional , timeout for this request instead of :attr:`timeout`,
+            as accepted by ``requests``
+        """
+        r = self._session.post(self.URI, json=payload, timeout=timeout or self.timeout)
+        return r.json()
+
+    def warm_up(self, connections : int = 1):
+        """
+        Open `connections` keep-alive connections ahead of the first call
+
+        Parameters
+        ----------
+        connections : int
+            number of connections to open, capped at the pool size
+        """
+        connections = max(1, min(connections, self.pool_maxsize))
+        payload = {"jsonrpc": "2.0", "id": 0, "method": "pov_getLatestHeader", "params": None}
+
+        def _touch():
+            try:
+                self._session.post(self.URI, json=payload, timeout=self.timeout).close()
+            except requests.RequestException:
+                pass
+
+        threads = [threading.Thread(target=_touch) for _ in range(connections)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def close(self):
+        """
+        Close all pooled connections
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHTTPTransport:
+    """
+    Non-blocking keep-alive HTTP transport for JSON-RPC calls, built on
+    ``aiohttp`` (``pip install pyqlc[async]``)
+
+    Any number of requests can be awaited at once; at most `pool_maxsize`
+    of them are on the wire at a time, the rest wait for a free connection.
+    The underlying session is opened on first use and belongs to the event
+    loop that was running then.
+
+    Parameters
+    ----------
+    URI : str
+        node RPC endpoint
+    pool_maxsize : int
+        maximum number of connections kept open to the node
+    timeout : float
+        total timeout in seconds for every request
+    """
+    def __init__(
+        self,
+        URI : str,
+        pool_maxsize : int = DEFAULT_ASYNC_POOL_MAXSIZE,
+        timeout : float = DEFAULT_TIMEOUT):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncHTTPTransport requires aiohttp, install it with `pip install pyqlc[async]`")
+
+        self._aiohttp = aiohttp
+        self.URI = URI
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize, limit_per_host=self.pool_maxsize),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def post(self, payload):
+        """
+        Send a JSON-RPC payload and return the decoded JSON response
+
+        Parameters
+        ----------
+        payload : dict or list
+            single request object or a batch (list of request objects)
+        """
+        async with self._get_session().post(self.URI, json=payload) as r:
+            return await r.json(content_type=None)
+
+    async def warm_up(self, connections : int = 1):
+        """
+        Open `connections` keep-alive connections ahead of the first call
+        """
+        connections = max(1, min(connections, self.pool_maxsize))
+        payload = {"jsonrpc": "2.0", "id": 0, "method": "pov_getLatestHeader", "params": None}
+        await asyncio.gather(
+            *(self.post(payload) for _ in range(connections)), return_exceptions=True)
+
+    async def close(self):
+        """
+        Close all pooled connections
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class Subscription:
+    """
+    Stream of notifications for one node subscription
+
+    Events are either passed to `callback` as they arrive (a coroutine
+    function is awaited before the next message is read) or buffered for
+    ``async for event in subscription``. The buffer holds at most `buffer`
+    events; when it is full, `overflow` decides what happens:
+
+    ``"block"``
+        stop reading from the websocket until the consumer catches up, so
+        the node is slowed down instead of events being lost. Responses to
+        RPC calls on the same connection wait as well.
+    ``"drop_oldest"``
+        discard the oldest buffered event and count it in :attr:`dropped`
+    """
+    def __init__(self, transport, namespace : str, id : str, callback=None,
+                 buffer : int = DEFAULT_SUBSCRIPTION_BUFFER, overflow : str = "block"):
+        if overflow not in ("block", "drop_oldest"):
+            raise ValueError("overflow must be 'block' or 'drop_oldest'")
+
+        self.transport = transport
+        self.namespace = namespace
+        self.id = id
+        self.callback = callback
+        self.overflow = overflow
+        self.dropped = 0
+        self.closed = False
+        self._queue = asyncio.Queue(maxsize=buffer)
+
+    async def _deliver(self, event):
+        if self.callback is not None:
+            result = self.callback(event)
+            if asyncio.iscoroutine(result):
+                await result
+            return
+        if self.overflow == "drop_oldest" and self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        await self._queue.put(event)
+
+    def _end(self):
+        self.closed = True
+        if not self._queue.full():
+            # wakes up a consumer waiting on an empty buffer
+            self._queue.put_nowait(_END)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is _END:
+            raise StopAsyncIteration
+        return event
+
+    async def unsubscribe(self) -> bool:
+        """
+        Cancel the subscription on the node and end the event stream
+        """
+        return await self.transport.unsubscribe(self)
+
+
+_END = object()
+
+
+class WebSocketTransport:
+    """
+    JSON-RPC transport over one websocket connection, built on ``aiohttp``
+    (``pip install pyqlc[async]``)
+
+    Any number of calls and subscriptions share the connection: responses
+    are matched to their calls by id through an
+    :class:`pyqlc.rpc.InflightTable` and notifications are routed to their
+    :class:`Subscription`. The connection is opened on first use; if it
+    drops, pending calls fail with :class:`ConnectionError` and all
+    subscriptions end.
+
+    Parameters
+    ----------
+    WS : str
+        node websocket endpoint
+    ids : RequestIds
+        optional , id allocator to share with the owning client
+    timeout : float
+        timeout in seconds for opening the connection
+    """
+    def __init__(self, WS : str, ids : RequestIds = None, timeout : float = DEFAULT_TIMEOUT):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "WebSocketTransport requires aiohttp, install it with `pip install pyqlc[async]`")
+
+        self._aiohttp = aiohttp
+        self.WS = WS
+        self.timeout = timeout
+        self.ids = ids if ids is not None else RequestIds()
+        self.inflight = InflightTable()
+        self._subscriptions = {}
+        self._subscribing = {}
+        self._session = None
+        self._ws = None
+        self._reader = None
+        self._connect_lock = None
+
+    async def _connect(self):
+        if self._ws is not None and not self._ws.closed:
+            return self._ws
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._ws is None or self._ws.closed:
+                if self._session is None or self._session.closed:
+                    self._session = self._aiohttp.ClientSession(
+                        timeout=self._aiohttp.ClientTimeout(connect=self.timeout))
+                self._ws = await self._session.ws_connect(self.WS, heartbeat=self.timeout)
+                self._reader = asyncio.ensure_future(self._read(self._ws))
+        return self._ws
+
+    async def _read(self, ws):
+        try:
+            async for msg in ws:
+                if msg.type != self._aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                for item in data if isinstance(data, list) else [data]:
+                    await self._dispatch(item)
+        finally:
+            self.inflight.fail_all(ConnectionError("websocket connection to {} closed".format(self.WS)))
+            subscriptions, self._subscriptions = self._subscriptions, {}
+            for subscription in subscriptions.values():
+                subscription._end()
+
+    async def _dispatch(self, item : dict):
+        if item.get("id") is not None:
+            subscription = self._subscribing.pop(item["id"], None)
+            if subscription is not None and item.get("result") is not None:
+                # register before reading on, the first notification may be next
+                subscription.id = item["result"]
+                self._subscriptions[subscription.id] = subscription
+            self.inflight.resolve(item)
+            return
+
+        method = item.get("method") or ""
+        params = item.get("params") or {}
+        if not method.endswith("_subscription"):
+            return
+        subscription = self._subscriptions.get(params.get("subscription"))
+        if subscription is not None:
+            await subscription._deliver(params.get("result"))
+
+    async def post(self, payload):
+        """
+        Send a JSON-RPC payload and return the response object, or the list
+        of response objects for a batch
+        """
+        ws = await self._connect()
+        batch = isinstance(payload, list)
+        futures = [self.inflight.add(p["id"]) for p in (payload if batch else [payload])]
+        try:
+            await ws.send_str(json.dumps(payload))
+        except Exception as e:
+            for p in payload if batch else [payload]:
+                self.inflight.fail(p["id"], e)
+        items = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        return list(items) if batch else items[0]
+
+    async def subscribe(self, namespace : str, event : str, params : list = None, callback=None,
+                        buffer : int = DEFAULT_SUBSCRIPTION_BUFFER, overflow : str = "block") -> Subscription:
+        """
+        Subscribe to `event` of the node's `namespace` API (e.g. ``"ledger"``,
+        ``"newBlock"``) and return the :class:`Subscription`
+        """
+        subscription = Subscription(self, namespace, None, callback=callback, buffer=buffer, overflow=overflow)
+        payload = request(namespace + "_subscribe", [event] + list(params or []), next(self.ids))
+        self._subscribing[payload["id"]] = subscription
+        try:
+            r = await self.post(payload)
+        finally:
+            self._subscribing.pop(payload["id"], None)
+        if r.get("error") is not None:
+            raise RPCError(r["error"])
+        return subscription
+
+    async def unsubscribe(self, subscription : Subscription) -> bool:
+        """
+        Cancel `subscription` on the node and end its event stream
+        """
+        if self._subscriptions.pop(subscription.id, None) is None:
+            return False
+        subscription._end()
+        r = await self.post(request(subscription.namespace + "_unsubscribe", [subscription.id], next(self.ids)))
+        return bool(r.get("result"))
+
+    async def close(self):
+        """
+        Close the connection, failing pending calls and ending subscriptions
+        """
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(URI : str, pool_maxsize : int = None) -> HTTPTransport:
+    """
+    Return the process-wide shared transport for `URI`, creating it on first use
+
+    Parameters
+    ----------
+    URI : str
+        node RPC endpoint
+    pool_maxsize : int
+        optional , pool size per host, only used when the transport is
+        created; asking for another size than the existing transport's
+        raises ValueError, pass your own :class:`HTTPTransport` instead
+    """
+    with _transports_lock:
+        transport = _transports.get(URI)
+        if transport is None:
+            transport = HTTPTransport(URI, pool_maxsize=pool_maxsize or DEFAULT_POOL_MAXSIZE)
+            _transports[URI] = transport
+        elif pool_maxsize is not None and transport.pool_maxsize != pool_maxsize:
+            raise ValueError("the shared transport for {} has pool_maxsize={}, not {}".format(
+                URI, transport.pool_maxsize, pool_maxsize))
+        return transport
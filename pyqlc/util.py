@@ -1,10 +1,10 @@
-from . import client
+from .utils.helper import as_client
 
 QLC_UNITS = ["qlc", "Kqlc", "QLC", "MQLC"]
 
 class Util:
-    def __init__(self, URI):
-        self.URI = URI
+    def __init__(self, client):
+        self.client = as_client(client)
 
     def decrypt(self, cryptograph : str, passphrase : str, local : bool = False) -> str:
         """
@@ -21,7 +21,7 @@ class Util:
         """
         params = [cryptograph, passphrase]
         if not local:
-            return client.Client(self.URI).post("util_decrypt", params)
+            return self.client.post("util_decrypt", params)
 
     def encrypt(self, raw_data : str, passphrase : str, local : bool = False) -> str:
         """
@@ -38,7 +38,7 @@ class Util:
         """
         params = [raw_data, passphrase]
         if not local:      
-            return client.Client(self.URI).post("util_encrypt", params)
+            return self.client.post("util_encrypt", params)
 
     def rawToBalance(self, raw_value : str, unit : str, token_name : str = "QLC", local : bool = False) -> str:
         """
@@ -61,7 +61,7 @@ class Util:
             raise Exception("Invalid Unit")
 
         if not local:
-            return client.Client(self.URI).post("util_rawToBalance", params)
+            return self.client.post("util_rawToBalance", params)
 
     def balanceToRaw(self, balance : str, unit : str, token_name : str = "QLC", local : bool = False) -> str:
         """
@@ -84,4 +84,4 @@ class Util:
             raise Exception("Invalid Unit")
 
         if not local:
-            return client.Client(self.URI).post("util_balanceToRaw", params)
\ No newline at end of file
+            return self.client.post("util_balanceToRaw", params)
\ No newline at end of file
@@ -1,25 +1,40 @@
 from .crypto import (
     sign,
     validate_private_key,
-    get_secret_key_from_privKey
+    get_secret_key_from_privKey,
+    address_to_public_key
 )
 
 from .work import(
-    validate_work, solve_work
+    validate_work, solve_work, validate_difficulty, derive_work_difficulty, get_backend
 )
 
 from .exceptions import (
-    InvalidWork, InvalidBlockHash
+    InvalidWork, InvalidBlockHash, InvalidBlock
 )
 
 from.helper import is_hex
+from array import array
+from base64 import b64decode
+from binascii import unhexlify
+from hashlib import blake2b
 import json
+import struct
 
 BLOCK_TYPES = (
     "Change", "ContractRefund", "ContractReward", "ContractSend",
     "Online", "Open", "Recieve", "Send"
 )
 
+# byte values of the node's BlockType enum, hashed as the first byte
+BLOCK_TYPE_IDS = {
+    "state": 0, "send": 1, "receive": 2, "recieve": 2, "change": 3, "open": 4,
+    "contractreward": 5, "contractsend": 6, "contractrefund": 7, "contracterror": 8,
+    "smartcontract": 9, "invalid": 10, "online": 11
+}
+
+ZERO_HASH = bytes(32)
+
 
 REQ_BLOCK_PARAMS = (
     "type", "token", "address", "balance", "vote",
@@ -29,9 +44,12 @@ REQ_BLOCK_PARAMS = (
 )
 
 
+PRIVATE_BLOCK_PARAMS = ("privatefrom", "privatefor", "privategroupid")
+
+
 BLOCK_PARAMS = REQ_BLOCK_PARAMS + (
-    "privatefrom", "privatefor", "privategroupid"
-)
+    "sender", "receiver", "data"
+) + PRIVATE_BLOCK_PARAMS
 
 WORKSIZE = 8
 WORKTRESHOLD = "fffffe0000000000"
@@ -122,8 +140,62 @@ class Block:
         self.signature = s
 
 
+    def serialize(self) -> bytes:
+        """Return the bytes the node hashes for this block, in the order of
+        go-qlc's ``StateBlock.GetHash``
+
+        Balances are minimal big-endian integers, the timestamp and PoV
+        height 8-byte big-endian, addresses their public keys; hashes not
+        set are zero and ``sender``, ``receiver`` and ``data`` are the
+        base64 strings the node returns them as.
+
+        Private blocks (``privatefrom``, ``privatefor`` or
+        ``privategroupid`` set) are not supported and raise
+        :class:`InvalidBlock`; ask the node for their hash instead.
+        """
+        type_id = BLOCK_TYPE_IDS.get(str(self.type).lower())
+        if type_id is None:
+            raise InvalidBlock("Unknown block type: {}".format(self.type))
+        private = [k for k in PRIVATE_BLOCK_PARAMS if getattr(self, k)]
+        if private:
+            raise InvalidBlock("Can't hash a private block locally ({} set)".format(", ".join(private)))
+
+        return b"".join((
+            bytes((type_id,)),
+            _hash_bytes(self.token),
+            _public_key_bytes(self.address),
+            _amount_bytes(self.balance),
+            _amount_bytes(self.vote),
+            _amount_bytes(self.network),
+            _amount_bytes(self.storage),
+            _amount_bytes(self.oracle),
+            _hash_bytes(self.previous),
+            _hash_bytes(self.link),
+            b64decode(self.sender or ""),
+            b64decode(self.receiver or ""),
+            _hash_bytes(self.message),
+            b64decode(self.data or ""),
+            struct.pack(">q", int(self.timestamp or 0)),
+            struct.pack(">Q", int(self.povHeight or 0)),
+            _hash_bytes(self.extra),
+            _public_key_bytes(self.representative)
+        ))
+
+
+    def compute_hash(self) -> str:
+        """Return the hash of this block as the node computes it, without
+        asking the node
+        """
+        return blake2b(self.serialize(), digest_size=32).hexdigest()
+
+
     @property
     def block_hash(self):
+        """The hash set on this block, or else the one computed from its
+        fields by :meth:`compute_hash`
+        """
+        if self._block_hash is None:
+            return self.compute_hash()
         return self._block_hash 
 
 
@@ -135,25 +207,70 @@ class Block:
             self._block_hash = hash
 
 
-    def verify_work(self):
+    def isOpen(self) -> bool:
+        """Whether this is the first block of its account chain, which has
+        a zero `previous`
+        """
+        return not self.previous or int(self.previous, 16) == 0
+
+
+    @property
+    def root(self):
+        """The hash the proof-of-work is computed over: `previous`, or the
+        public key of `address` for an open block
+        """
+        if self.isOpen():
+            return address_to_public_key(self.address).decode()
+        return self.previous
+
+
+    @staticmethod
+    def work_difficulty(difficulty=None, multiplier=None):
+        """Return the work difficulty to solve for: `difficulty` (default
+        is the network threshold), scaled by `multiplier` if given
+        """
+        if difficulty is None:
+            difficulty = WORKTRESHOLD
+        difficulty = validate_difficulty(difficulty)
+        if multiplier is not None:
+            difficulty = derive_work_difficulty(multiplier, base_difficulty=difficulty)
+        return difficulty
+
+
+    def verify_work(self, difficulty=None, multiplier=None):
         if not self.work:
             raise ValueError("Work hasn't been added to this block")
 
-        validate_work(self.block_hash, self.work)
+        validate_work(self.root, self.work, self.work_difficulty(difficulty, multiplier))
 
-    def solve_work(self, difficulty=None, timeout=None):
+    def solve_work(self, difficulty=None, timeout=None, threads=1, cancel=None, multiplier=None, servers=None,
+                   pool=None):
         """Solve the work contained in this block and update the Block
         instance to include the work
+
+        The work is solved for :attr:`root` and `difficulty`, the network
+        threshold by default; `multiplier` scales it the way
+        :func:`pyqlc.utils.work.derive_work_difficulty` does.
+
+        `threads` workers search the nonce space in parallel, ``None`` for
+        one per CPU. Solving stops early when `cancel`, a
+        :class:`pyqlc.utils.work.CancelToken`, is cancelled. With `servers`,
+        work server URLs, the work is asked of them before solving locally.
+        With `pool`, a :class:`pyqlc.work_pool.WorkPool`, it is solved by the
+        pool's worker processes instead of `threads`.
         """
+        difficulty = self.work_difficulty(difficulty, multiplier)
+
         if self.work:
             try:
-                self.verify_work()
+                self.verify_work(difficulty)
                 raise ValueError("Block already has a valid proof-of-work")
             except InvalidWork:
                 pass
 
         result = solve_work(
-            block_hash=self.previous)
+            block_hash=self.root, difficulty=difficulty, timeout=timeout,
+            threads=threads, cancel=cancel, servers=servers, pool=pool)
 
         if result:
             self.work = result
@@ -162,24 +279,40 @@ class Block:
         return False
 
 
+def hash_many(blocks):
+    """Return the hashes of `blocks`, :class:`Block` instances or dicts,
+    as :meth:`Block.compute_hash` does
+
+    The blocks are serialized, then hashed in one call to the C extension
+    with the GIL released, so other threads keep running meanwhile.
+    """
+    serialized = [
+        (block if isinstance(block, Block) else Block.from_dict(block)).serialize()
+        for block in blocks
+    ]
+    try:
+        work_module = get_backend()
+    except ImportError:
+        return [blake2b(data, digest_size=32).hexdigest() for data in serialized]
+
+    digests = work_module.blake2b_many(b"".join(serialized), array("I", map(len, serialized)))
+    return [digests[i:i + 32].hex() for i in range(0, len(digests), 32)]
+
+
+def _hash_bytes(value):
+    if not value:
+        return ZERO_HASH
+    if len(value) != 64 or not is_hex(value):
+        raise InvalidBlock("Expected a 64-character hex string, got {!r}".format(value))
+    return unhexlify(value)
+
+
+def _public_key_bytes(address):
+    if not address:
+        return ZERO_HASH
+    return unhexlify(address_to_public_key(address))
+
 
-#    def _root(self):
-#        if self.isOpen():
-#            return self.address_to_hash()
-#        else:
-#            self.previous
-#
-#        
-#    def isOpen(self) -> bool:
-#        return _isZero(self.previous)
-#    
-#
-#    def address_to_hash(self):
-#        pass
-#
-#
-#def _isZero(string) -> bool:
-#    for b in string:
-#        if b != 0:
-#            return False
-#    return True
\ No newline at end of file
+def _amount_bytes(value):
+    value = int(value or 0)
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
@@ -1,5 +1,10 @@
+import os
 import struct
+import threading
 from base64 import b32encode, b32decode
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from hashlib import blake2b
 from ed25519_blake2b import BadSignatureError, SigningKey, VerifyingKey
 from binascii import hexlify, unhexlify
@@ -11,6 +16,17 @@ ADDRESSLEN = 60
 ADDRESSPREFIXLEN = len(ADDRESSPREFIX)
 HEXADDRESSLENGHT = ADDRESSPREFIXLEN + ADDRESSLEN
 PUBLICKEYSIZEINBYTES = 32
+SIGNER_CACHE_SIZE = 256
+VERIFYING_KEY_CACHE_SIZE = 4096
+# below this many signatures, verify_many doesn't fan out to processes
+VERIFY_MANY_INLINE = 512
+SIGNATURESIZEINBYTES = 64
+ADDRESS_CACHE_SIZE = 65536
+
+try:
+    from .. import _address
+except ImportError:
+    _address = None
 
 maketrans = hasattr(bytes, 'maketrans') and bytes.maketrans 
 B32_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
@@ -74,6 +90,10 @@ def public_key_to_address(public_key : bytes):
         if not len(public_key) == PUBLICKEYSIZEINBYTES:
             raise InvalidPublicKey('public key must be 32 chars')
 
+    return _encode_address(public_key)
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _encode_address(public_key : bytes):
     padded = b'000' + public_key
     address = b32qlc_encode(padded)[4:]
     checksum = b32qlc_encode(address_checksum(public_key))
@@ -81,17 +101,91 @@ def public_key_to_address(public_key : bytes):
     return ADDRESSPREFIX + address.decode('utf-8') + checksum.decode('utf-8')
 
 def address_to_public_key(address : str):
-    validate_qlc_address(address)
+    key_bytes = _decode_address(address) if isinstance(address, str) else None
+    if key_bytes is None:
+        raise InvalidQLCAddress(f"invalid address: {address}")
+
+    return hexlify(key_bytes)
 
-    address = bytes(address, "utf-8")
-    key_b32qlc = b'1111' + address[4:56]
-    key_bytes = b32qlc_decode(key_b32qlc)[3:]
-    checksum = address[56:]
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _decode_address(address : str):
+    """
+    Return the public key in bytes of `address`, or None if it isn't valid
+    """
+    return _address_key(address)
 
-    if b32qlc_encode(address_checksum(key_bytes)) != checksum:
-        raise InvalidQLCAddress(f"invalid address, invalid checksum: {address}")
+def _address_key(address):
+    # the first character holds 4 zero bits and the key's first bit
+    if (not isinstance(address, str) or len(address) != HEXADDRESSLENGHT
+            or not address.startswith(ADDRESSPREFIX) or address[4] not in "13"):
+        return None
+    # non-ASCII characters become "?", which is outside the alphabet
+    encoded = address.encode("ascii", "replace")[ADDRESSPREFIXLEN:]
+    # deleting the alphabet through the bytes translation table leaves
+    # only the characters outside of it
+    if encoded.translate(None, QLC_ALPHABET):
+        return None
+    # one decode for the key and the checksum, behind 20 zero bits
+    decoded = b32qlc_decode(b'1111' + encoded)
+    key_bytes = decoded[3:35]
+    if address_checksum(key_bytes) != decoded[35:]:
+        return None
+    return key_bytes
 
-    return hexlify(key_bytes)
+def addresses_from_public_keys(public_keys):
+    """
+    Return the addresses of many public keys
+    :param public_keys: the 32-byte public keys, one after the other in a
+                        bytes-like object
+    :return: the addresses, in the same order
+    :rtype: list
+    """
+    public_keys = bytes(public_keys)
+    if len(public_keys) % PUBLICKEYSIZEINBYTES:
+        raise ValueError("public_keys must be a multiple of 32 bytes long")
+
+    if _address is not None:
+        data = _address.encode(public_keys).decode("ascii")
+        return [data[i:i + HEXADDRESSLENGHT] for i in range(0, len(data), HEXADDRESSLENGHT)]
+    return [
+        _encode_address(public_keys[i:i + PUBLICKEYSIZEINBYTES])
+        for i in range(0, len(public_keys), PUBLICKEYSIZEINBYTES)
+    ]
+
+def public_keys_from_addresses(addresses):
+    """
+    Return the public keys of many addresses, without raising for the
+    invalid ones
+    :param addresses: the addresses
+    :return: ``(public_keys, bitmap)``: the 32-byte public keys one after
+             the other, zero for invalid addresses, and a bitmap with bit
+             ``i % 8`` of byte ``i // 8`` set if address ``i`` is valid
+    :rtype: tuple(bytes, bytearray)
+
+    The ``pyqlc._address`` C extension converts them all in one call when
+    it is built; otherwise they go through an LRU of recently decoded
+    addresses.
+    """
+    if _address is not None:
+        invalid = "!" * HEXADDRESSLENGHT
+        packed = "".join(
+            a if isinstance(a, str) and len(a) == HEXADDRESSLENGHT else invalid for a in addresses)
+        # keeps one byte per character, non-ASCII ones become invalid "?"
+        return _address.decode(packed.encode("ascii", "replace"))
+
+    keys = []
+    bitmap = bytearray()
+    for i, address in enumerate(addresses):
+        if i % 8 == 0:
+            bitmap.append(0)
+        # non-strings may be unhashable, keep them away from the LRU
+        key_bytes = _decode_address(address) if isinstance(address, str) else None
+        if key_bytes is None:
+            keys.append(bytes(PUBLICKEYSIZEINBYTES))
+        else:
+            keys.append(key_bytes)
+            bitmap[-1] |= 1 << (i & 7)
+    return b"".join(keys), bitmap
 
 def b32qlc_encode(value):
     """
@@ -134,7 +228,7 @@ def verify_signature(message, signature, public_key):
     validate_public_key(public_key)
     validate_signature(signature)
 
-    vk = VerifyingKey(unhexlify(public_key))
+    vk = _verifying_key(unhexlify(public_key))
     try:
         vk.verify(
             sig=unhexlify(signature),
@@ -143,6 +237,74 @@ def verify_signature(message, signature, public_key):
     except BadSignatureError:
         raise InvalidSignature("Signature couldn't be verified")
 
+@lru_cache(maxsize=VERIFYING_KEY_CACHE_SIZE)
+def _verifying_key(public_key : bytes):
+    return VerifyingKey(public_key)
+
+def verify_many(messages, signatures, public_keys, message_size : int = 32, processes : int = None):
+    """
+    Verify many signatures at once, without raising for the invalid ones
+    :param messages: the messages, each `message_size` bytes, one after
+                     the other in a bytes-like object
+    :param signatures: the 64-byte signatures, in the same order
+    :param public_keys: the 32-byte public keys, in the same order
+    :param int message_size: size of every message in bytes, 32 for block hashes
+    :param int processes: worker processes to verify in, default is one
+                          per CPU; small inputs are verified in this process
+    :return: bitmap of the results, bit ``i % 8`` of byte ``i // 8`` is set
+             if signature ``i`` is valid
+    :rtype: bytearray
+    """
+    messages, signatures, public_keys = bytes(messages), bytes(signatures), bytes(public_keys)
+    count = len(signatures) // SIGNATURESIZEINBYTES
+    if len(signatures) != count * SIGNATURESIZEINBYTES:
+        raise ValueError("signatures must be a multiple of 64 bytes long")
+    if len(public_keys) != count * PUBLICKEYSIZEINBYTES or len(messages) != count * message_size:
+        raise ValueError("messages, signatures and public keys must be as many")
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or count < VERIFY_MANY_INLINE:
+        return _verify_chunk(messages, signatures, public_keys, message_size)
+
+    # whole bytes of the bitmap per chunk, a few chunks per process
+    size = -(-count // (processes * 4) // 8) * 8
+    chunks = [
+        (messages[i * message_size:(i + size) * message_size],
+         signatures[i * SIGNATURESIZEINBYTES:(i + size) * SIGNATURESIZEINBYTES],
+         public_keys[i * PUBLICKEYSIZEINBYTES:(i + size) * PUBLICKEYSIZEINBYTES])
+        for i in range(0, count, size)
+    ]
+    bitmap = bytearray()
+    for part in _verify_pool(processes).map(_verify_chunk, *zip(*chunks), [message_size] * len(chunks)):
+        bitmap += part
+    return bitmap
+
+def _verify_chunk(messages, signatures, public_keys, message_size):
+    count = len(signatures) // SIGNATURESIZEINBYTES
+    bitmap = bytearray((count + 7) // 8)
+    for i in range(count):
+        vk = _verifying_key(public_keys[i * PUBLICKEYSIZEINBYTES:(i + 1) * PUBLICKEYSIZEINBYTES])
+        try:
+            vk.verify(
+                sig=signatures[i * SIGNATURESIZEINBYTES:(i + 1) * SIGNATURESIZEINBYTES],
+                msg=messages[i * message_size:(i + 1) * message_size]
+            )
+        except (BadSignatureError, ValueError):
+            continue
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return bitmap
+
+_verify_pools = {}
+_verify_pools_lock = threading.Lock()
+
+def _verify_pool(processes):
+    with _verify_pools_lock:
+        pool = _verify_pools.get(processes)
+        if pool is None:
+            pool = _verify_pools[processes] = ProcessPoolExecutor(processes)
+        return pool
+
 def sign(message, private_key):
     """
     Signs a `message` using `private_key` and `public_key`
@@ -152,18 +314,182 @@ def sign(message, private_key):
     :type message: bytes
     :param private_key: private key used to sign message
     :type private_key: bytes
+    :raises InvalidPrivateKey: If the private key is invalid
     :return: the signature of the signed message
     :rtype: bytes
+
+    The decoded keys of the last :data:`SIGNER_CACHE_SIZE` private keys
+    used are kept in memory for the next calls, see :class:`SignerCache`.
+    :func:`clear_signer_cache` wipes them, ``set_signer_cache_size(0)``
+    stops keeping them.
     """
-    private_key  = get_secret_key_from_privKey(private_key)
-    validate_private_key(private_key)
+    return _signers.sign(private_key, message)
 
-    sk = SigningKey(unhexlify(private_key))
-    sig = sk.sign(msg=unhexlify(message))
-    signature = hexlify(sig).decode()
+def clear_signer_cache():
+    """
+    Wipe and drop the keys kept by :func:`sign`
+    """
+    _signers.clear()
 
-    validate_signature(signature)
-    return signature
+def set_signer_cache_size(max_entries : int):
+    """
+    Set how many keys :func:`sign` keeps, wiping those beyond it
+    :param int max_entries: maximum number of keys kept, 0 to keep none:
+                            each call then wipes its copy of the key
+                            before returning
+    """
+    _signers.resize(max_entries)
+
+
+class Signer:
+    """
+    Signs messages with one private key
+
+    The key is decoded and its public half derived once, instead of on
+    every :func:`sign` call. The signer keeps its own copy of the secret
+    seed, which :meth:`wipe` overwrites with zeros; the signer can't be
+    used afterwards. Only that copy is wiped: the private key string given
+    here, and the short-lived copies handed to ``ed25519_blake2b`` (which
+    only accepts immutable bytes) when signing, are not.
+    :param private_key: private key as a 64-character hex string, or the
+                        128-character one holding the public key as well
+    """
+    def __init__(self, private_key):
+        private_key = get_secret_key_from_privKey(private_key)
+        try:
+            self._seed = bytearray(unhexlify(private_key))
+        except ValueError:
+            # is_hex() lets a "0x" prefix or surrounding spaces through
+            raise InvalidPrivateKey("Account private key must be a 64-character hexadecimal string")
+        self._lock = threading.Lock()
+        self._public_key = SigningKey(bytes(self._seed)).vk_s
+        self.public_key = hexlify(self._public_key).decode()
+
+    def sign(self, message):
+        """
+        Sign `message`, a hex string, and return the signature as a hex string
+        :raises ValueError: if the signer was wiped
+        """
+        msg = unhexlify(message)
+        with self._lock:
+            if self._seed is None:
+                raise ValueError("Signer was wiped")
+            # seed and public key together, so the public key isn't derived again
+            sig = SigningKey(bytes(self._seed) + self._public_key).sign(msg=msg)
+        return hexlify(sig).decode()
+
+    def wipe(self):
+        """
+        Overwrite this signer's copy of the secret seed with zeros and drop it
+        """
+        with self._lock:
+            seed, self._seed = self._seed, None
+        if seed is not None:
+            seed[:] = bytes(len(seed))
+
+    @property
+    def wiped(self):
+        return self._seed is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.wipe()
+
+
+class SignerCache:
+    """
+    Bounded LRU of :class:`Signer` objects, keyed by a hash of their
+    private key so the cache doesn't hold the keys themselves
+
+    Signers evicted beyond `max_entries`, or dropped by :meth:`clear`, are
+    wiped.
+    :param int max_entries: maximum number of signers kept, 0 to keep none
+    """
+    def __init__(self, max_entries : int = SIGNER_CACHE_SIZE):
+        if max_entries < 0:
+            raise ValueError("max_entries can't be negative")
+        self.max_entries = max_entries
+        self._signers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._signers)
+
+    def get(self, private_key):
+        """
+        Return the signer for `private_key`, creating it on first use
+        :raises InvalidPrivateKey: If the private key is invalid
+        """
+        secret = get_secret_key_from_privKey(private_key)
+        if isinstance(secret, str):
+            secret = secret.encode()
+        key = blake2b(secret.lower(), digest_size=16).digest()
+        with self._lock:
+            signer = self._signers.get(key)
+            if signer is not None:
+                self._signers.move_to_end(key)
+                return signer
+
+        signer = Signer(private_key)
+        with self._lock:
+            if not self.max_entries:
+                # not kept, the caller has to wipe it
+                return signer
+            signer = self._signers.setdefault(key, signer)
+            evicted = self._evict()
+        for old in evicted:
+            old.wipe()
+        return signer
+
+    def _evict(self):
+        evicted = []
+        while len(self._signers) > self.max_entries:
+            evicted.append(self._signers.popitem(last=False)[1])
+        return evicted
+
+    def sign(self, private_key, message):
+        """
+        Sign `message` with the cached signer for `private_key`, or with a
+        signer wiped right after if the cache keeps no signers
+        """
+        if not self.max_entries:
+            with Signer(private_key) as signer:
+                return signer.sign(message)
+        while True:
+            signer = self.get(private_key)
+            try:
+                return signer.sign(message)
+            except ValueError:
+                # retry if evicted and wiped by another thread in the meantime
+                if not signer.wiped:
+                    raise
+
+    def clear(self):
+        """
+        Wipe and drop all the signers
+        """
+        with self._lock:
+            signers, self._signers = list(self._signers.values()), OrderedDict()
+        for signer in signers:
+            signer.wipe()
+
+    def resize(self, max_entries : int):
+        """
+        Keep at most `max_entries` signers from now on, wiping the least
+        recently used ones beyond it
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries can't be negative")
+        with self._lock:
+            self.max_entries = max_entries
+            evicted = self._evict()
+        for signer in evicted:
+            signer.wipe()
+
+
+_signers = SignerCache()
 
 def validate_private_key(private_key):
     """
@@ -205,17 +531,15 @@ def validate_seed(seed):
 
 def validate_qlc_address(QLC_address : str):
     """
-    Validate a QLC seed and raise an exception on failure
-    :param str seed: Seed as a 64-character hex string
-    :raises InvalidSeed: If the seed is invalid
-    :return: The seed
-    :rtype: str
+    Return whether `QLC_address` is a valid QLC address, without raising
+    :param str QLC_address: the address to check
+    :return: True if it is valid, False otherwise
+    :rtype: bool
+
+    The prefix, length and alphabet are checked before the checksum is
+    computed, so most invalid addresses are rejected cheaply.
     """
-    try : 
-        address_to_public_key(QLC_address)
-        return True
-    except :
-        return False
+    return _address_key(QLC_address) is not None
 
 def validate_signature(signature : str):
     if not len(signature) == 128 or not is_hex(signature):
@@ -4,7 +4,7 @@ __all__ = (
     "InvalidPrivateKey", "InvalidSeed", "InvalidAccount", "InvalidPublicKey",
     "BadSignatureError", "InvalidQLCAddress", "InvalidSignature", "InvalidBlock",
     "InvalidWork", "InvalidDifficulty", "InvalidMultiplier", "InvalidBlockHash",
-    "InvalidBalance"
+    "InvalidBalance", "RPCError"
 )
 
 class InvalidPrivateKey(ValueError):
@@ -41,4 +41,12 @@ class InvalidBlockHash(ValueError):
     """The given block hash is invalid."""
 
 class InvalidBalance(ValueError):
-    """The given balance is invalid."""
\ No newline at end of file
+    """The given balance is invalid."""
+
+class RPCError(Exception):
+    """The node answered a JSON-RPC call with an error object."""
+    def __init__(self, error):
+        self.error = error
+        self.code = error.get("code")
+        self.message = error.get("message")
+        super().__init__(self.message)
\ No newline at end of file
@@ -13,3 +13,10 @@ def is_hex(h):
 def size_in_bytes(object):
     size = sys.getsizeof(object)
     return size
+
+def as_client(client):
+    # module wrappers used to take the node URI, keep accepting it
+    if isinstance(client, str):
+        from ..client import Client
+        return Client(client)
+    return client
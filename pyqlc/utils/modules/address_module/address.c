@@ -0,0 +1,208 @@
+#define PY_SSIZE_T_CLEAN 1
+#include "Python.h"
+
+#include "blake2.h"
+
+#include <stdint.h>
+#include <string.h>
+
+#define PUBLIC_KEY_BYTES 32
+#define CHECKSUM_BYTES 5
+#define PREFIX "qlc_"
+#define PREFIX_CHARS 4
+/* 4 zero bits followed by the 256-bit public key */
+#define KEY_CHARS 52
+#define CHECKSUM_CHARS 8
+#define ADDRESS_CHARS (PREFIX_CHARS + KEY_CHARS + CHECKSUM_CHARS)
+
+static const char ALPHABET[] = "13456789abcdefghijkmnopqrstuwxyz";
+/* 5-bit value of each alphabet character, 0xff for all other bytes */
+static uint8_t DECODE[256];
+
+
+static void checksum(const uint8_t key[PUBLIC_KEY_BYTES], uint8_t out[CHECKSUM_BYTES]) {
+    uint8_t digest[CHECKSUM_BYTES];
+
+    blake2b(digest, CHECKSUM_BYTES, key, PUBLIC_KEY_BYTES, NULL, 0);
+    for (int i = 0; i < CHECKSUM_BYTES; i++) {
+        out[i] = digest[CHECKSUM_BYTES - 1 - i];
+    }
+}
+
+/* write the base32 characters of the `bits` lowest bits of the big-endian
+   number in `in`, `bits` being a multiple of 5 */
+static void encode_bits(const uint8_t *in, size_t in_len, int bits, char *out) {
+    int chars = bits / 5;
+
+    for (int c = 0; c < chars; c++) {
+        /* bit offset of this character from the least significant end */
+        int shift = (chars - 1 - c) * 5;
+        int value = 0;
+        for (int b = 4; b >= 0; b--) {
+            int bit = shift + b;
+            int byte = (int)in_len - 1 - bit / 8;
+            value = (value << 1) | (byte >= 0 ? (in[byte] >> (bit % 8)) & 1 : 0);
+        }
+        out[c] = ALPHABET[value];
+    }
+}
+
+static void encode_address(const uint8_t key[PUBLIC_KEY_BYTES], char out[ADDRESS_CHARS]) {
+    uint8_t sum[CHECKSUM_BYTES];
+
+    memcpy(out, PREFIX, PREFIX_CHARS);
+    encode_bits(key, PUBLIC_KEY_BYTES, KEY_CHARS * 5, out + PREFIX_CHARS);
+    checksum(key, sum);
+    encode_bits(sum, CHECKSUM_BYTES, CHECKSUM_CHARS * 5, out + PREFIX_CHARS + KEY_CHARS);
+}
+
+/* decode `chars` characters into the big-endian number `out` of `out_len`
+   bytes; fail on characters outside the alphabet or on set bits that don't
+   fit in `out` */
+static int decode_bits(const char *in, int chars, uint8_t *out, size_t out_len) {
+    memset(out, 0, out_len);
+    for (int c = 0; c < chars; c++) {
+        uint8_t value = DECODE[(uint8_t)in[c]];
+        if (value == 0xff) {
+            return 0;
+        }
+        int shift = (chars - 1 - c) * 5;
+        for (int b = 0; b < 5; b++) {
+            if (!((value >> b) & 1)) {
+                continue;
+            }
+            int bit = shift + b;
+            if ((size_t)(bit / 8) >= out_len) {
+                return 0;
+            }
+            out[out_len - 1 - bit / 8] |= (uint8_t)(1 << (bit % 8));
+        }
+    }
+    return 1;
+}
+
+static int decode_address(const char address[ADDRESS_CHARS], uint8_t key[PUBLIC_KEY_BYTES]) {
+    uint8_t sum[CHECKSUM_BYTES];
+    uint8_t expected[CHECKSUM_BYTES];
+
+    if (memcmp(address, PREFIX, PREFIX_CHARS) != 0) {
+        return 0;
+    }
+    if (!decode_bits(address + PREFIX_CHARS, KEY_CHARS, key, PUBLIC_KEY_BYTES) ||
+        !decode_bits(address + PREFIX_CHARS + KEY_CHARS, CHECKSUM_CHARS, sum, CHECKSUM_BYTES)) {
+        return 0;
+    }
+    checksum(key, expected);
+    return memcmp(sum, expected, CHECKSUM_BYTES) == 0;
+}
+
+PyDoc_STRVAR(address_encode_doc,
+"encode(public_keys)\n\
+\n\
+Return the addresses of the 32-byte public keys packed in the buffer\n\
+public_keys, as one bytes object of 64 ASCII characters per key.");
+
+static PyObject *
+address_encode(PyObject *self, PyObject *args)
+{
+    Py_buffer keys;
+
+    if (!PyArg_ParseTuple(args, "y*", &keys)) {
+        return NULL;
+    }
+    if (keys.len % PUBLIC_KEY_BYTES != 0) {
+        PyBuffer_Release(&keys);
+        PyErr_SetString(PyExc_ValueError, "'public_keys' needs to have a size that is a multiple of 32 bytes");
+        return NULL;
+    }
+
+    Py_ssize_t count = keys.len / PUBLIC_KEY_BYTES;
+    PyObject *ret = PyBytes_FromStringAndSize(NULL, count * ADDRESS_CHARS);
+    if (ret != NULL) {
+        char *out = PyBytes_AS_STRING(ret);
+        const uint8_t *in = keys.buf;
+        Py_BEGIN_ALLOW_THREADS
+        for (Py_ssize_t i = 0; i < count; i++) {
+            encode_address(in + i * PUBLIC_KEY_BYTES, out + i * ADDRESS_CHARS);
+        }
+        Py_END_ALLOW_THREADS
+    }
+    PyBuffer_Release(&keys);
+    return ret;
+}
+
+PyDoc_STRVAR(address_decode_doc,
+"decode(addresses)\n\
+\n\
+Decode the 64-character addresses packed in the buffer addresses. Return\n\
+(public_keys, bitmap): the 32-byte public keys, zero for invalid addresses,\n\
+and a bitmap with bit i % 8 of byte i // 8 set if address i is valid.");
+
+static PyObject *
+address_decode(PyObject *self, PyObject *args)
+{
+    Py_buffer addresses;
+
+    if (!PyArg_ParseTuple(args, "y*", &addresses)) {
+        return NULL;
+    }
+    if (addresses.len % ADDRESS_CHARS != 0) {
+        PyBuffer_Release(&addresses);
+        PyErr_SetString(PyExc_ValueError, "'addresses' needs to have a size that is a multiple of 64 bytes");
+        return NULL;
+    }
+
+    Py_ssize_t count = addresses.len / ADDRESS_CHARS;
+    PyObject *keys = PyBytes_FromStringAndSize(NULL, count * PUBLIC_KEY_BYTES);
+    PyObject *bitmap = PyByteArray_FromStringAndSize(NULL, (count + 7) / 8);
+    if (keys == NULL || bitmap == NULL) {
+        Py_XDECREF(keys);
+        Py_XDECREF(bitmap);
+        PyBuffer_Release(&addresses);
+        return NULL;
+    }
+
+    uint8_t *out = (uint8_t *)PyBytes_AS_STRING(keys);
+    uint8_t *valid = (uint8_t *)PyByteArray_AS_STRING(bitmap);
+    const char *in = addresses.buf;
+    Py_BEGIN_ALLOW_THREADS
+    memset(valid, 0, (count + 7) / 8);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        uint8_t *key = out + i * PUBLIC_KEY_BYTES;
+        if (decode_address(in + i * ADDRESS_CHARS, key)) {
+            valid[i >> 3] |= (uint8_t)(1 << (i & 7));
+        } else {
+            memset(key, 0, PUBLIC_KEY_BYTES);
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&addresses);
+    return Py_BuildValue("(NN)", keys, bitmap);
+}
+
+static PyMethodDef address_methods[] = {
+    {"encode", address_encode, METH_VARARGS, address_encode_doc},
+    {"decode", address_decode, METH_VARARGS, address_decode_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+PyDoc_STRVAR(module_doc,
+"Bulk conversion between QLC addresses and public keys");
+
+static struct PyModuleDef
+address_module = {
+    PyModuleDef_HEAD_INIT,
+    "_address",
+    module_doc,
+    -1,
+    address_methods
+};
+
+PyMODINIT_FUNC PyInit__address(void) {
+    memset(DECODE, 0xff, sizeof(DECODE));
+    for (int i = 0; i < 32; i++) {
+        DECODE[(uint8_t)ALPHABET[i]] = (uint8_t)i;
+    }
+    return PyModule_Create(&address_module);
+}
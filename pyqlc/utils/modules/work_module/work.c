@@ -2,23 +2,82 @@
 #include "Python.h"
 
 #include "blake2.h"
+#include "work_kernel.h"
 
 #include <stdint.h>
 #include <stdio.h>
 
 #define HASH_BYTES 32
 #define ITERATION_COUNT 250000
+/* nonces hashed between two looks at the cancellation flag */
+#define CANCEL_INTERVAL 4096
 
 
-uint64_t do_work(const uint8_t block_hash[HASH_BYTES], const uint64_t nonce, const uint64_t threshold) {
-    uint64_t work = nonce;
+static uint64_t search_span(const uint8_t block_hash[HASH_BYTES], uint64_t work, const uint64_t threshold,
+                            uint64_t iterations, int *found) {
+    uint64_t result = 0;
+    uint64_t hash[4];
+
+    work_load_hash(block_hash, hash);
+
+#ifdef WORK_LANES
+    uint64_t results[WORK_LANES];
+
+    while (iterations >= WORK_LANES) {
+        work_hash_lanes(work, hash, results);
+        for (int i = 0; i < WORK_LANES; i++) {
+            if (results[i] >= threshold) {
+                *found = 1;
+                return work + i + 1;
+            }
+        }
+        work += WORK_LANES;
+        iterations -= WORK_LANES;
+    }
+#endif
+
+    while (iterations > 0 && result < threshold) {
+        work++;
+        result = work_hash(work, hash);
+        iterations--;
+    }
+
+    *found = result >= threshold;
+    return work;
+}
+
+/*
+   Try the nonces after work until one meets threshold, iterations have been
+   tried or *cancel becomes non-zero. Return the last nonce tried.
+*/
+static uint64_t search(const uint8_t block_hash[HASH_BYTES], uint64_t work, const uint64_t threshold,
+                       uint64_t iterations, volatile const uint8_t *cancel, int *found) {
+    *found = 0;
+
+    while (iterations > 0) {
+        uint64_t span = iterations < CANCEL_INTERVAL ? iterations : CANCEL_INTERVAL;
+
+        work = search_span(block_hash, work, threshold, span, found);
+        if (*found) {
+            break;
+        }
+        iterations -= span;
+        if (cancel != NULL && *cancel) {
+            break;
+        }
+    }
+
+    return work;
+}
+
+/* the original kernel through the generic BLAKE2b API, kept for comparison */
+static uint64_t search_blake2(const uint8_t block_hash[HASH_BYTES], uint64_t work, const uint64_t threshold,
+                              uint64_t iterations, int *found) {
     uint64_t result = 0;
 
     blake2b_state hash;
     blake2b_init(&hash, sizeof(result));
 
-    uint32_t iterations = ITERATION_COUNT;
-
     while (iterations > 0 && result < threshold) {
         work++;
 
@@ -30,25 +89,81 @@ uint64_t do_work(const uint8_t block_hash[HASH_BYTES], const uint64_t nonce, con
         iterations--;
     }
 
+    *found = result >= threshold;
     return work;
 }
 
+uint64_t do_work(const uint8_t block_hash[HASH_BYTES], const uint64_t nonce, const uint64_t threshold,
+                 const uint64_t iterations, volatile const uint8_t *cancel) {
+    int found;
+    return search(block_hash, nonce, threshold, iterations, cancel, &found);
+}
+
+/* return the number of hashes solved, less than count if cancelled */
+Py_ssize_t do_work_batch(const uint8_t *block_hashes, const Py_ssize_t count, const uint64_t nonce,
+                         const uint64_t threshold, volatile const uint8_t *cancel, uint64_t *nonces) {
+    for (Py_ssize_t i = 0; i < count; i++) {
+        uint64_t work = nonce;
+        int found = 0;
+
+        while (!found) {
+            if (cancel != NULL && *cancel) {
+                return i;
+            }
+            work = search(block_hashes + i * HASH_BYTES, work, threshold, ITERATION_COUNT, cancel, &found);
+        }
+        nonces[i] = work;
+    }
+    return count;
+}
+
+/* borrow the first byte of a writable buffer as cancellation flag */
+static int get_cancel_flag(PyObject *cancel, Py_buffer *view) {
+    if (cancel == Py_None) {
+        view->buf = NULL;
+        return 0;
+    }
+    if (PyObject_GetBuffer(cancel, view, PyBUF_WRITABLE) < 0) {
+        return -1;
+    }
+    if (view->len < 1) {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_ValueError, "'cancel' needs to be a non-empty writable buffer");
+        return -1;
+    }
+    return 0;
+}
+
+static void release_cancel_flag(Py_buffer *view) {
+    if (view->buf != NULL) {
+        PyBuffer_Release(view);
+    }
+}
+
 PyDoc_STRVAR(work_do_work_doc,
-"do_work(block_hash, nonce, threshold)\n\
+"do_work(block_hash, nonce, threshold, iterations=250000, cancel=None)\n\
+\n\
+Perform work on a block PoW, trying at most iterations nonces after nonce.\n\
+Return the nonce that meets threshold, or the last nonce tried otherwise.\n\
 \n\
-Perform work on a block PoW. Return a positive 64-bit nonce if a match was found,\n\
-otherwise return 0.");
+cancel is an optional writable buffer, e.g. a bytearray(1), shared with\n\
+other threads: the search stops shortly after its first byte is set.");
 
 static PyObject *
-work_do_work(PyObject *self, PyObject *args)
+work_do_work(PyObject *self, PyObject *args, PyObject *kwargs)
 {
+    static char *kwlist[] = {"block_hash", "nonce", "threshold", "iterations", "cancel", NULL};
     const uint8_t *block_hash;
     Py_ssize_t block_hash_size;
     uint64_t nonce;
     uint64_t threshold;
+    uint64_t iterations = ITERATION_COUNT;
+    PyObject *cancel = Py_None;
+    Py_buffer cancel_view;
 
-    if (!PyArg_ParseTuple(args, "y#KK",
-                          &block_hash, &block_hash_size, &nonce, &threshold)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y#KK|KO", kwlist,
+                                     &block_hash, &block_hash_size, &nonce, &threshold,
+                                     &iterations, &cancel)) {
         return NULL;
     }
 
@@ -58,17 +173,193 @@ work_do_work(PyObject *self, PyObject *args)
         return NULL;
     }
 
+    if (get_cancel_flag(cancel, &cancel_view) < 0) {
+        return NULL;
+    }
+
     uint64_t result = 0;
     Py_BEGIN_ALLOW_THREADS
-    result = do_work(block_hash, nonce, threshold);
+    result = do_work(block_hash, nonce, threshold, iterations, cancel_view.buf);
     Py_END_ALLOW_THREADS
 
+    release_cancel_flag(&cancel_view);
+
     PyObject *ret = Py_BuildValue("K", result);
     return ret;
 }
 
+PyDoc_STRVAR(work_do_work_batch_doc,
+"do_work_batch(block_hashes, nonce, threshold, cancel=None)\n\
+\n\
+Solve the PoW of every 32-byte block hash in the contiguous buffer block_hashes,\n\
+searching upwards from nonce. Return the list of valid nonces, in order; when\n\
+cancelled through the cancel buffer (see do_work), the hashes not solved yet\n\
+get None.");
+
+static PyObject *
+work_do_work_batch(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"block_hashes", "nonce", "threshold", "cancel", NULL};
+    Py_buffer block_hashes;
+    uint64_t nonce;
+    uint64_t threshold;
+    PyObject *cancel = Py_None;
+    Py_buffer cancel_view;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*KK|O", kwlist,
+                                     &block_hashes, &nonce, &threshold, &cancel)) {
+        return NULL;
+    }
+
+    if (block_hashes.len % HASH_BYTES != 0) {
+        PyBuffer_Release(&block_hashes);
+        PyErr_SetString(PyExc_TypeError,
+                        "'block_hashes' needs to have a size that is a multiple of 32 bytes");
+        return NULL;
+    }
+
+    if (get_cancel_flag(cancel, &cancel_view) < 0) {
+        PyBuffer_Release(&block_hashes);
+        return NULL;
+    }
+
+    Py_ssize_t count = block_hashes.len / HASH_BYTES;
+    uint64_t *nonces = PyMem_Malloc((count ? count : 1) * sizeof(uint64_t));
+    if (nonces == NULL) {
+        release_cancel_flag(&cancel_view);
+        PyBuffer_Release(&block_hashes);
+        return PyErr_NoMemory();
+    }
+
+    Py_ssize_t solved = 0;
+    Py_BEGIN_ALLOW_THREADS
+    solved = do_work_batch(block_hashes.buf, count, nonce, threshold, cancel_view.buf, nonces);
+    Py_END_ALLOW_THREADS
+
+    release_cancel_flag(&cancel_view);
+    PyBuffer_Release(&block_hashes);
+
+    PyObject *ret = PyList_New(count);
+    if (ret != NULL) {
+        for (Py_ssize_t i = 0; i < count; i++) {
+            PyObject *item;
+            if (i < solved) {
+                item = PyLong_FromUnsignedLongLong(nonces[i]);
+                if (item == NULL) {
+                    Py_CLEAR(ret);
+                    break;
+                }
+            } else {
+                item = Py_None;
+                Py_INCREF(item);
+            }
+            PyList_SET_ITEM(ret, i, item);
+        }
+    }
+    PyMem_Free(nonces);
+    return ret;
+}
+
+PyDoc_STRVAR(work_do_work_blake2_doc,
+"do_work_blake2(block_hash, nonce, threshold, iterations=250000)\n\
+\n\
+Same as do_work, hashing through the generic blake2b_init/update/final API\n\
+instead of the single-compression kernel. Only meant for benchmarks.");
+
+static PyObject *
+work_do_work_blake2(PyObject *self, PyObject *args)
+{
+    const uint8_t *block_hash;
+    Py_ssize_t block_hash_size;
+    uint64_t nonce;
+    uint64_t threshold;
+    uint64_t iterations = ITERATION_COUNT;
+    int found;
+
+    if (!PyArg_ParseTuple(args, "y#KK|K",
+                          &block_hash, &block_hash_size, &nonce, &threshold, &iterations)) {
+        return NULL;
+    }
+
+    if (block_hash_size != HASH_BYTES) {
+        PyErr_SetString(PyExc_TypeError,
+                        "'block_hash' needs to have a size of exactly 32 bytes");
+        return NULL;
+    }
+
+    uint64_t result = 0;
+    Py_BEGIN_ALLOW_THREADS
+    result = search_blake2(block_hash, nonce, threshold, iterations, &found);
+    Py_END_ALLOW_THREADS
+
+    return Py_BuildValue("K", result);
+}
+
+PyDoc_STRVAR(work_blake2b_many_doc,
+"blake2b_many(data, lengths, digest_size=32)\n\
+\n\
+Hash consecutive messages packed in the buffer data, the i-th one being\n\
+lengths[i] bytes long (lengths is a buffer of native uint32, e.g. array('I')).\n\
+Return the concatenated BLAKE2b digests. The GIL is released while hashing.");
+
+static PyObject *
+work_blake2b_many(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"data", "lengths", "digest_size", NULL};
+    Py_buffer data;
+    Py_buffer lengths;
+    int digest_size = HASH_BYTES;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*y*|i", kwlist, &data, &lengths, &digest_size)) {
+        return NULL;
+    }
+
+    PyObject *ret = NULL;
+    if (digest_size < 1 || digest_size > BLAKE2B_OUTBYTES) {
+        PyErr_SetString(PyExc_ValueError, "'digest_size' must be between 1 and 64");
+        goto done;
+    }
+    if (lengths.len % sizeof(uint32_t) != 0) {
+        PyErr_SetString(PyExc_TypeError, "'lengths' needs to be a buffer of uint32");
+        goto done;
+    }
+
+    Py_ssize_t count = lengths.len / sizeof(uint32_t);
+    const uint32_t *sizes = lengths.buf;
+    Py_ssize_t total = 0;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        total += sizes[i];
+    }
+    if (total > data.len) {
+        PyErr_SetString(PyExc_ValueError, "'lengths' add up to more than the size of 'data'");
+        goto done;
+    }
+
+    ret = PyBytes_FromStringAndSize(NULL, count * digest_size);
+    if (ret == NULL) {
+        goto done;
+    }
+
+    uint8_t *out = (uint8_t *)PyBytes_AS_STRING(ret);
+    const uint8_t *in = data.buf;
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < count; i++) {
+        blake2b(out + i * digest_size, digest_size, in, sizes[i], NULL, 0);
+        in += sizes[i];
+    }
+    Py_END_ALLOW_THREADS
+
+done:
+    PyBuffer_Release(&lengths);
+    PyBuffer_Release(&data);
+    return ret;
+}
+
 static PyMethodDef work_methods[] = {
-    {"do_work", work_do_work, METH_VARARGS, work_do_work_doc},
+    {"do_work", (PyCFunction)work_do_work, METH_VARARGS | METH_KEYWORDS, work_do_work_doc},
+    {"do_work_batch", (PyCFunction)work_do_work_batch, METH_VARARGS | METH_KEYWORDS, work_do_work_batch_doc},
+    {"do_work_blake2", work_do_work_blake2, METH_VARARGS, work_do_work_blake2_doc},
+    {"blake2b_many", (PyCFunction)work_blake2b_many, METH_VARARGS | METH_KEYWORDS, work_blake2b_many_doc},
     {NULL, NULL, 0, NULL}
 };
 
@@ -88,6 +379,10 @@ work_module = {
     "_work_sse4_1",
     #elif WORK_AVX
     "_work_avx",
+    #elif WORK_AVX2
+    "_work_avx2",
+    #elif WORK_AVX512
+    "_work_avx512f",
     #elif WORK_NEON
     "_work_neon",
     #endif
@@ -116,6 +411,14 @@ PyMODINIT_FUNC PyInit__work_sse4_1(void) {
 PyMODINIT_FUNC PyInit__work_avx(void) {
     return PyModule_Create(&work_module);
 }
+#elif WORK_AVX2
+PyMODINIT_FUNC PyInit__work_avx2(void) {
+    return PyModule_Create(&work_module);
+}
+#elif WORK_AVX512
+PyMODINIT_FUNC PyInit__work_avx512f(void) {
+    return PyModule_Create(&work_module);
+}
 #elif WORK_NEON
 PyMODINIT_FUNC PyInit__work_neon(void) {
     return PyModule_Create(&work_module);
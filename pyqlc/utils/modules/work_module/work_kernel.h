@@ -0,0 +1,340 @@
+/*
+   BLAKE2b-64 of the 40-byte PoW message (nonce || block hash).
+
+   The message fits in a single BLAKE2b block, so a work value takes exactly
+   one compression whose state, counter and finalization flag are known in
+   advance: only the nonce word changes between calls. work_hash() runs that
+   compression directly instead of going through blake2b_init, update and
+   final, which would set up the state and copy the message every time.
+
+   One implementation is compiled per extension, selected by its WORK_*
+   define, using the BLAKE2 round macros of the matching source directory.
+*/
+#ifndef WORK_KERNEL_H
+#define WORK_KERNEL_H
+
+#include <stdint.h>
+#include <string.h>
+
+#define WORK_IV0 0x6a09e667f3bcc908ULL
+#define WORK_IV1 0xbb67ae8584caa73bULL
+#define WORK_IV2 0x3c6ef372fe94f82bULL
+#define WORK_IV3 0xa54ff53a5f1d36f1ULL
+#define WORK_IV4 0x510e527fade682d1ULL
+#define WORK_IV5 0x9b05688c2b3e6c1fULL
+#define WORK_IV6 0x1f83d9abfb41bd6bULL
+#define WORK_IV7 0x5be0cd19137e2179ULL
+
+/* h[0] after blake2b_init(8): IV0 ^ (fanout 1, depth 1, digest length 8) */
+#define WORK_H0 (WORK_IV0 ^ 0x01010008ULL)
+/* bytes hashed: 8-byte nonce and 32-byte block hash */
+#define WORK_MESSAGE_BYTES 40
+
+/* the four 64-bit words of a block hash, as the message words 1 to 4 */
+static inline void work_load_hash(const uint8_t block_hash[32], uint64_t words[4]) {
+    memcpy(words, block_hash, 32);
+}
+
+#if defined(WORK_REF)
+
+#define WORK_ROTR64(w, c) (((w) >> (c)) | ((w) << (64 - (c))))
+
+static const uint8_t work_sigma[12][16] = {
+    {  0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14, 15 },
+    { 14, 10,  4,  8,  9, 15, 13,  6,  1, 12,  0,  2, 11,  7,  5,  3 },
+    { 11,  8, 12,  0,  5,  2, 15, 13, 10, 14,  3,  6,  7,  1,  9,  4 },
+    {  7,  9,  3,  1, 13, 12, 11, 14,  2,  6,  5, 10,  4,  0, 15,  8 },
+    {  9,  0,  5,  7,  2,  4, 10, 15, 14,  1, 11, 12,  6,  8,  3, 13 },
+    {  2, 12,  6, 10,  0, 11,  8,  3,  4, 13,  7,  5, 15, 14,  1,  9 },
+    { 12,  5,  1, 15, 14, 13,  4, 10,  0,  7,  6,  3,  9,  2,  8, 11 },
+    { 13, 11,  7, 14, 12,  1,  3,  9,  5,  0, 15,  4,  8,  6,  2, 10 },
+    {  6, 15, 14,  9, 11,  3,  0,  8, 12,  2, 13,  7,  1,  4, 10,  5 },
+    { 10,  2,  8,  4,  7,  6,  1,  5, 15, 11,  9, 14,  3, 12, 13,  0 },
+    {  0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14, 15 },
+    { 14, 10,  4,  8,  9, 15, 13,  6,  1, 12,  0,  2, 11,  7,  5,  3 }
+};
+
+#define WORK_G(r, i, a, b, c, d) \
+    do { \
+        a = a + b + m[work_sigma[r][2 * i + 0]]; \
+        d = WORK_ROTR64(d ^ a, 32); \
+        c = c + d; \
+        b = WORK_ROTR64(b ^ c, 24); \
+        a = a + b + m[work_sigma[r][2 * i + 1]]; \
+        d = WORK_ROTR64(d ^ a, 16); \
+        c = c + d; \
+        b = WORK_ROTR64(b ^ c, 63); \
+    } while (0)
+
+#define WORK_ROUND(r) \
+    do { \
+        WORK_G(r, 0, v[0], v[4], v[8], v[12]); \
+        WORK_G(r, 1, v[1], v[5], v[9], v[13]); \
+        WORK_G(r, 2, v[2], v[6], v[10], v[14]); \
+        WORK_G(r, 3, v[3], v[7], v[11], v[15]); \
+        WORK_G(r, 4, v[0], v[5], v[10], v[15]); \
+        WORK_G(r, 5, v[1], v[6], v[11], v[12]); \
+        WORK_G(r, 6, v[2], v[7], v[8], v[13]); \
+        WORK_G(r, 7, v[3], v[4], v[9], v[14]); \
+    } while (0)
+
+static inline uint64_t work_hash(const uint64_t nonce, const uint64_t hash[4]) {
+    const uint64_t m[16] = {nonce, hash[0], hash[1], hash[2], hash[3]};
+    uint64_t v[16] = {
+        WORK_H0, WORK_IV1, WORK_IV2, WORK_IV3,
+        WORK_IV4, WORK_IV5, WORK_IV6, WORK_IV7,
+        WORK_IV0, WORK_IV1, WORK_IV2, WORK_IV3,
+        WORK_IV4 ^ WORK_MESSAGE_BYTES, WORK_IV5, ~WORK_IV6, WORK_IV7
+    };
+
+    WORK_ROUND(0);
+    WORK_ROUND(1);
+    WORK_ROUND(2);
+    WORK_ROUND(3);
+    WORK_ROUND(4);
+    WORK_ROUND(5);
+    WORK_ROUND(6);
+    WORK_ROUND(7);
+    WORK_ROUND(8);
+    WORK_ROUND(9);
+    WORK_ROUND(10);
+    WORK_ROUND(11);
+
+    return WORK_H0 ^ v[0] ^ v[8];
+}
+
+#elif defined(WORK_NEON)
+
+#include <arm_neon.h>
+
+#include "blake2b-round.h"
+
+static inline uint64_t work_hash(const uint64_t nonce, const uint64_t hash[4]) {
+    const uint64x2_t zero = vdupq_n_u64(0);
+    const uint64x2_t m0 = vcombine_u64(vcreate_u64(nonce), vcreate_u64(hash[0]));
+    const uint64x2_t m1 = vcombine_u64(vcreate_u64(hash[1]), vcreate_u64(hash[2]));
+    const uint64x2_t m2 = vcombine_u64(vcreate_u64(hash[3]), vcreate_u64(0));
+    const uint64x2_t m3 = zero, m4 = zero, m5 = zero, m6 = zero, m7 = zero;
+
+    uint64x2_t row1l = vcombine_u64(vcreate_u64(WORK_H0), vcreate_u64(WORK_IV1));
+    uint64x2_t row1h = vcombine_u64(vcreate_u64(WORK_IV2), vcreate_u64(WORK_IV3));
+    uint64x2_t row2l = vcombine_u64(vcreate_u64(WORK_IV4), vcreate_u64(WORK_IV5));
+    uint64x2_t row2h = vcombine_u64(vcreate_u64(WORK_IV6), vcreate_u64(WORK_IV7));
+    uint64x2_t row3l = vcombine_u64(vcreate_u64(WORK_IV0), vcreate_u64(WORK_IV1));
+    uint64x2_t row3h = vcombine_u64(vcreate_u64(WORK_IV2), vcreate_u64(WORK_IV3));
+    uint64x2_t row4l = vcombine_u64(vcreate_u64(WORK_IV4 ^ WORK_MESSAGE_BYTES), vcreate_u64(WORK_IV5));
+    uint64x2_t row4h = vcombine_u64(vcreate_u64(~WORK_IV6), vcreate_u64(WORK_IV7));
+    uint64x2_t b0, b1, t0, t1;
+
+    ROUND(0);
+    ROUND(1);
+    ROUND(2);
+    ROUND(3);
+    ROUND(4);
+    ROUND(5);
+    ROUND(6);
+    ROUND(7);
+    ROUND(8);
+    ROUND(9);
+    ROUND(10);
+    ROUND(11);
+
+    return WORK_H0 ^ vgetq_lane_u64(veorq_u64(row1l, row3l), 0);
+}
+
+#else /* WORK_SSE2, WORK_SSSE3, WORK_SSE4_1, WORK_AVX, WORK_AVX2, WORK_AVX512 */
+
+#include "blake2-config.h"
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#endif
+#include <emmintrin.h>
+#if defined(HAVE_SSSE3)
+#include <tmmintrin.h>
+#endif
+#if defined(HAVE_SSE41)
+#include <smmintrin.h>
+#endif
+#if defined(HAVE_AVX)
+#include <immintrin.h>
+#endif
+#if defined(HAVE_XOP)
+#include <x86intrin.h>
+#endif
+
+#include "blake2b-round.h"
+
+static inline uint64_t work_hash(const uint64_t nonce, const uint64_t hash[4]) {
+#if defined(HAVE_SSSE3) && !defined(HAVE_XOP)
+    const __m128i r16 = _mm_setr_epi8(2, 3, 4, 5, 6, 7, 0, 1, 10, 11, 12, 13, 14, 15, 8, 9);
+    const __m128i r24 = _mm_setr_epi8(3, 4, 5, 6, 7, 0, 1, 2, 11, 12, 13, 14, 15, 8, 9, 10);
+#endif
+#if defined(HAVE_SSE41)
+    const __m128i zero = _mm_setzero_si128();
+    const __m128i m0 = _mm_set_epi64x((int64_t)hash[0], (int64_t)nonce);
+    const __m128i m1 = _mm_set_epi64x((int64_t)hash[2], (int64_t)hash[1]);
+    const __m128i m2 = _mm_set_epi64x(0, (int64_t)hash[3]);
+    const __m128i m3 = zero, m4 = zero, m5 = zero, m6 = zero, m7 = zero;
+#else
+    const int64_t m0 = (int64_t)nonce;
+    const int64_t m1 = (int64_t)hash[0], m2 = (int64_t)hash[1];
+    const int64_t m3 = (int64_t)hash[2], m4 = (int64_t)hash[3];
+    const int64_t m5 = 0, m6 = 0, m7 = 0, m8 = 0, m9 = 0, m10 = 0;
+    const int64_t m11 = 0, m12 = 0, m13 = 0, m14 = 0, m15 = 0;
+#endif
+    __m128i row1l = _mm_set_epi64x((int64_t)WORK_IV1, (int64_t)WORK_H0);
+    __m128i row1h = _mm_set_epi64x((int64_t)WORK_IV3, (int64_t)WORK_IV2);
+    __m128i row2l = _mm_set_epi64x((int64_t)WORK_IV5, (int64_t)WORK_IV4);
+    __m128i row2h = _mm_set_epi64x((int64_t)WORK_IV7, (int64_t)WORK_IV6);
+    __m128i row3l = _mm_set_epi64x((int64_t)WORK_IV1, (int64_t)WORK_IV0);
+    __m128i row3h = _mm_set_epi64x((int64_t)WORK_IV3, (int64_t)WORK_IV2);
+    __m128i row4l = _mm_set_epi64x((int64_t)WORK_IV5, (int64_t)(WORK_IV4 ^ WORK_MESSAGE_BYTES));
+    __m128i row4h = _mm_set_epi64x((int64_t)WORK_IV7, (int64_t)~WORK_IV6);
+    __m128i b0, b1, t0, t1;
+    uint64_t out[2];
+
+    ROUND(0);
+    ROUND(1);
+    ROUND(2);
+    ROUND(3);
+    ROUND(4);
+    ROUND(5);
+    ROUND(6);
+    ROUND(7);
+    ROUND(8);
+    ROUND(9);
+    ROUND(10);
+    ROUND(11);
+
+    _mm_storeu_si128((__m128i *)out, _mm_xor_si128(row1l, row3l));
+    return WORK_H0 ^ out[0];
+}
+
+#endif
+
+/*
+   Lane-parallel kernels: WORK_LANES consecutive nonces are hashed at once,
+   one per 64-bit lane, as the messages only differ in their first word.
+*/
+#if defined(WORK_AVX2) || defined(WORK_AVX512)
+
+#include <immintrin.h>
+
+#if defined(WORK_AVX512)
+
+#define WORK_LANES 8
+
+typedef __m512i work_vec;
+
+#define WORK_SET1(x) _mm512_set1_epi64((long long)(x))
+#define WORK_ADD(a, b) _mm512_add_epi64((a), (b))
+#define WORK_XOR(a, b) _mm512_xor_si512((a), (b))
+#define WORK_ROR32(x) _mm512_ror_epi64((x), 32)
+#define WORK_ROR24(x) _mm512_ror_epi64((x), 24)
+#define WORK_ROR16(x) _mm512_ror_epi64((x), 16)
+#define WORK_ROR63(x) _mm512_ror_epi64((x), 63)
+#define WORK_STORE(p, x) _mm512_storeu_si512((void *)(p), (x))
+#define WORK_LANE_OFFSETS _mm512_set_epi64(8, 7, 6, 5, 4, 3, 2, 1)
+#define WORK_ROTATIONS
+
+#else
+
+#define WORK_LANES 4
+
+typedef __m256i work_vec;
+
+#define WORK_SET1(x) _mm256_set1_epi64x((long long)(x))
+#define WORK_ADD(a, b) _mm256_add_epi64((a), (b))
+#define WORK_XOR(a, b) _mm256_xor_si256((a), (b))
+#define WORK_ROR32(x) _mm256_shuffle_epi32((x), _MM_SHUFFLE(2, 3, 0, 1))
+#define WORK_ROR24(x) _mm256_shuffle_epi8((x), r24)
+#define WORK_ROR16(x) _mm256_shuffle_epi8((x), r16)
+#define WORK_ROR63(x) _mm256_xor_si256(_mm256_srli_epi64((x), 63), _mm256_add_epi64((x), (x)))
+#define WORK_STORE(p, x) _mm256_storeu_si256((__m256i *)(p), (x))
+#define WORK_LANE_OFFSETS _mm256_set_epi64x(4, 3, 2, 1)
+#define WORK_ROTATIONS \
+    const __m256i r16 = _mm256_setr_epi8( \
+        2, 3, 4, 5, 6, 7, 0, 1, 10, 11, 12, 13, 14, 15, 8, 9, \
+        2, 3, 4, 5, 6, 7, 0, 1, 10, 11, 12, 13, 14, 15, 8, 9); \
+    const __m256i r24 = _mm256_setr_epi8( \
+        3, 4, 5, 6, 7, 0, 1, 2, 11, 12, 13, 14, 15, 8, 9, 10, \
+        3, 4, 5, 6, 7, 0, 1, 2, 11, 12, 13, 14, 15, 8, 9, 10);
+
+#endif
+
+static const uint8_t work_lanes_sigma[12][16] = {
+    {  0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14, 15 },
+    { 14, 10,  4,  8,  9, 15, 13,  6,  1, 12,  0,  2, 11,  7,  5,  3 },
+    { 11,  8, 12,  0,  5,  2, 15, 13, 10, 14,  3,  6,  7,  1,  9,  4 },
+    {  7,  9,  3,  1, 13, 12, 11, 14,  2,  6,  5, 10,  4,  0, 15,  8 },
+    {  9,  0,  5,  7,  2,  4, 10, 15, 14,  1, 11, 12,  6,  8,  3, 13 },
+    {  2, 12,  6, 10,  0, 11,  8,  3,  4, 13,  7,  5, 15, 14,  1,  9 },
+    { 12,  5,  1, 15, 14, 13,  4, 10,  0,  7,  6,  3,  9,  2,  8, 11 },
+    { 13, 11,  7, 14, 12,  1,  3,  9,  5,  0, 15,  4,  8,  6,  2, 10 },
+    {  6, 15, 14,  9, 11,  3,  0,  8, 12,  2, 13,  7,  1,  4, 10,  5 },
+    { 10,  2,  8,  4,  7,  6,  1,  5, 15, 11,  9, 14,  3, 12, 13,  0 },
+    {  0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14, 15 },
+    { 14, 10,  4,  8,  9, 15, 13,  6,  1, 12,  0,  2, 11,  7,  5,  3 }
+};
+
+#define WORK_LANES_G(r, i, a, b, c, d) \
+    do { \
+        a = WORK_ADD(WORK_ADD(a, b), m[work_lanes_sigma[r][2 * i + 0]]); \
+        d = WORK_ROR32(WORK_XOR(d, a)); \
+        c = WORK_ADD(c, d); \
+        b = WORK_ROR24(WORK_XOR(b, c)); \
+        a = WORK_ADD(WORK_ADD(a, b), m[work_lanes_sigma[r][2 * i + 1]]); \
+        d = WORK_ROR16(WORK_XOR(d, a)); \
+        c = WORK_ADD(c, d); \
+        b = WORK_ROR63(WORK_XOR(b, c)); \
+    } while (0)
+
+#define WORK_LANES_ROUND(r) \
+    do { \
+        WORK_LANES_G(r, 0, v[0], v[4], v[8], v[12]); \
+        WORK_LANES_G(r, 1, v[1], v[5], v[9], v[13]); \
+        WORK_LANES_G(r, 2, v[2], v[6], v[10], v[14]); \
+        WORK_LANES_G(r, 3, v[3], v[7], v[11], v[15]); \
+        WORK_LANES_G(r, 4, v[0], v[5], v[10], v[15]); \
+        WORK_LANES_G(r, 5, v[1], v[6], v[11], v[12]); \
+        WORK_LANES_G(r, 6, v[2], v[7], v[8], v[13]); \
+        WORK_LANES_G(r, 7, v[3], v[4], v[9], v[14]); \
+    } while (0)
+
+/* work values of the nonces work + 1 ... work + WORK_LANES, in that order */
+static inline void work_hash_lanes(const uint64_t work, const uint64_t hash[4], uint64_t out[WORK_LANES]) {
+    WORK_ROTATIONS
+    const work_vec zero = WORK_SET1(0);
+    const work_vec m[16] = {
+        WORK_ADD(WORK_SET1(work), WORK_LANE_OFFSETS),
+        WORK_SET1(hash[0]), WORK_SET1(hash[1]), WORK_SET1(hash[2]), WORK_SET1(hash[3]),
+        zero, zero, zero, zero, zero, zero, zero, zero, zero, zero, zero
+    };
+    work_vec v[16] = {
+        WORK_SET1(WORK_H0), WORK_SET1(WORK_IV1), WORK_SET1(WORK_IV2), WORK_SET1(WORK_IV3),
+        WORK_SET1(WORK_IV4), WORK_SET1(WORK_IV5), WORK_SET1(WORK_IV6), WORK_SET1(WORK_IV7),
+        WORK_SET1(WORK_IV0), WORK_SET1(WORK_IV1), WORK_SET1(WORK_IV2), WORK_SET1(WORK_IV3),
+        WORK_SET1(WORK_IV4 ^ WORK_MESSAGE_BYTES), WORK_SET1(WORK_IV5),
+        WORK_SET1(~WORK_IV6), WORK_SET1(WORK_IV7)
+    };
+
+    WORK_LANES_ROUND(0);
+    WORK_LANES_ROUND(1);
+    WORK_LANES_ROUND(2);
+    WORK_LANES_ROUND(3);
+    WORK_LANES_ROUND(4);
+    WORK_LANES_ROUND(5);
+    WORK_LANES_ROUND(6);
+    WORK_LANES_ROUND(7);
+    WORK_LANES_ROUND(8);
+    WORK_LANES_ROUND(9);
+    WORK_LANES_ROUND(10);
+    WORK_LANES_ROUND(11);
+
+    WORK_STORE(out, WORK_XOR(WORK_SET1(WORK_H0), WORK_XOR(v[0], v[8])));
+}
+
+#endif
+
+#endif
@@ -1,17 +1,24 @@
 import importlib
+import importlib.util
+import json
+import os
+import platform
 import random
+import sys
+import threading
 import time
 from binascii import hexlify, unhexlify
 from hashlib import blake2b
 
-import cpuinfo
-
 from .exceptions import InvalidDifficulty, InvalidMultiplier, InvalidWork, InvalidBlockHash
 from .helper import dec_to_hex, is_hex
 
 # Select the PoW C extension depending on highest supported instruction set
 # based on the following priorities:
-# AVX > SSE4.1 > SSSE3 > SSE2 > reference implementation
+# AVX-512 > AVX2 > AVX > SSE4.1 > SSSE3 > SSE2 > reference implementation
+#
+# The AVX-512 and AVX2 builds hash 8 and 4 nonces at once, one per 64-bit
+# lane; the others hash one nonce at a time.
 #
 # This based on a Ryzen 1800X giving the following results:
 # avx speed: 6185344 hashes/s (this is likely the fastest on Intel CPUs)
@@ -19,20 +26,257 @@ from .helper import dec_to_hex, is_hex
 # ssse3 speed: 6249287 hashes/s
 # sse2 speed: 4635929 hashes/s
 # ref speed: 4539306 hashes/s
+#
+# The fixed order is not the fastest everywhere (see sse4_1 vs avx above;
+# on other CPUs ref beats avx and sse4_1), calibrate() times every backend
+# the CPU supports and selects the fastest instead. It only trusts the order
+# for the multi-lane AVX-512 and AVX2 builds: below them, get_backend()
+# calibrates once per machine rather than guess. Set PYQLC_WORK_CALIBRATE=1
+# to have it calibrate on first use regardless.
+#
+# Probing the CPU with cpuinfo takes from hundreds of milliseconds to
+# seconds, so it is only done on the first solve_work and its outcome is
+# remembered per machine in BACKEND_CACHE_FILE, along with the measured
+# hash rates.
 
+_cpu_flags_by_priority = ("avx512f", "avx2", "avx", "sse4_1", "ssse3", "sse2", "neon", "ref")
+# backends which hash several nonces at once, faster than all the others
+_wide_backends = ("pyqlc._work_avx512f", "pyqlc._work_avx2")
 
-_cpu_flags = cpuinfo.get_cpu_info()["flags"]
-_cpu_flags_by_priority = ("avx", "sse4_1", "ssse3", "sse2", "neon", "ref")
+BACKEND_CACHE_FILE = "work_backend.json"
 
-for cpu_flag in _cpu_flags_by_priority:
-    if cpu_flag == "ref":
-        _work = importlib.import_module("pyqlc._work_ref")
-        break
-    elif cpu_flag in _cpu_flags:
-        _work = importlib.import_module(
-            "pyqlc._work_{}".format(cpu_flag)
-        )
-        break
+# nonces tried by one do_work call by default, ITERATION_COUNT in work.c
+WORK_CHUNK = 250000
+
+# seconds a single do_work call of the solvers should last, which bounds how
+# late they notice a timeout; cancellation and a solution found by another
+# thread stop the C loop within a few thousand nonces regardless
+WORK_LATENCY = 0.01
+_MIN_CHUNK = 4096
+_MAX_CHUNK = 1 << 28
+
+_work = None
+_rates = None
+_work_lock = threading.Lock()
+
+
+def cache_dir():
+    """
+    Return the directory pyqlc keeps its per-machine files in
+
+    ``$PYQLC_CACHE_DIR`` if set, otherwise ``pyqlc`` in the platform's
+    user cache directory.
+    """
+    path = os.environ.get("PYQLC_CACHE_DIR")
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pyqlc")
+
+
+def compiled_backends():
+    """
+    Return the names of the PoW C extensions built for this installation,
+    by priority
+    """
+    return [
+        "pyqlc._work_{}".format(cpu_flag) for cpu_flag in _cpu_flags_by_priority
+        if importlib.util.find_spec("pyqlc._work_{}".format(cpu_flag)) is not None
+    ]
+
+
+def supported_backends():
+    """
+    Return the names of the PoW C extensions this CPU can run, by priority
+
+    Probes the CPU, which is slow.
+    """
+    import cpuinfo
+
+    cpu_flags = cpuinfo.get_cpu_info().get("flags", ())
+    names = []
+    for cpu_flag in _cpu_flags_by_priority:
+        if cpu_flag == "ref" or cpu_flag in cpu_flags:
+            name = "pyqlc._work_{}".format(cpu_flag)
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+            names.append(name)
+    if not names:
+        raise ImportError("no PoW extension (pyqlc._work_*) could be imported")
+    return names
+
+
+def _machine_id():
+    # cheap stand-in for the CPU model; platform.processor() may spawn a
+    # subprocess, which is what we are trying to avoid
+    model = ""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("model name", "Hardware", "cpu model")):
+                    model = line.partition(":")[2].strip()
+                    break
+    except OSError:
+        pass
+    # a new build with other backends gets a new entry
+    return "|".join([platform.node(), platform.machine(), model] + compiled_backends())
+
+
+def _read_backend_cache(machine):
+    try:
+        with open(os.path.join(cache_dir(), BACKEND_CACHE_FILE)) as f:
+            entry = json.load(f).get(machine)
+        return entry if isinstance(entry, dict) else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_backend_cache(machine, entry):
+    path = os.path.join(cache_dir(), BACKEND_CACHE_FILE)
+    try:
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if not isinstance(cached, dict):
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+        cached[machine] = entry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = "{}.{}".format(path, os.getpid())
+        with open(tmp, "w") as f:
+            json.dump(cached, f)
+        os.replace(tmp, path)
+    except OSError:
+        # a read-only home only costs another probe next time
+        pass
+
+
+def get_backend():
+    """
+    Return the PoW C extension for this CPU, selecting it on first use
+    """
+    global _work, _rates
+    if _work is not None:
+        return _work
+
+    calibrate_on_use = os.environ.get("PYQLC_WORK_CALIBRATE", "") not in ("", "0")
+    names = None
+    with _work_lock:
+        if _work is None:
+            machine = _machine_id()
+            entry = _read_backend_cache(machine) or {}
+            if entry.get("rates") or (not calibrate_on_use and entry.get("backend") in _wide_backends):
+                try:
+                    _work = importlib.import_module(entry["backend"])
+                    _rates = entry.get("rates")
+                except (KeyError, ImportError):
+                    pass
+            if _work is None and not calibrate_on_use:
+                names = supported_backends()
+                if names[0] in _wide_backends:
+                    _work = importlib.import_module(names[0])
+                    _write_backend_cache(machine, {"backend": names[0]})
+    if _work is None:
+        _calibrate(names or supported_backends())
+    return _work
+
+
+def calibrate(duration=0.005, repeat=3):
+    """
+    Time every PoW extension this CPU supports and select the fastest
+
+    Each backend hashes for about `duration` seconds, `repeat` times; the
+    best rate counts. The choice and the rates are remembered for this
+    machine, so later processes select the same backend without measuring
+    again.
+
+    Return a dict of backend name to hashes per second.
+    """
+    return _calibrate(supported_backends(), duration, repeat)
+
+
+def _calibrate(names, duration=0.005, repeat=3):
+    global _work, _rates
+    block_hash = bytes(range(32))
+    rates = {}
+    for name in names:
+        module = importlib.import_module(name)
+        # the threshold can't be met, so every call hashes all its iterations
+        start = time.perf_counter()
+        module.do_work(block_hash, 0, 0xffffffffffffffff, _MIN_CHUNK)
+        iterations = _chunk_for(_MIN_CHUNK, time.perf_counter() - start, duration)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            module.do_work(block_hash, 0, 0xffffffffffffffff, iterations)
+            best = min(best, time.perf_counter() - start)
+        rates[name] = iterations / best
+
+    name = max(rates, key=rates.get)
+    with _work_lock:
+        _work = importlib.import_module(name)
+        _rates = rates
+    _write_backend_cache(_machine_id(), {"backend": name, "rates": rates})
+    return dict(rates)
+
+
+def backend_rates():
+    """
+    Return the measured hashes per second of every PoW extension this CPU
+    supports, calibrating first if they haven't been measured on this
+    machine yet
+    """
+    get_backend()
+    if not _rates:
+        return calibrate()
+    return dict(_rates)
+
+
+def _chunk_for(iterations, elapsed, duration=WORK_LATENCY):
+    """Return how many nonces take `duration` seconds, at the rate of
+    `iterations` nonces in `elapsed` seconds
+    """
+    if elapsed <= 0:
+        return _MAX_CHUNK
+    return max(_MIN_CHUNK, min(_MAX_CHUNK, int(iterations / elapsed * duration)))
+
+
+class CancelToken:
+    """
+    Stops the :func:`solve_work` and :func:`solve_work_many` calls it is
+    passed to
+
+    :meth:`cancel` can be called from any thread; the solvers return within
+    a few thousand hashes, with None for the work they didn't find.
+    """
+    def __init__(self):
+        self.cancelled = False
+        self._flags = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            for flag in self._flags:
+                flag[0] = 1
+
+    def _link(self, flag):
+        with self._lock:
+            if self.cancelled:
+                flag[0] = 1
+            self._flags.append(flag)
+
+    def _unlink(self, flag):
+        with self._lock:
+            self._flags.remove(flag)
 
 
 WORKSIZE = 8
@@ -170,32 +414,161 @@ def derive_work_multiplier(difficulty, base_difficulty=None):
     return multiplier
 
 
-def solve_work(block_hash, difficulty=WORKTRESHOLD, timeout=None):
+def solve_work(block_hash, difficulty=WORKTRESHOLD, timeout=None, threads=1, cancel=None, servers=None,
+               pool=None):
     """Solve the work for the corresponding block hash.
+
+    With `servers`, a list of :mod:`pyqlc.work_server` URLs, the work is
+    asked of them first, in order; it is only solved locally if none of
+    them returns a valid one in time. With `pool`, a
+    :class:`pyqlc.work_pool.WorkPool`, it is solved by the pool's worker
+    processes instead of `threads`.
+
+    The nonce space is split evenly among `threads` workers, starting at a
+    random offset; all of them stop as soon as one finds a valid nonce,
+    `timeout` seconds have passed or `cancel` (a :class:`CancelToken`) is
+    cancelled, in the latter two cases None is returned.
+    ``threads=None`` uses one worker per CPU.
+
+    Each worker hashes in chunks sized from its measured hash rate to last
+    about :data:`WORK_LATENCY` seconds, so the timeout is kept to within
+    that.
     """
     validate_difficulty(difficulty)
-
-    random.seed()
-
-    nonce = 0
+    threshold = parse_difficulty(difficulty)
+
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if threads < 1:
+        raise ValueError("threads must be at least 1")
+
+    deadline = time.monotonic() + timeout if timeout else None
+    if servers:
+        from ..work_server import generate_remote
+        work = generate_remote(servers, block_hash, difficulty, timeout)
+        if work is not None:
+            return work
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+    if pool is not None:
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        return pool.solve(block_hash, difficulty, timeout=remaining, cancel=cancel)
 
     block_hash_b = unhexlify(block_hash)
+    work_module = get_backend()
+    rate = (_rates or {}).get(work_module.__name__)
+    first_chunk = _chunk_for(rate, 1) if rate else _MIN_CHUNK
+
+    # shared with the C loops, set once they should all stop
+    stop = bytearray(1)
+    found = []
+
+    def worker(nonce):
+        chunk = first_chunk
+        while not stop[0]:
+            start = time.perf_counter()
+            nonce = work_module.do_work(block_hash_b, nonce, threshold, chunk, stop)
+            elapsed = time.perf_counter() - start
+
+            work = "{:016x}".format(nonce)
+            if get_work_value(block_hash, work) >= threshold:
+                found.append(work)
+                stop[0] = 1
+                return
+
+            if deadline is not None and time.monotonic() > deadline:
+                stop[0] = 1
+                return
+            chunk = _chunk_for(chunk, elapsed)
 
+    random.seed()
+    start = random.getrandbits(64)
+    step = (1 << 64) // threads
+    offsets = [(start + i * step) % (1 << 64) for i in range(threads)]
 
-    start = time.time()
-
-    while True:
-        nonce = _work.do_work(
-            block_hash_b, nonce, parse_difficulty(difficulty))
+    if cancel is not None:
+        cancel._link(stop)
+    try:
+        if threads == 1:
+            worker(offsets[0])
+        else:
+            workers = [
+                threading.Thread(target=worker, args=(offset,), name="pyqlc-work", daemon=True)
+                for offset in offsets
+            ]
+            try:
+                for t in workers:
+                    t.start()
+                for t in workers:
+                    t.join()
+            finally:
+                stop[0] = 1
+    finally:
+        if cancel is not None:
+            cancel._unlink(stop)
+
+    return found[0] if found else None
+
+
+def solve_work_many(hashes, difficulty=WORKTRESHOLD, threads=1, cancel=None, pool=None):
+    """Solve the work for many block hashes at once.
+
+    The hashes are handed to the C extension in one buffer, which solves
+    them all without taking the GIL; with `threads` > 1 the list is split
+    among that many threads, with `pool`, a
+    :class:`pyqlc.work_pool.WorkPool`, among its worker processes. Return
+    the works in the order of `hashes`, with None for those not solved
+    before `cancel` (a :class:`CancelToken`) was cancelled.
+    """
+    if pool is not None:
+        return pool.solve_many(hashes, difficulty, cancel=cancel)
+    validate_difficulty(difficulty)
+    threshold = parse_difficulty(difficulty)
 
-        work = hexlify(int(nonce).to_bytes(8, byteorder="big"))
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if threads < 1:
+        raise ValueError("threads must be at least 1")
 
+    hashes = [validate_block_hash(h) for h in hashes]
+    work_module = get_backend()
 
-        try:
+    random.seed()
+    nonce = random.getrandbits(64)
+    stop = bytearray(1)
+
+    def solve(chunk):
+        nonces = work_module.do_work_batch(
+            b"".join(unhexlify(h) for h in chunk), nonce, threshold, stop)
+        return [None if n is None else "{:016x}".format(n) for n in nonces]
+
+    size = -(-len(hashes) // threads) or 1
+    chunks = [hashes[i:i + size] for i in range(0, len(hashes), size)]
+    if cancel is not None:
+        cancel._link(stop)
+    try:
+        if len(chunks) <= 1:
+            works = [solve(chunk) for chunk in chunks]
+        else:
+            works = [None] * len(chunks)
+
+            def worker(i):
+                works[i] = solve(chunks[i])
+
+            workers = [
+                threading.Thread(target=worker, args=(i,), name="pyqlc-work", daemon=True)
+                for i in range(len(chunks))
+            ]
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+    finally:
+        if cancel is not None:
+            cancel._unlink(stop)
+
+    works = [work for chunk in works for work in chunk]
+    for block_hash, work in zip(hashes, works):
+        if work is not None:
             validate_work(block_hash, work, difficulty)
-            return str(work, "utf-8")
-        except InvalidWork:
-            pass
-
-        if timeout and (time.time() - start) > timeout:
-            return None
+    return works
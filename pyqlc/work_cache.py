@@ -0,0 +1,237 @@
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .utils.exceptions import InvalidBlockHash, InvalidDifficulty, InvalidWork
+from .utils.work import WORKTRESHOLD, CancelToken, solve_work, validate_work
+
+DEFAULT_MAX_ENTRIES = 10000
+
+_STOP = object()
+
+
+class WorkCache:
+    """
+    Proof-of-work solved ahead of time, keyed by block root and difficulty
+
+    Once a block is processed, the root of the next block of its account is
+    the block's hash, so its work can be solved before that block is even
+    generated. :meth:`precompute` queues such a root; one background thread
+    solves the queue in order. :meth:`take` hands out the work, waiting for
+    it if it is still being solved, and forgets it, as work is only used
+    once.
+
+    At most `max_entries` solved works are kept, the oldest are evicted
+    beyond that. With `path` set, they are loaded from and saved to that
+    JSON file, so they survive restarts.
+
+    Parameters
+    ----------
+    max_entries : int
+        optional , maximum number of solved works kept, default is 10000
+    path : str
+        optional , file to persist the solved works in
+    difficulty : str
+        optional , difficulty solved for when none is given, default is the
+        network threshold
+    threads : int
+        optional , threads per solve, ``None`` for one per CPU, default is 1
+    pool : WorkPool
+        optional , worker processes to solve with instead of `threads`, see
+        :class:`pyqlc.work_pool.WorkPool`
+    """
+    def __init__(
+        self,
+        max_entries : int = DEFAULT_MAX_ENTRIES,
+        path : str = None,
+        difficulty : str = WORKTRESHOLD,
+        threads : int = 1,
+        pool = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.path = path
+        self.difficulty = difficulty
+        self.threads = threads
+        self.pool = pool
+        self.hits = 0
+        self.misses = 0
+        self.solved = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._queue = queue.Queue()
+        self._cancel = CancelToken()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        if path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, root : str, difficulty : str = None) -> str:
+        return "{}:{}".format(root.lower(), (difficulty or self.difficulty).lower())
+
+    def precompute(self, root : str, difficulty : str = None) -> Future:
+        """
+        Queue the work for `root` to be solved in the background, unless it
+        is already solved or queued, and return a future for it
+        """
+        key = self.key(root, difficulty)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("work cache is closed")
+            if key in self._entries:
+                future = Future()
+                future.set_result(self._entries[key])
+                return future
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                self._queue.put((key, root, difficulty or self.difficulty))
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="pyqlc-work-cache", daemon=True)
+                    self._thread.start()
+        return future
+
+    def put(self, root : str, work : str, difficulty : str = None):
+        """
+        Store work solved elsewhere for `root`
+        """
+        with self._lock:
+            self._store(self.key(root, difficulty), work)
+
+    def take(self, root : str, difficulty : str = None, wait : bool = True):
+        """
+        Return and forget the work for `root`, or None if it isn't cached
+
+        If it is queued or being solved, wait for it unless `wait` is False.
+        """
+        key = self.key(root, difficulty)
+        with self._lock:
+            work = self._entries.pop(key, None)
+            future = self._pending.get(key) if work is None and wait else None
+            if work is not None:
+                self.hits += 1
+            elif future is None:
+                self.misses += 1
+        if future is not None:
+            try:
+                work = future.result()
+            except Exception:
+                work = None
+            with self._lock:
+                self._entries.pop(key, None)
+                if work is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return work
+
+    def load(self):
+        """
+        Add the works saved in `path`, skipping those that aren't valid
+        """
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict):
+            return
+        with self._lock:
+            for key, work in saved.items():
+                root, _, difficulty = key.partition(":")
+                try:
+                    validate_work(root, work, difficulty)
+                except (InvalidBlockHash, InvalidDifficulty, InvalidWork, ValueError, TypeError):
+                    continue
+                self._store(key, work)
+
+    def save(self):
+        """
+        Write the solved works to `path`
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._entries)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = "{}.{}".format(self.path, os.getpid())
+        with open(tmp, "w") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def close(self):
+        """
+        Stop the background solver, dropping the queued roots, and save the
+        solved works to `path`
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._cancel.cancel()
+        self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.cancel()
+        self.save()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+            "solved": self.solved,
+            "evictions": self.evictions
+        }
+
+    def _store(self, key, work):
+        self._entries.pop(key, None)
+        self._entries[key] = work
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            key, root, difficulty = item
+            try:
+                work = solve_work(root, difficulty, threads=self.threads, cancel=self._cancel, pool=self.pool)
+            except Exception as e:
+                with self._lock:
+                    future = self._pending.pop(key, None)
+                if future is not None:
+                    future.set_exception(e)
+                continue
+            if work is None:
+                # cancelled by close()
+                return
+
+            with self._lock:
+                self._store(key, work)
+                self.solved += 1
+                future = self._pending.pop(key, None)
+            if future is not None:
+                future.set_result(work)
+            if self.path is not None:
+                try:
+                    self.save()
+                except OSError:
+                    pass
@@ -0,0 +1,268 @@
+import ctypes
+import multiprocessing
+import os
+import random
+import threading
+import time
+from binascii import unhexlify
+
+from .utils.work import _MAX_CHUNK, WORKTRESHOLD, get_backend, get_work_value, parse_difficulty, \
+    validate_block_hash, validate_difficulty, validate_work
+
+DEFAULT_BATCH_SIZE = 256
+# seconds between checks that the workers are still alive while waiting
+_POLL = 1.0
+
+_SOLVE = "solve"
+_SOLVE_MANY = "solve_many"
+
+
+class WorkPool:
+    """
+    Persistent pool of worker processes solving proof-of-work
+
+    Unlike the threads of :func:`pyqlc.utils.work.solve_work`, the workers
+    run outside this process, so solving never competes with its threads
+    for the GIL or their cores, and a crash in a worker doesn't take the
+    process down. The workers are started once and reused by every call;
+    each is pinned to its own CPU where the platform supports it.
+
+    Block hashes are handed to the workers and nonces returned through
+    shared memory allocated when the pool starts; only a short command goes
+    through a pipe per call. Calls are served one at a time, each using all
+    the workers.
+
+    Parameters
+    ----------
+    processes : int
+        optional , number of workers, default is one per CPU available to
+        this process
+    affinity : bool or list
+        optional , pin each worker to one CPU, round-robin over the CPUs
+        available to this process, or over the given list of CPU ids;
+        ``False`` leaves scheduling to the OS, default is True
+    batch_size : int
+        optional , hashes one worker solves per round of
+        :meth:`solve_many`, default is 256
+    """
+    def __init__(self, processes : int = None, affinity = True, batch_size : int = DEFAULT_BATCH_SIZE):
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+        if processes is None:
+            processes = len(cpus) if cpus else (os.cpu_count() or 1)
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        if affinity is True:
+            affinity = cpus
+        elif affinity is False:
+            affinity = None
+        if not hasattr(os, "sched_setaffinity"):
+            affinity = None
+
+        self.processes = processes
+        self.batch_size = batch_size
+        slots = processes * batch_size
+
+        # shared with the workers: the stop flag read by the C loops, the
+        # block hashes and, per slot, the nonce found and whether it is valid
+        self._stop = multiprocessing.RawArray(ctypes.c_ubyte, 1)
+        self._hashes = multiprocessing.RawArray(ctypes.c_ubyte, slots * 32)
+        self._nonces = multiprocessing.RawArray(ctypes.c_uint64, slots)
+        self._solved = multiprocessing.RawArray(ctypes.c_ubyte, slots)
+        self._done = multiprocessing.Semaphore(0)
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pipes = []
+        self._workers = []
+        for i in range(processes):
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            cpu = affinity[i % len(affinity)] if affinity else None
+            p = multiprocessing.Process(
+                target=_worker,
+                args=(i, cpu, reader, self._done, self._stop, self._hashes, self._nonces, self._solved,
+                      batch_size),
+                name="pyqlc-work-{}".format(i),
+                daemon=True)
+            p.start()
+            reader.close()
+            self._pipes.append(writer)
+            self._workers.append(p)
+
+    def solve(self, block_hash : str, difficulty : str = WORKTRESHOLD, timeout : float = None, cancel = None):
+        """
+        Solve the work for `block_hash`, see :func:`pyqlc.utils.work.solve_work`
+
+        Every worker searches its own part of the nonce space. Return None
+        if `timeout` seconds have passed or `cancel` was cancelled first.
+        """
+        validate_block_hash(block_hash)
+        validate_difficulty(difficulty)
+        threshold = parse_difficulty(difficulty)
+
+        with self._lock:
+            self._hashes[:32] = unhexlify(block_hash)
+            random.seed()
+            start = random.getrandbits(64)
+            step = (1 << 64) // self.processes
+            tasks = [(_SOLVE, (start + i * step) % (1 << 64), threshold, 1) for i in range(self.processes)]
+            self._run(tasks, timeout, cancel)
+
+            for i in range(self.processes):
+                slot = i * self.batch_size
+                if self._solved[slot]:
+                    return validate_work(block_hash, "{:016x}".format(self._nonces[slot]), difficulty)
+        return None
+
+    def solve_many(self, hashes, difficulty : str = WORKTRESHOLD, cancel = None):
+        """
+        Solve the work for many block hashes, see
+        :func:`pyqlc.utils.work.solve_work_many`
+
+        The hashes are split among the workers, at most `batch_size` per
+        worker at a time. Return the works in the order of `hashes`, with
+        None for those not solved before `cancel` was cancelled.
+        """
+        validate_difficulty(difficulty)
+        threshold = parse_difficulty(difficulty)
+        hashes = [validate_block_hash(h) for h in hashes]
+
+        works = []
+        size = self.processes * self.batch_size
+        with self._lock:
+            for offset in range(0, len(hashes), size):
+                batch = hashes[offset:offset + size]
+                per_worker = -(-len(batch) // self.processes)
+                tasks = []
+                for i in range(self.processes):
+                    chunk = batch[i * per_worker:(i + 1) * per_worker]
+                    if not chunk:
+                        break
+                    slot = i * self.batch_size
+                    self._hashes[slot * 32:(slot + len(chunk)) * 32] = b"".join(unhexlify(h) for h in chunk)
+                    tasks.append((_SOLVE_MANY, random.getrandbits(64), threshold, len(chunk)))
+                self._run(tasks, None, cancel)
+
+                for i, (_, _, _, count) in enumerate(tasks):
+                    slot = i * self.batch_size
+                    works.extend(
+                        "{:016x}".format(self._nonces[slot + j]) if self._solved[slot + j] else None
+                        for j in range(count))
+
+        for block_hash, work in zip(hashes, works):
+            if work is not None:
+                validate_work(block_hash, work, difficulty)
+        return works
+
+    def _run(self, tasks, timeout, cancel):
+        if self._closed:
+            raise RuntimeError("work pool is closed")
+        self._stop[0] = 0
+        if cancel is not None:
+            cancel._link(self._stop)
+        sent = reported = 0
+        failed = False
+        try:
+            for pipe, task in zip(self._pipes, tasks):
+                try:
+                    pipe.send(task)
+                except OSError:
+                    failed = True
+                    break
+                sent += 1
+
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            while not failed and reported < sent:
+                wait = _POLL if deadline is None else max(0, min(_POLL, deadline - time.monotonic()))
+                if self._done.acquire(timeout=wait):
+                    reported += 1
+                elif deadline is not None and time.monotonic() >= deadline:
+                    self._stop[0] = 1
+                    deadline = None
+                elif not self._alive(sent):
+                    failed = True
+        finally:
+            self._stop[0] = 1
+            # every worker handed a task reports back once, even when this
+            # call is interrupted; the next call must not count those reports
+            while reported < sent:
+                if self._done.acquire(timeout=_POLL):
+                    reported += 1
+                elif not self._alive(sent):
+                    failed = True
+                    break
+            if cancel is not None:
+                cancel._unlink(self._stop)
+            if failed:
+                self.close()
+        if failed:
+            raise RuntimeError("a work pool worker exited unexpectedly")
+
+    def _alive(self, count):
+        return all(p.is_alive() for p in self._workers[:count])
+
+    def close(self):
+        """
+        Stop the workers, cancelling the running call
+        """
+        self._closed = True
+        self._stop[0] = 1
+        for pipe in self._pipes:
+            try:
+                pipe.send(None)
+            except OSError:
+                pass
+            pipe.close()
+        for p in self._workers:
+            p.join(timeout=_POLL)
+            if p.is_alive():
+                p.terminate()
+        self._pipes, self._workers = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _worker(index, cpu, tasks, done, stop, hashes, nonces, solved, batch_size):
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass
+    work_module = get_backend()
+    slot = index * batch_size
+    view = memoryview(hashes).cast("B")
+
+    while True:
+        try:
+            task = tasks.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        kind, nonce, threshold, count = task
+        # a single hash is shared by all the workers and kept in the first slot
+        first = slot if kind == _SOLVE_MANY else 0
+        block_hashes = view[first * 32:(first + count) * 32]
+        try:
+            if kind == _SOLVE:
+                solved[slot] = 0
+                block_hash = bytes(block_hashes)
+                while not stop[0]:
+                    nonce = work_module.do_work(block_hash, nonce, threshold, _MAX_CHUNK, stop)
+                    if get_work_value(block_hash.hex(), "{:016x}".format(nonce)) >= threshold:
+                        nonces[slot] = nonce
+                        solved[slot] = 1
+                        stop[0] = 1
+            else:
+                for j, n in enumerate(work_module.do_work_batch(block_hashes, nonce, threshold, stop)):
+                    solved[slot + j] = n is not None
+                    nonces[slot + j] = n or 0
+        finally:
+            block_hashes.release()
+            done.release()
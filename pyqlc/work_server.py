@@ -0,0 +1,343 @@
+"""
+Standalone proof-of-work server and the client side of it
+
+The server answers JSON-RPC 2.0 calls over HTTP:
+
+``work_generate [root, difficulty, priority]``
+    solve and return the work for `root`; `difficulty` defaults to the
+    network threshold, requests with a higher `priority` are solved first
+``work_validate [root, work, difficulty]``
+    return whether `work` meets `difficulty` for `root`
+``work_cancel [root]``
+    stop solving `root`, its pending ``work_generate`` calls fail
+
+Requests for a root already queued or being solved share its result. One
+root is solved at a time, with all the configured threads.
+
+    $ pyqlc-work-server --port 7176 --threads 16
+"""
+import argparse
+import heapq
+import itertools
+import json
+import logging
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from .utils.exceptions import InvalidBlockHash, InvalidDifficulty, InvalidWork, RPCError
+from .utils.work import WORKTRESHOLD, CancelToken, get_work_value, parse_difficulty, solve_work, \
+    validate_block_hash, validate_work
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7176
+# seconds to wait for a work server to accept a connection before trying
+# the next one
+CONNECT_TIMEOUT = 3
+
+logger = logging.getLogger(__name__)
+
+
+class WorkCancelled(Exception):
+    pass
+
+
+class _Job:
+    def __init__(self, root, difficulty, priority):
+        self.root = root
+        self.difficulty = difficulty
+        self.priority = priority
+        self.future = Future()
+        self.cancel = CancelToken()
+        self.started = False
+
+
+class WorkServer:
+    """
+    Solves proof-of-work for JSON-RPC clients, see the module documentation
+
+    Parameters
+    ----------
+    host : str
+        optional , address to listen on, default is 127.0.0.1
+    port : int
+        optional , port to listen on, default is 7176
+    threads : int
+        optional , threads per solve, default is one per CPU
+    """
+    def __init__(self, host : str = DEFAULT_HOST, port : int = DEFAULT_PORT, threads : int = None):
+        self.threads = threads
+        self._jobs = {}
+        self._queue = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._methods = {
+            "work_generate": self.work_generate,
+            "work_validate": self.work_validate,
+            "work_cancel": self.work_cancel,
+        }
+
+        self.httpd = _HTTPServer((host, port), _Handler)
+        self.httpd.work_server = self
+        self._serving = False
+        self._solver = threading.Thread(target=self._run, name="pyqlc-work-server", daemon=True)
+        self._solver.start()
+
+    @property
+    def address(self):
+        return self.httpd.server_address
+
+    def serve_forever(self):
+        self._serving = True
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self._serving = False
+
+    def start(self) -> threading.Thread:
+        """
+        Serve from a background thread and return it
+        """
+        t = threading.Thread(target=self.serve_forever, name="pyqlc-work-server-http", daemon=True)
+        # set before the thread runs, so close() right after start() still stops it
+        self._serving = True
+        t.start()
+        return t
+
+    def close(self):
+        """
+        Stop serving and cancel all queued and running work
+        """
+        # shutdown() waits for serve_forever() to return, forever if it never ran
+        if self._serving:
+            self.httpd.shutdown()
+        self.httpd.server_close()
+        with self._cond:
+            self._closed = True
+            jobs, self._jobs = list(self._jobs.values()), {}
+            self._cond.notify()
+        for job in jobs:
+            self._cancel_job(job)
+        self._solver.join()
+
+    def work_generate(self, root : str, difficulty : str = None, priority : int = 0) -> str:
+        validate_block_hash(root)
+        root = root.lower()
+        difficulty = (difficulty or WORKTRESHOLD).lower()
+        threshold = parse_difficulty(difficulty)
+
+        while True:
+            work = self._submit(root, difficulty, int(priority)).result()
+            # a shared solve may have been for a lower difficulty
+            if get_work_value(root, work) >= threshold:
+                return work
+
+    def work_validate(self, root : str, work : str, difficulty : str = None) -> bool:
+        try:
+            validate_work(root, work, difficulty or WORKTRESHOLD)
+        except InvalidWork:
+            return False
+        return True
+
+    def work_cancel(self, root : str) -> bool:
+        with self._cond:
+            job = self._jobs.pop(root.lower(), None)
+        if job is None:
+            return False
+        self._cancel_job(job)
+        return True
+
+    def _submit(self, root, difficulty, priority) -> Future:
+        with self._cond:
+            if self._closed:
+                raise WorkCancelled("work server is shutting down")
+            job = self._jobs.get(root)
+            if job is None or (job.started and parse_difficulty(job.difficulty) < parse_difficulty(difficulty)):
+                if job is not None:
+                    # wait for the running solve, then solve again at the higher difficulty
+                    return job.future
+                job = self._jobs[root] = _Job(root, difficulty, priority)
+            elif not job.started:
+                # join the queued job, raising what it solves for
+                if parse_difficulty(difficulty) > parse_difficulty(job.difficulty):
+                    job.difficulty = difficulty
+                if priority <= job.priority:
+                    return job.future
+                job.priority = priority
+            else:
+                return job.future
+            # a raised priority is queued again, the stale entry is skipped
+            heapq.heappush(self._queue, (-job.priority, next(self._seq), job))
+            self._cond.notify()
+            return job.future
+
+    def _cancel_job(self, job):
+        job.cancel.cancel()
+        if not job.started:
+            job.future.set_exception(WorkCancelled("work for {} was cancelled".format(job.root)))
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._queue:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                if job.started or self._jobs.get(job.root) is not job:
+                    continue
+                job.started = True
+
+            try:
+                work = solve_work(job.root, job.difficulty, threads=self.threads, cancel=job.cancel)
+            except Exception as e:
+                work = e
+            with self._cond:
+                if self._jobs.get(job.root) is job:
+                    del self._jobs[job.root]
+
+            if isinstance(work, Exception):
+                job.future.set_exception(work)
+            elif work is None:
+                job.future.set_exception(WorkCancelled("work for {} was cancelled".format(job.root)))
+            else:
+                job.future.set_result(work)
+
+    def handle(self, payload):
+        """
+        Answer a decoded JSON-RPC request or batch
+        """
+        if isinstance(payload, list):
+            return [self._call(item) for item in payload]
+        return self._call(payload)
+
+    def _call(self, item):
+        if not isinstance(item, dict):
+            return _error(None, -32600, "invalid request")
+        method = self._methods.get(item.get("method"))
+        if method is None:
+            return _error(item.get("id"), -32601, "method not found")
+        params = item.get("params") or []
+        try:
+            if isinstance(params, dict):
+                result = method(**params)
+            else:
+                result = method(*params)
+        except (TypeError, ValueError, InvalidBlockHash, InvalidDifficulty, InvalidWork) as e:
+            return _error(item.get("id"), -32602, "invalid params: {}".format(e))
+        except WorkCancelled as e:
+            return _error(item.get("id"), -32000, str(e))
+        except Exception:
+            logger.exception("%s failed", item.get("method"))
+            return _error(item.get("id"), -32603, "internal error")
+        return {"jsonrpc": "2.0", "id": item.get("id"), "result": result}
+
+
+def _error(id, code, message):
+    return {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}}
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # clients that timed out are gone by the time their work is ready
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            logger.debug("%s disconnected before its answer", client_address[0])
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        status = 200
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            response, status = _error(None, -32700, "parse error: invalid Content-Length"), 400
+        else:
+            try:
+                payload = json.loads(self.rfile.read(length))
+            except ValueError:
+                response = _error(None, -32700, "parse error")
+            else:
+                response = self.server.work_server.handle(payload)
+
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status != 200:
+            # the request body can't be delimited, so the connection can't be reused
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def generate_remote(servers, root : str, difficulty : str = WORKTRESHOLD, timeout : float = None):
+    """
+    Return the work for `root` from the first of the work `servers` (URLs)
+    that answers with a valid one, or None if none does
+
+    `timeout` bounds the total wait in seconds. Without it, each server
+    gets the transport's default timeout (30 s) to answer, so a stuck one
+    can't keep the caller from the next server or from solving locally.
+    """
+    import requests
+
+    from .rpc import request
+    from .transport import DEFAULT_TIMEOUT, get_transport
+
+    deadline = time.monotonic() + timeout if timeout else None
+    for URI in servers:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+        try:
+            r = get_transport(URI).post(
+                request("work_generate", [root, difficulty], 1),
+                timeout=(min(CONNECT_TIMEOUT, remaining or CONNECT_TIMEOUT),
+                         DEFAULT_TIMEOUT if remaining is None else remaining))
+            if "error" in r:
+                raise RPCError(r["error"])
+            return validate_work(root, r["result"], difficulty)
+        except (requests.RequestException, ValueError, KeyError, TypeError, RPCError, InvalidWork) as e:
+            logger.warning("work server %s failed: %s", URI, e)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="QLC proof-of-work server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--threads", type=int, default=None,
+                        help="threads per solve, default is one per CPU")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    server = WorkServer(args.host, args.port, threads=args.threads)
+    logger.info("serving work on %s:%d", *server.address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
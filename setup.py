@@ -21,12 +21,18 @@ REQUIRED = [
     'ed25519-blake2b>=1.4', 'py-cpuinfo>=4', "requests"
 ]
 
+EXTRAS = {
+    "async": ["aiohttp>=3.6"]
+}
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 def get_compile_args(iset=None, build_platform="x86"):
     flags = {
         "unix": {
+            "avx512f": ["-DWORK_AVX512", "-mavx512f", "-mavx2"],
+            "avx2": ["-DWORK_AVX2", "-mavx2"],
             "avx": ["-DWORK_AVX", "-mavx"],
             "sse4_1": ["-DWORK_SSE4_1", "-msse4.1"],
             "ssse3": ["-DWORK_SSSE3", "-mssse3"],
@@ -35,6 +41,8 @@ def get_compile_args(iset=None, build_platform="x86"):
             None: ["-DWORK_REF"]
         },
         "msvc": {
+            "avx512f": ["/DWORK_AVX512", "/arch:AVX512", "/DHAVE_AVX", "/D__SSE4_1__"],
+            "avx2": ["/DWORK_AVX2", "/arch:AVX2", "/DHAVE_AVX", "/D__SSE4_1__"],
             "avx": ["/DWORK_AVX", "/arch:AVX", "/DHAVE_AVX", "/D__SSE4_1__"],
             "sse4_1": ["/DWORK_SSE4_1", "/arch:SSE2", "/D__SSE4_1__"],
             "ssse3": ["/DWORK_SSSE3", "/arch:SSE2", "/D__SSSE3__"],
@@ -77,6 +85,9 @@ def create_work_extension(source_name="ref", iset=None, build_platform=None):
         sources=[
             os.path.join("pyqlc", "utils", "modules", "work_module", "work.c")
         ] + SOURCE_FILES[source_name],
+        depends=[
+            os.path.join("pyqlc", "utils", "modules", "work_module", "work_kernel.h")
+        ],
         extra_compile_args=get_compile_args(iset, build_platform)
     )
 
@@ -94,6 +105,8 @@ _is_x86 = _machine.startswith("x86") or _machine in ("i386", "i686", "AMD64")
 
 if _is_x86:
     EXTENSIONS_TO_BUILD = [
+        create_work_extension("sse", "avx512f", "x86"),
+        create_work_extension("sse", "avx2", "x86"),
         create_work_extension("sse", "avx", "x86"),
         create_work_extension("sse", "sse4_1", "x86"),
         create_work_extension("sse", "ssse3", "x86"),
@@ -113,6 +126,17 @@ elif _is_aarch64:
 else:
     EXTENSIONS_TO_BUILD = [create_work_extension("ref")]
 
+# optional, pyqlc.utils.crypto falls back to Python without it
+EXTENSIONS_TO_BUILD.append(setuptools.Extension(
+    "pyqlc._address",
+    include_dirs=[os.path.join(SOURCE_ROOT, "ref")],
+    sources=[
+        os.path.join("pyqlc", "utils", "modules", "address_module", "address.c"),
+        os.path.join(SOURCE_ROOT, "ref", "blake2b-ref.c")
+    ],
+    optional=True
+))
+
 
 class PyTest(TestCommand):
     user_options = [('pytest-args=', 'a', "Arguments to pass into py.test")]
@@ -187,6 +211,10 @@ setuptools.setup(
     ext_modules= EXTENSIONS_TO_BUILD,
     packages= setuptools.find_packages(),
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
+    entry_points={
+        "console_scripts": ["pyqlc-work-server=pyqlc.work_server:main"],
+    },
     setup_requires=["sphinx"],
     tests_require=["pytest"],
     license='MIT',
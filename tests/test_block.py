@@ -0,0 +1,94 @@
+from base64 import b64decode
+from binascii import unhexlify
+from hashlib import blake2b
+
+import pytest
+
+from pyqlc.utils.block import Block, hash_many
+from pyqlc.utils.crypto import address_to_public_key
+from pyqlc.utils.exceptions import InvalidBlock
+
+# send block generated by a node, and the hash it returned for it
+NODE_BLOCK = {
+    "type": "Send",
+    "token": "ea842234e4dc5b17c33b35f99b5b86111a3af0bd8e4a8822602b866711de6d81",
+    "address": "qlc_3xc5fbrqck6mrxrrx7hjnqf6jgyqsnkeg39k5mjw44m8aj3f1zdfh7cw8kfz",
+    "balance": "346854",
+    "vote": "0",
+    "network": "0",
+    "storage": "0",
+    "oracle": "0",
+    "previous": "738642163581ddab31e171813abd1301bb7d14c7f470ca91f65717710c45a464",
+    "link": "42d2f239db3798b1f60b182e72790e71fe805e0eb62eef7a2e06646d71cfc695",
+    "message": "0000000000000000000000000000000000000000000000000000000000000000",
+    "povHeight": 514397,
+    "timestamp": 1613280327,
+    "extra": "0000000000000000000000000000000000000000000000000000000000000000",
+    "representative": "qlc_1111111111111111111111111111111111111111111111111111hifc8npp",
+    "work": "0000000000a70611",
+    "signature": "f01b8100ab050bd8efed9585f88ae4777c86fd050053b43a3bca2ec5e04c5cefdc12b108eaec792bb70ebe546a7dbdf6f63ca34a4eb6cf95b93259cae6cc970b",
+}
+NODE_HASH = "6014521eb956b589013540174951ba690cde4f2d98b0fbc291f0f94ac1bbbb87"
+
+SMS_FIELDS = {"sender": "MTU4MDAwMDAwMDA=", "receiver": "MTU5MDAwMDAwMDA=", "data": "AQIDBA=="}
+
+
+def node_layout_hash(block):
+    # field order of go-qlc's StateBlock.GetHash
+    def key(address):
+        return unhexlify(address_to_public_key(address))
+
+    def amount(value):
+        value = int(value)
+        return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+    data = b"".join((
+        b"\x01",
+        unhexlify(block["token"]),
+        key(block["address"]),
+        amount(block["balance"]),
+        amount(block["vote"]),
+        amount(block["network"]),
+        amount(block["storage"]),
+        amount(block["oracle"]),
+        unhexlify(block["previous"]),
+        unhexlify(block["link"]),
+        b64decode(block.get("sender", "")),
+        b64decode(block.get("receiver", "")),
+        unhexlify(block["message"]),
+        b64decode(block.get("data", "")),
+        block["timestamp"].to_bytes(8, "big"),
+        block["povHeight"].to_bytes(8, "big"),
+        unhexlify(block["extra"]),
+        key(block["representative"]),
+    ))
+    return blake2b(data, digest_size=32).hexdigest()
+
+
+def test_hash_matches_node():
+    assert node_layout_hash(NODE_BLOCK) == NODE_HASH
+    assert Block.from_dict(NODE_BLOCK).compute_hash() == NODE_HASH
+    assert hash_many([NODE_BLOCK]) == [NODE_HASH]
+
+
+def test_sender_receiver_and_data_are_hashed():
+    block = dict(NODE_BLOCK, **SMS_FIELDS)
+    blk = Block.from_dict(block)
+
+    for k, v in SMS_FIELDS.items():
+        assert blk.to_dict()[k] == v
+    assert blk.compute_hash() == node_layout_hash(block) != NODE_HASH
+    assert hash_many([block, blk]) == [blk.compute_hash()] * 2
+
+
+@pytest.mark.parametrize("field,value", [
+    ("privatefrom", "sender-key"),
+    ("privatefor", ["recipient-key"]),
+    ("privategroupid", "group"),
+])
+def test_private_blocks_are_not_hashed_locally(field, value):
+    blk = Block.from_dict(dict(NODE_BLOCK, **{field: value}))
+    with pytest.raises(InvalidBlock):
+        blk.compute_hash()
+    with pytest.raises(InvalidBlock):
+        hash_many([blk])
@@ -0,0 +1,61 @@
+import pytest
+
+from pyqlc.utils import crypto
+from pyqlc.utils.crypto import SignerCache, clear_signer_cache, set_signer_cache_size, sign
+from pyqlc.utils.exceptions import InvalidPrivateKey
+
+PRIVATE_KEY = "8e6bc788bbeae46f26315dd91bbbc6891278bf3bfb228aa901b39f3f1c169efb"
+MESSAGE = "6014521eb956b589013540174951ba690cde4f2d98b0fbc291f0f94ac1bbbb87"
+
+# keys the sign() of the first release rejected, all with InvalidPrivateKey
+# but "0x..." and " ...", which got as far as a binascii.Error
+INVALID_KEYS = [
+    "",
+    PRIVATE_KEY[:63],
+    PRIVATE_KEY[:-1] + "g",
+    "0x" + PRIVATE_KEY[2:],
+    " " + PRIVATE_KEY[1:],
+    PRIVATE_KEY[:32] + "-" + PRIVATE_KEY[33:] + PRIVATE_KEY,
+    PRIVATE_KEY[:-1].encode() + b"z",
+]
+
+
+@pytest.fixture(params=[crypto.SIGNER_CACHE_SIZE, 0], ids=["cached", "uncached"])
+def cache_size(request):
+    set_signer_cache_size(request.param)
+    yield request.param
+    set_signer_cache_size(crypto.SIGNER_CACHE_SIZE)
+    clear_signer_cache()
+
+
+@pytest.mark.parametrize("private_key", INVALID_KEYS)
+def test_sign_rejects_invalid_keys(cache_size, private_key):
+    with pytest.raises(InvalidPrivateKey):
+        sign(MESSAGE, private_key)
+
+
+def test_sign_with_and_without_cache(cache_size):
+    signature = sign(MESSAGE, PRIVATE_KEY)
+    assert sign(MESSAGE, PRIVATE_KEY.upper()) == signature
+    assert len(crypto._signers) == (1 if cache_size else 0)
+
+
+def test_evicted_and_cleared_signers_are_wiped():
+    cache = SignerCache(max_entries=1)
+    first = cache.get(PRIVATE_KEY)
+    second = cache.get("11" * 32)
+    assert first.wiped and not second.wiped
+
+    cache.clear()
+    assert second.wiped and len(cache) == 0
+
+
+def test_resize_wipes_signers_beyond_the_new_size():
+    cache = SignerCache(max_entries=2)
+    first, second = cache.get(PRIVATE_KEY), cache.get("11" * 32)
+    cache.resize(1)
+    assert first.wiped and not second.wiped
+    cache.resize(0)
+    assert second.wiped and len(cache) == 0
+    assert cache.sign(PRIVATE_KEY, MESSAGE) == sign(MESSAGE, PRIVATE_KEY)
+    assert len(cache) == 0
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from pyqlc.client import Client
+
+
+def test_subscriptions_cant_be_batched():
+    qlc = Client("http://127.0.0.1:9735")
+    with pytest.raises(TypeError, match="can't be batched"):
+        with qlc.batch() as b:
+            b.Pub_Sub.newPovBlock(callback=print)
+
+
+def test_subscriptions_cant_be_batched_async():
+    pytest.importorskip("aiohttp")
+    from pyqlc.async_client import AsyncClient
+
+    async def subscribe():
+        qlc = AsyncClient("http://127.0.0.1:9735")
+        try:
+            async with qlc.batch() as b:
+                b.Pub_Sub.newPovBlock()
+        finally:
+            await qlc.close()
+
+    with pytest.raises(TypeError, match="can't be batched"):
+        asyncio.run(subscribe())